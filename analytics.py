@@ -0,0 +1,322 @@
+"""Аналітика записаних ігор (gamelog) фрагментами на кількох ядрах.
+
+Журнали ходів читаються через mmap фрагментами по chunk_size записів;
+кожен фрагмент обробляється векторизовано в ProcessPoolExecutor і
+повертає лише агрегати, тож пам'ять залежить від розміру фрагмента, а
+не від обсягу даних. Звіт містить:
+  - перемоги за номером спроби, поразки (MAX_ATTEMPTS невдалих спроб,
+    зокрема пропущених через тайм-аут) та виходи, як їх записує play_game();
+  - розподіл перших здогадок (спроби, пропущені до неї, не враховуються);
+  - частку здогадок поза межами, відомими з попередніх підказок;
+  - частку перемог за періодами (сесії нумеруються в порядку початку,
+    тож період - це period послідовних ідентифікаторів сесій).
+
+Сесія може продовжуватися в наступних фрагментах. Фрагмент повертає
+межі сесій, відкритих на його кінці, та ходи сесій, що почались раніше
+(їх не більше, ніж одночасних сесій), а злиття фрагментів одного файлу
+в порядку запису доповнює ними підрахунок здогадок поза межами та перших
+здогадок сесій, що почались пропущеними спробами.
+
+Запуск: python analytics.py games.log [more.log ...] --workers 8
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from engine import TOO_BIG, TOO_SMALL
+from gamelog import (
+    OUTCOME_EXIT, OUTCOME_LOSS, OUTCOME_MISS, OUTCOME_SKIP, OUTCOME_SKIP_LOSS, OUTCOME_WIN,
+    GameLogReader,
+)
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+DEFAULT_PERIOD = 10_000
+DEFAULT_TOP = 10
+# Відсутня межа: жодна здогадка i64 не виходить за неї
+NO_LOW = np.iinfo(np.int64).min
+NO_HIGH = np.iinfo(np.int64).max
+
+
+class Partial:
+    """Агрегати частини журналу; merge() підсумовує частини"""
+
+    __slots__ = ('wins_by_attempt', 'losses', 'exits', 'guesses', 'skips', 'out_of_bounds',
+                 'first_guesses', 'periods')
+
+    def __init__(self):
+        # wins_by_attempt[k] - перемоги на k-й спробі
+        self.wins_by_attempt = np.zeros(1, dtype=np.int64)
+        self.losses = 0
+        self.exits = 0
+        self.guesses = 0
+        # спроби, пропущені через тайм-аут відповіді
+        self.skips = 0
+        self.out_of_bounds = 0
+        # здогадка -> кількість ігор, що почались з неї
+        self.first_guesses = {}
+        # період -> [ігор, перемог]
+        self.periods = {}
+
+    @property
+    def wins(self):
+        return int(self.wins_by_attempt.sum())
+
+    @property
+    def games(self):
+        return self.wins + self.losses + self.exits
+
+    def merge(self, other):
+        """Додає агрегати іншої частини"""
+        size = max(len(self.wins_by_attempt), len(other.wins_by_attempt))
+        wins = np.zeros(size, dtype=np.int64)
+        wins[:len(self.wins_by_attempt)] += self.wins_by_attempt
+        wins[:len(other.wins_by_attempt)] += other.wins_by_attempt
+        self.wins_by_attempt = wins
+        self.losses += other.losses
+        self.exits += other.exits
+        self.guesses += other.guesses
+        self.skips += other.skips
+        self.out_of_bounds += other.out_of_bounds
+        for value, count in other.first_guesses.items():
+            self.first_guesses[value] = self.first_guesses.get(value, 0) + count
+        for period, (games, won) in other.periods.items():
+            totals = self.periods.setdefault(period, [0, 0])
+            totals[0] += games
+            totals[1] += won
+        return self
+
+    def report(self, period=DEFAULT_PERIOD, top=DEFAULT_TOP):
+        """Повертає звіт-словник (придатний для JSON)"""
+        games = self.games
+        first = sorted(self.first_guesses.items(), key=lambda item: (-item[1], item[0]))
+        return {
+            'games': games,
+            'wins': self.wins,
+            'losses': self.losses,
+            'exits': self.exits,
+            'win_rate': self.wins / games if games else 0.0,
+            'wins_by_attempt': {attempt: int(count) for attempt, count
+                                in enumerate(self.wins_by_attempt.tolist()) if count},
+            'win_rate_by_attempt': {attempt: count / games for attempt, count
+                                    in enumerate(self.wins_by_attempt.tolist()) if count},
+            'guesses': self.guesses,
+            'skips': self.skips,
+            'out_of_bounds': self.out_of_bounds,
+            'out_of_bounds_rate': self.out_of_bounds / self.guesses if self.guesses else 0.0,
+            'first_guesses': [{'guess': value, 'games': count} for value, count in first[:top]],
+            'periods': [{'first_session': index * period, 'games': games,
+                         'win_rate': won / games}
+                        for index, (games, won) in sorted(self.periods.items())],
+        }
+
+
+class ChunkResult(NamedTuple):
+    """Результат фрагмента журналу.
+
+    pending - (session, guess, low, high) ходів сесій, що почались до
+    фрагмента, з межами лише з цього фрагмента; open - (session, low, high)
+    сесій, відкритих на кінці фрагмента; closed - сесії, що почались до
+    фрагмента і завершились у ньому.
+    """
+    partial: Partial
+    pending: tuple
+    open: tuple
+    closed: np.ndarray
+
+
+def _group_running_max(values, present, group, width):
+    """Включний поточний максимум values[present] у межах груп.
+
+    Значення замінюються рангами (0 - відсутнє), а ключ group * width + ранг
+    робить один np.maximum.accumulate на весь фрагмент: максимум попередніх
+    груп завжди менший за будь-який ключ поточної. Повертає (ранги, унікальні).
+    """
+    unique, inverse = np.unique(values[present], return_inverse=True)
+    ranks = np.zeros(len(values), dtype=np.int64)
+    ranks[present] = inverse + 1
+    base = group * width
+    running = np.maximum.accumulate(base + ranks) - base
+    return running, unique
+
+
+def _bounds(running, unique, missing):
+    """Перетворює ранги _group_running_max на межі (missing, якщо межі немає)"""
+    table = np.concatenate((np.array([missing], dtype=np.int64), unique.astype(np.int64)))
+    return table[running]
+
+
+def chunk_result(records, period=DEFAULT_PERIOD):
+    """Векторизовано обробляє масив записів RECORD_DTYPE"""
+    session = records['session'].astype(np.int64)
+    guess = records['guess']
+    attempt = records['attempt']
+    hint = records['hint']
+    outcome = records['outcome']
+
+    partial = Partial()
+    won = outcome == OUTCOME_WIN
+    exited = outcome == OUTCOME_EXIT
+    skipped = (outcome == OUTCOME_SKIP) | (outcome == OUTCOME_SKIP_LOSS)
+    finished = (outcome != OUTCOME_MISS) & (outcome != OUTCOME_SKIP)
+    is_guess = ~exited & ~skipped
+    partial.wins_by_attempt = np.bincount(attempt[won], minlength=1).astype(np.int64)
+    partial.losses = int(np.count_nonzero((outcome == OUTCOME_LOSS)
+                                          | (outcome == OUTCOME_SKIP_LOSS)))
+    partial.exits = int(np.count_nonzero(exited))
+    partial.guesses = int(np.count_nonzero(is_guess))
+    partial.skips = int(np.count_nonzero(skipped))
+
+    periods, inverse = np.unique(session[finished] // period, return_inverse=True)
+    games = np.bincount(inverse, minlength=len(periods))
+    wins = np.bincount(inverse, weights=won[finished], minlength=len(periods))
+    partial.periods = {index: [count, int(won_count)] for index, count, won_count
+                       in zip(periods.tolist(), games.tolist(), wins.tolist())}
+
+    # Сесії, що почались у попередніх фрагментах (спроба 1 - здогадка,
+    # пропуск або вихід)
+    continuing = np.setdiff1d(session[attempt > 1], session[attempt == 1])
+    closed = np.intersect1d(continuing, session[finished])
+
+    # Здогадки, впорядковані за сесією та спробою
+    order = np.lexsort((attempt[is_guess], session[is_guess]))
+    sessions = session[is_guess][order]
+    guesses = guess[is_guess][order]
+    hints = hint[is_guess][order]
+    outcomes = outcome[is_guess][order]
+    count = len(sessions)
+    empty = np.zeros(0, dtype=np.int64)
+    if not count:
+        return ChunkResult(partial, (empty,) * 4, (empty,) * 3, closed)
+
+    new_group = np.ones(count, dtype=bool)
+    new_group[1:] = sessions[1:] != sessions[:-1]
+    group = np.cumsum(new_group) - 1
+    width = count + 1
+
+    # Перша здогадка сесії, що почалась у цьому фрагменті, навіть після пропусків;
+    # для сесій з попередніх фрагментів її визначає merge_file()
+    values, counts = np.unique(guesses[new_group & ~np.isin(sessions, continuing)],
+                               return_counts=True)
+    partial.first_guesses = dict(zip(values.tolist(), counts.tolist()))
+
+    # Межі після кожного ходу (включно) та перед ним (з попереднього ходу групи)
+    low_running, low_unique = _group_running_max(guesses + 1, hints == TOO_SMALL, group, width)
+    high_running, high_unique = _group_running_max(-(guesses - 1), hints == TOO_BIG,
+                                                   group, width)
+    low_after = _bounds(low_running, low_unique, NO_LOW)
+    high_after = -_bounds(high_running, high_unique, -NO_HIGH)
+    low_before = np.empty(count, dtype=np.int64)
+    high_before = np.empty(count, dtype=np.int64)
+    low_before[0], high_before[0] = NO_LOW, NO_HIGH
+    low_before[1:], high_before[1:] = low_after[:-1], high_after[:-1]
+    low_before[new_group] = NO_LOW
+    high_before[new_group] = NO_HIGH
+
+    outside = (guesses < low_before) | (guesses > high_before)
+    partial.out_of_bounds = int(np.count_nonzero(outside))
+
+    unresolved = np.isin(sessions, continuing) & ~outside
+    pending = (sessions[unresolved], guesses[unresolved].astype(np.int64),
+               low_before[unresolved], high_before[unresolved])
+
+    last = np.ones(count, dtype=bool)
+    last[:-1] = new_group[1:]
+    still_open = (last & (outcomes == OUTCOME_MISS)
+                  & ~np.isin(sessions, session[finished & ~is_guess]))
+    open_sessions = (sessions[still_open], low_after[still_open], high_after[still_open])
+    return ChunkResult(partial, pending, open_sessions, closed)
+
+
+def analyze_chunk(path, start, stop, period=DEFAULT_PERIOD):
+    """Обробляє записи start..stop журналу path"""
+    with GameLogReader(path) as log:
+        return chunk_result(log.records[start:stop], period)
+
+
+def _analyze_chunk_args(args):
+    return analyze_chunk(*args)
+
+
+def merge_file(results):
+    """Зливає результати фрагментів одного файлу в порядку запису"""
+    total = Partial()
+    first_guesses = total.first_guesses
+    carry = {}
+    for result in results:
+        total.merge(result.partial)
+        started = set()
+        for session, guess, low, high in zip(*(column.tolist() for column in result.pending)):
+            known = carry.get(session)
+            if known:
+                low, high = max(low, known[0]), min(high, known[1])
+            elif session not in started:
+                # Сесія без здогадок у попередніх фрагментах (лише пропуски)
+                started.add(session)
+                first_guesses[guess] = first_guesses.get(guess, 0) + 1
+            if guess < low or guess > high:
+                total.out_of_bounds += 1
+        for session in result.closed.tolist():
+            carry.pop(session, None)
+        for session, low, high in zip(*(column.tolist() for column in result.open)):
+            known = carry.get(session)
+            if known:
+                low, high = max(low, known[0]), min(high, known[1])
+            carry[session] = (low, high)
+    return total
+
+
+def analyze(paths, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, period=DEFAULT_PERIOD):
+    """Аналізує журнали paths та повертає сумарний Partial"""
+    if chunk_size < 1 or period < 1:
+        raise ValueError("Розмір фрагмента та період мають бути додатними")
+
+    tasks = []
+    for path in paths:
+        with GameLogReader(path) as log:
+            records = len(log)
+        tasks.append([(path, start, min(start + chunk_size, records), period)
+                      for start in range(0, records, chunk_size)])
+    workers = workers or os.cpu_count() or 1
+    chunks = [task for file_tasks in tasks for task in file_tasks]
+
+    total = Partial()
+    if workers == 1 or len(chunks) <= 1:
+        results = map(_analyze_chunk_args, chunks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        batch = max(1, len(chunks) // (workers * 4))
+        results = executor.map(_analyze_chunk_args, chunks, chunksize=batch)
+    try:
+        for file_tasks in tasks:
+            file_results = (next(results) for _ in file_tasks)
+            total.merge(merge_file(file_results))
+    finally:
+        if executor:
+            executor.shutdown()
+    return total
+
+
+def main(argv=None):
+    """Точка входу командного рядка"""
+    parser = argparse.ArgumentParser(description="Аналітика записаних ігор 'Вгадай число'")
+    parser.add_argument('paths', nargs='+', help="файли журналу ходів (--log)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--period', type=int, default=DEFAULT_PERIOD,
+                        help="кількість послідовних сесій в одному періоді")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP,
+                        help="скільки найчастіших перших здогадок показати")
+    args = parser.parse_args(argv)
+
+    total = analyze(args.paths, args.workers, args.chunk_size, args.period)
+    print(json.dumps(total.report(args.period, args.top), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Векторизований симулятор великої кількості ігор на NumPy.
+
+Кожна гра з пакету просувається на одну спробу за ітерацію: порівняння,
+знак підказки, оновлення меж та маска завершених ігор виконуються як
+операції над масивами. Правила ті самі, що й у engine.GuessEngine.
+"""
+
+import numpy as np
+
+from main import MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS
+
+
+def binary_search(low, high, attempt):
+    """Стратегія бінарного пошуку: середина відомих меж"""
+    guesses = np.add(low, high)
+    guesses >>= 1
+    return guesses
+
+
+def make_random_strategy(rng):
+    """Створює стратегію випадкової здогадки в межах відомого діапазону"""
+
+    def random_guess(low, high, attempt):
+        return rng.integers(low, high, endpoint=True)
+
+    return random_guess
+
+
+def draw_targets(count, rng, min_number=MIN_NUMBER, max_number=MAX_NUMBER):
+    """Генерує масив загаданих чисел у діапазоні min_number..max_number"""
+    return rng.integers(min_number, max_number, size=count, endpoint=True,
+                        dtype=np.int64)
+
+
+def simulate_batch(targets, strategy=binary_search, min_number=MIN_NUMBER,
+                   max_number=MAX_NUMBER, max_attempts=MAX_ATTEMPTS):
+    """Грає всі ігри пакету одночасно.
+
+    strategy(low, high, attempt) отримує масиви поточних меж усіх ігор і
+    повертає масив здогадок того ж розміру. Повертає пару масивів
+    (won, attempts): ознаку перемоги та кількість використаних спроб.
+    """
+    # Найменший знаковий тип, у якому поміщаються сума меж та їх різниця
+    dtype = np.promote_types(np.int16, np.result_type(
+        np.min_scalar_type(2 * min_number - 1),
+        np.min_scalar_type(2 * max_number + 1),
+        np.min_scalar_type(max_number - min_number + 2)))
+    targets = np.asarray(targets)
+    if targets.size and (targets.min() < min_number or targets.max() > max_number):
+        raise ValueError(f"Загадані числа мають бути від {min_number} до {max_number}")
+    targets = targets.astype(dtype, copy=False)
+
+    count = targets.size
+    low = np.full(count, min_number, dtype=dtype)
+    high = np.full(count, max_number, dtype=dtype)
+    won = np.zeros(count, dtype=bool)
+    attempts = np.zeros(count, dtype=np.min_scalar_type(max_attempts))
+    active = np.ones(count, dtype=bool)
+    too_small = np.empty(count, dtype=bool)
+    too_big = np.empty(count, dtype=bool)
+    delta = np.empty(count, dtype=dtype)
+
+    for attempt in range(1, max_attempts + 1):
+        guesses = np.asarray(strategy(low, high, attempt)).astype(dtype, copy=False)
+        np.clip(guesses, min_number, max_number, out=guesses)
+        attempts += active
+
+        np.less(guesses, targets, out=too_small)
+        too_small &= active
+        np.greater(guesses, targets, out=too_big)
+        too_big &= active
+
+        # Вгадано: активні ігри без підказки завершуються перемогою
+        hit = active ^ too_small
+        hit ^= too_big
+        won |= hit
+        active ^= hit
+        if not active.any():
+            break
+
+        # Межі звужуються арифметично: маскові операції (where=) на
+        # випадкових масках у рази повільніші за множення на маску.
+        # Замало: low = max(low, guess + 1)
+        np.subtract(guesses, low, out=delta)
+        delta += 1
+        np.maximum(delta, 0, out=delta)
+        delta *= too_small
+        low += delta
+        # Забагато: high = min(high, guess - 1)
+        np.subtract(high, guesses, out=delta)
+        delta += 1
+        np.maximum(delta, 0, out=delta)
+        delta *= too_big
+        high -= delta
+
+    return won, attempts
@@ -0,0 +1,79 @@
+"""Порівняння кількості записів у stdout за одну гру.
+
+Рахує записані байти, виклики write() та flush() для виграшної гри
+(бінарний пошук, 7 спроб) у двох режимах:
+  * print - кожне повідомлення окремим print() (як до буферизації);
+  * buffered - буферизована консоль main.py (один запис на хід).
+line_writes - записи з символом нового рядка: у терміналі (построковий
+буфер) кожен з них стає окремим системним викликом. У каналі (pipe)
+системний виклик відбувається на кожен flush().
+
+Запуск: python benchmarks/output_writes.py
+"""
+
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from fakes import FixedRandom  # noqa: E402
+
+TARGET = 73
+GUESSES = ['50', '75', '62', '69', '72', '74', '73']
+
+
+class CountingStream(io.TextIOBase):
+    """Потік, що рахує записи, скидання та байти"""
+
+    def __init__(self):
+        self.writes = 0
+        self.line_writes = 0
+        self.flushes = 0
+        self.bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self.writes += 1
+        self.line_writes += '\n' in text
+        self.bytes += len(text.encode())
+        return len(text)
+
+    def flush(self):
+        self.flushes += 1
+
+
+def measure(use_print):
+    """Грає одну гру та повертає лічильники потоку"""
+    answers = iter(GUESSES)
+
+    def reader(prompt=''):
+        # Так само як input(): запрошення записується в stdout та скидається
+        if not use_print:
+            main.flush_console()
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        return next(answers)
+
+    stream = CountingStream()
+    stdout, sys.stdout = sys.stdout, stream
+    try:
+        main.play_game(reader, print if use_print else None, FixedRandom(TARGET))
+    finally:
+        sys.stdout = stdout
+
+    return {'bytes': stream.bytes, 'writes': stream.writes,
+            'line_writes': stream.line_writes, 'flushes': stream.flushes}
+
+
+def run():
+    """Повертає результати для обох режимів"""
+    return {'print': measure(True), 'buffered': measure(False)}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
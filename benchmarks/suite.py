@@ -0,0 +1,238 @@
+"""Набір бенчмарків гри з базовими результатами та перевіркою регресій.
+
+Кожен випадок вимірюється perf_counter_ns після прогріву, у кількох
+повтореннях; звіт містить перцентилі часу однієї операції в наносекундах.
+Результати можна зберегти як базові (--save) і порівнювати з ними
+наступні запуски: якщо p50 випадку перевищує базовий більш ніж на
+margin (частка), запуск завершується з кодом 1.
+
+Запуск:
+  python benchmarks/suite.py --save benchmarks/baseline.json
+  python benchmarks/suite.py --baseline benchmarks/baseline.json --margin 0.25
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GuessEngine  # noqa: E402
+from fakes import FixedRandom  # noqa: E402
+from main import (  # noqa: E402
+    DEFAULT_CONFIG, EXIT_COMMANDS, MAX_ATTEMPTS, MAX_NUMBER, MIN_NUMBER,
+    get_player_guess, play_game, stream_io, win_message, attempt_message,
+)
+
+PERCENTILES = (50, 90, 99)
+DEFAULT_MARGIN = 0.25
+
+
+def percentile(sorted_values, q):
+    """Перцентиль q (0-100) відсортованого списку методом найближчого рангу"""
+    if not sorted_values:
+        return 0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(q * len(sorted_values) / 100) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples_ns, **extra):
+    """Зводить вибірку часів (нс на операцію) у словник звіту"""
+    samples = sorted(samples_ns)
+    report = {'samples': len(samples), 'min_ns': samples[0]}
+    for q in PERCENTILES:
+        report[f'p{q}_ns'] = percentile(samples, q)
+    report.update(extra)
+    return report
+
+
+def measure(func, number=1000, repeats=30, warmup=3):
+    """Вимірює func(): repeats вибірок, кожна - середнє з number викликів"""
+    for _ in range(warmup):
+        for _ in range(number):
+            func()
+
+    clock = time.perf_counter_ns
+    samples = []
+    for _ in range(repeats):
+        start = clock()
+        for _ in range(number):
+            func()
+        samples.append((clock() - start) / number)
+    return summarize(samples)
+
+
+# === ВИПАДКИ ===
+
+def bench_engine_guess(scale):
+    """Повна гра бінарним пошуком на GuessEngine без вводу/виводу"""
+
+    def run():
+        session = GuessEngine(73, MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS)
+        low, high = MIN_NUMBER, MAX_NUMBER
+        while not session.finished:
+            guess = (low + high) // 2
+            if session.guess(guess) < 0:
+                low = guess + 1
+            else:
+                high = guess - 1
+
+    return measure(run, number=200 * scale)
+
+
+def bench_input_parsing(scale):
+    """get_player_guess() з in-memory reader/writer та змішаним введенням"""
+    inputs = ['abc', '', '150', '-3', ' 42 ', '12.5', '٥٠', 'x' * 10_000, '50']
+    sink = [].append
+
+    def run():
+        answers = iter(inputs)
+        get_player_guess(1, MAX_ATTEMPTS, lambda prompt: next(answers), sink)
+
+    return measure(run, number=100 * scale)
+
+
+def bench_parse_guess(scale):
+    """Розбір одного рядка через GameConfig.parse_guess"""
+    parse = DEFAULT_CONFIG.parse_guess
+
+    def run():
+        parse('57', EXIT_COMMANDS)
+
+    return measure(run, number=2000 * scale)
+
+
+def bench_render(scale):
+    """Рендеринг заголовків спроб та повідомлення про перемогу"""
+
+    def run():
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            attempt_message(attempt, MAX_ATTEMPTS)
+        win_message(73, 7)
+
+    return measure(run, number=500 * scale)
+
+
+def _session_io():
+    guesses = "50\n75\n62\n69\n72\n74\n73\n"
+    return stream_io(io.StringIO(guesses), io.StringIO())
+
+
+def bench_full_session(scale):
+    """Повна консольна гра (7 спроб) через stream_io; також пік пам'яті"""
+    rng = FixedRandom(73)
+
+    def run():
+        reader, writer = _session_io()
+        play_game(reader, writer, rng)
+
+    report = measure(run, number=20 * scale)
+
+    tracemalloc.start()
+    for _ in range(100):
+        run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    report['peak_bytes'] = peak
+    return report
+
+
+def bench_server_round_trip(scale):
+    """Затримка одного ходу (запит-відповідь) TCP-сервера на localhost"""
+    from server import start_server
+
+    rounds = 200 * scale
+
+    async def scenario():
+        server = await start_server('127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            await reader.readuntil(b': \n')
+            clock = time.perf_counter_ns
+            samples = []
+            for index in range(rounds + 20):
+                start = clock()
+                writer.write(b'abc\n')  # некоректне введення не витрачає спроб
+                await reader.readuntil(b': \n')
+                if index >= 20:  # перші ходи - прогрів
+                    samples.append(clock() - start)
+            writer.close()
+            await writer.wait_closed()
+            # Даємо обробнику з'єднання завершитись до закриття циклу подій
+            await asyncio.sleep(0.01)
+        return samples
+
+    return summarize(asyncio.run(scenario()))
+
+
+BENCHMARKS = {
+    'engine_guess': bench_engine_guess,
+    'parse_guess': bench_parse_guess,
+    'input_parsing': bench_input_parsing,
+    'render': bench_render,
+    'full_session': bench_full_session,
+    'server_round_trip': bench_server_round_trip,
+}
+
+
+def run_benchmarks(names=None, scale=1):
+    """Запускає вибрані випадки та повертає словник звітів"""
+    return {name: BENCHMARKS[name](scale) for name in (names or BENCHMARKS)}
+
+
+def find_regressions(results, baseline, margin=DEFAULT_MARGIN):
+    """Повертає список описів регресій відносно базових результатів"""
+    regressions = []
+    for name, report in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in ('p50_ns', 'peak_bytes'):
+            if metric in report and metric in base and base[metric] > 0:
+                ratio = report[metric] / base[metric]
+                if ratio > 1 + margin:
+                    regressions.append(f"{name}.{metric}: {report[metric]:.0f} проти "
+                                       f"{base[metric]:.0f} (x{ratio:.2f})")
+    return regressions
+
+
+def main(argv=None):
+    """Точка входу командного рядка"""
+    parser = argparse.ArgumentParser(description="Бенчмарки гри 'Вгадай число'")
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help=f"випадки для запуску: {', '.join(BENCHMARKS)} (за замовчуванням - усі)")
+    parser.add_argument('--scale', type=int, default=1, help="множник кількості ітерацій")
+    parser.add_argument('--save', help="зберегти результати як базові у JSON")
+    parser.add_argument('--baseline', help="порівняти з базовими результатами з JSON")
+    parser.add_argument('--margin', type=float, default=DEFAULT_MARGIN,
+                        help="допустиме погіршення (частка), за замовчуванням 0.25")
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"невідомі випадки: {', '.join(sorted(unknown))}")
+
+    results = run_benchmarks(args.names, args.scale)
+    print(json.dumps(results, indent=2))
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            regressions = find_regressions(results, json.load(file), args.margin)
+        for regression in regressions:
+            print(f"❌ Регресія: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
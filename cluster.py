@@ -0,0 +1,116 @@
+"""Багатопроцесний режим сервера: N обробників на одному порту.
+
+Кожен процес-обробник запускає власний цикл подій server.serve() на
+сокеті з SO_REUSEPORT, тож ядро розподіляє нові з'єднання між
+процесами без спільного прийому та без GIL-конкуренції. З'єднання в
+цьому протоколі і є сесією, тому стан гри (GuessEngine) живе в
+процесі, що прийняв з'єднання, до кінця сесії.
+
+Supervisor стежить за обробниками, перезапускає тих, що завершились
+аварійно, і при SIGTERM/SIGINT надсилає їм SIGTERM: обробник перестає
+приймати з'єднання та дограє активні сесії (server.drain).
+
+Запуск: python server.py --workers 4 --port 8765
+"""
+
+import asyncio
+import multiprocessing
+import signal
+import socket
+from multiprocessing.connection import wait
+
+from server import DEFAULT_DRAIN_TIMEOUT, DEFAULT_HOST, DEFAULT_PORT, serve
+
+# Запас часу понад drain_timeout, після якого обробник вбивається
+KILL_GRACE = 5.0
+CHECK_INTERVAL = 0.5
+
+
+def run_worker(host, port, seed, worker, drain_timeout, **options):
+    """Точка входу процесу-обробника; options - додаткові аргументи start_server()"""
+    asyncio.run(serve(host, port, seed, drain_timeout, reuse_port=True, worker=worker,
+                      **options))
+
+
+def reserve_port(host, port):
+    """Прив'язує (без прослуховування) сокет SO_REUSEPORT, щоб зафіксувати порт.
+
+    Потрібно для port=0: всі обробники мають слухати той самий вільний порт.
+    """
+    sock = socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+class Supervisor:
+    """Запускає та перезапускає процеси-обробники сервера"""
+
+    def __init__(self, workers, host=DEFAULT_HOST, port=DEFAULT_PORT, seed=None,
+                 drain_timeout=DEFAULT_DRAIN_TIMEOUT, **options):
+        if workers < 1:
+            raise ValueError(f"Кількість обробників має бути додатною: {workers}")
+        self.workers = [None] * workers
+        self.host = host
+        self.port = port
+        self.seed = seed
+        self.drain_timeout = drain_timeout
+        # Додаткові аргументи start_server() обробників (attempt_timeout тощо)
+        self.options = options
+        self.restarts = 0
+        self._stopping = False
+        self._reserved = None
+
+    def _spawn(self, index):
+        process = multiprocessing.Process(
+            target=run_worker, name=f"guess-worker-{index}", daemon=True,
+            args=(self.host, self.port, self.seed, index, self.drain_timeout),
+            kwargs=self.options)
+        process.start()
+        self.workers[index] = process
+
+    def start(self):
+        """Фіксує порт і запускає всіх обробників"""
+        self._reserved = reserve_port(self.host, self.port)
+        self.port = self._reserved.getsockname()[1]
+        for index in range(len(self.workers)):
+            self._spawn(index)
+
+    def check(self, timeout=0):
+        """Чекає до timeout секунд на завершення обробників і перезапускає їх"""
+        sentinels = {process.sentinel: index for index, process in enumerate(self.workers)}
+        for sentinel in wait(list(sentinels), timeout):
+            index = sentinels[sentinel]
+            self.workers[index].join()
+            if not self._stopping:
+                self.restarts += 1
+                self._spawn(index)
+
+    def stop(self):
+        """Плавна зупинка: SIGTERM обробникам, очікування, за потреби SIGKILL"""
+        self._stopping = True
+        for process in self.workers:
+            if process.is_alive():
+                process.terminate()
+        for process in self.workers:
+            process.join(self.drain_timeout + KILL_GRACE)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        if self._reserved:
+            self._reserved.close()
+            self._reserved = None
+
+    def run(self):
+        """Запускає обробників і стежить за ними до SIGTERM/SIGINT"""
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._request_stop)
+        self.start()
+        try:
+            while not self._stopping:
+                self.check(CHECK_INTERVAL)
+        finally:
+            self.stop()
+
+    def _request_stop(self, signum, frame):
+        self._stopping = True
@@ -0,0 +1,123 @@
+"""Введення з дедлайнами відповіді та сесії на основі selectors.
+
+DeadlineReader - reader(prompt) для main() поверх файлового дескриптора
+(stdin, канал, сокет). Рядок очікується через selectors.DefaultSelector,
+тож потік ніколи не блокується довше за найближчий дедлайн:
+  attempt_timeout - секунд на одну відповідь;
+  session_timeout - секунд на всю сесію гравця (від створення reader).
+Після тайм-ауту reader кидає main.InputTimeout: пропущена відповідь на
+запрошення числа коштує спробу, вичерпаний час сесії (або мовчання на
+запиті повтору) завершує main(), після чого close() звільняє дескриптор
+селектора.
+
+Багато сесій в одному потоці обслуговує server.py: цикл подій asyncio
+також побудований на selectors, а Connection.read_line застосовує ті
+самі дедлайни (next_timeout) без окремого потоку на кожне запрошення.
+
+На Windows selectors не працює з консольним stdin, лише із сокетами.
+"""
+
+import os
+import selectors
+import sys
+import time
+
+from main import InputTimeout, flush_console
+
+# Довші рядки відкидаються до кінця рядка і повертаються як ''
+MAX_LINE_LENGTH = 1024
+READ_SIZE = 65536
+
+
+def next_timeout(attempt_timeout, deadline, now):
+    """Повертає (секунд до найближчого дедлайну або None, чи це дедлайн сесії)"""
+    if deadline is None:
+        return attempt_timeout, False
+    left = deadline - now
+    if attempt_timeout is None or left <= attempt_timeout:
+        return left, True
+    return attempt_timeout, False
+
+
+class DeadlineReader:
+    """reader(prompt) з тайм-аутами, що не тримає потік довше за дедлайн"""
+
+    __slots__ = ('fd', 'out', 'attempt_timeout', 'deadline', 'clock', 'max_line',
+                 '_selector', '_buffer', '_discarding', '_eof')
+
+    def __init__(self, source, out=None, attempt_timeout=None, session_timeout=None,
+                 clock=time.monotonic, max_line=MAX_LINE_LENGTH):
+        self.fd = source if isinstance(source, int) else source.fileno()
+        self.out = out or sys.stdout
+        self.attempt_timeout = attempt_timeout
+        self.deadline = None if session_timeout is None else clock() + session_timeout
+        self.clock = clock
+        self.max_line = max_line
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.fd, selectors.EVENT_READ)
+        self._buffer = bytearray()
+        self._discarding = False
+        self._eof = False
+
+    def __call__(self, prompt=''):
+        """Виводить запрошення та повертає рядок без символу нового рядка.
+
+        Кидає InputTimeout, якщо рядок не надійшов до дедлайну, та EOFError,
+        якщо джерело закрито.
+        """
+        flush_console()
+        self.out.write(prompt)
+        self.out.flush()
+
+        attempt_deadline = None
+        if self.attempt_timeout is not None:
+            attempt_deadline = self.clock() + self.attempt_timeout
+        while True:
+            line = self._take_line()
+            if line is not None:
+                return line
+            if self._eof:
+                raise EOFError
+
+            now = self.clock()
+            timeout, session_expired = next_timeout(
+                None if attempt_deadline is None else attempt_deadline - now, self.deadline, now)
+            if timeout is not None and timeout <= 0:
+                raise InputTimeout(session_expired)
+            if self._selector.select(timeout):
+                self._fill()
+
+    def _fill(self):
+        chunk = os.read(self.fd, READ_SIZE)
+        if not chunk:
+            self._eof = True
+            # Останній рядок без символу нового рядка теж є відповіддю
+            if self._buffer and not self._discarding:
+                self._buffer += b'\n'
+            return
+        self._buffer += chunk
+
+    def _take_line(self):
+        end = self._buffer.find(b'\n')
+        if end < 0:
+            if len(self._buffer) > self.max_line:
+                # Обмежуємо пам'ять: хвіст надто довгого рядка не зберігаємо
+                self._discarding = True
+                self._buffer.clear()
+            return None
+        line = self._buffer[:end]
+        del self._buffer[:end + 1]
+        if self._discarding or len(line) > self.max_line:
+            self._discarding = False
+            return ''
+        return line.decode(errors='replace').rstrip('\r')
+
+    def close(self):
+        """Звільняє селектор (сам дескриптор належить викликачу)"""
+        self._selector.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
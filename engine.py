@@ -0,0 +1,229 @@
+"""Рушій гри 'Вгадай число' без вводу/виводу.
+
+Модуль містить лише правила гри: порівняння здогадки з загаданим числом,
+облік спроб та звуження відомих меж. Консольна гра з main.py, симуляції
+та сервери будуються поверх нього.
+"""
+
+import unicodedata
+
+# === РЕЗУЛЬТАТИ ЗДОГАДКИ ===
+TOO_SMALL = -1
+CORRECT = 0
+TOO_BIG = 1
+
+# === РЕЗУЛЬТАТИ РОЗБОРУ ВВЕДЕННЯ ===
+GUESS_OK = 'ok'
+GUESS_EXIT = 'exit'
+GUESS_INVALID = 'invalid'
+GUESS_OUT_OF_RANGE = 'out_of_range'
+
+
+def hint(guess, target):
+    """Повертає знак підказки: -1 (замало), 0 (вгадано) або 1 (забагато)"""
+    return (guess > target) - (guess < target)
+
+
+# Запас для пробілів, нулів на початку та роздільників "_" понад цифри меж
+INPUT_SLACK = 16
+# Пробільні символи, які відкидає int(): str.isspace() без \x1c-\x1f
+# (пробілів після U+3000 у Unicode немає)
+INT_WHITESPACE = ''.join(chr(code) for code in range(0x3001)
+                         if chr(code).isspace() and not 0x1c <= code <= 0x1f)
+# Нулі всіх десяткових систем письма (цифр Nd після U+1FFFF у Unicode немає)
+ZERO_DIGITS = ''.join(chr(code) for code in range(0x20000)
+                      if chr(code).isdecimal() and unicodedata.decimal(chr(code)) == 0)
+
+
+def digit_count(number):
+    """Кількість десяткових цифр числа без перетворення його у рядок"""
+    number = abs(number)
+    estimate = number.bit_length() * 1233 >> 12  # ~ log10(2) * кількість бітів
+    return max(1, estimate + 1 - (number < 10 ** estimate))
+
+
+def attempts_for_range(min_number, max_number):
+    """Кількість спроб, якої досить бінарному пошуку: ceil(log2(n + 1))"""
+    return (max_number - min_number + 1).bit_length()
+
+
+def input_length_limit(min_number, max_number, exit_commands=()):
+    """Найбільша довжина введення, яку варто передавати в int()"""
+    digits = max(digit_count(min_number), digit_count(max_number))
+    longest_command = max(map(len, exit_commands), default=0)
+    return max(digits + 1 + INPUT_SLACK, longest_command)
+
+
+def _is_integer_literal(digits):
+    """Чи приймає int() рядок цифр (з роздільниками "_" між ними)"""
+    return (digits.replace('_', '').isdecimal() and digits[0] != '_'
+            and digits[-1] != '_' and '__' not in digits)
+
+
+def parse_guess(text, min_number, max_number, exit_commands, max_length=None):
+    """Розбирає рядок введення у пару (статус, число).
+
+    Рядок, довший за max_length (див. input_length_limit), спершу
+    перевіряється викликами str без циклів Python: пробіли (ті самі, що й
+    для int()), знак і цифри з роздільниками "_". Якщо значущих цифр
+    після нулів на початку більше за max_length, число напевно поза
+    межами і не передається в int(); інакше в int() іде рядок без нулів.
+    """
+    if max_length is None:
+        max_length = input_length_limit(min_number, max_number, exit_commands)
+    # Команди виходу не довші за max_length, тож довгий рядок не переводимо в нижній регістр
+    if len(text) <= max_length and text.lower() in exit_commands:
+        return GUESS_EXIT, None
+
+    if len(text) > max_length:
+        text = text.strip(INT_WHITESPACE)
+        sign = text[:1] if text[:1] in ('+', '-') else ''
+        body = text[len(sign):]
+        if not body or not _is_integer_literal(body):
+            return GUESS_INVALID, None
+        # Нулі однієї системи письма відкидаються швидше, ніж увесь набір ZERO_DIGITS
+        significant = body.lstrip(body[0] + '_') if body[0] in ZERO_DIGITS else body
+        if significant[:1] in ZERO_DIGITS:
+            significant = significant.lstrip(ZERO_DIGITS + '_')
+        if len(significant) - significant.count('_') > max_length:
+            return GUESS_OUT_OF_RANGE, None
+        text = sign + (significant or '0')
+
+    try:
+        value = int(text)
+    except ValueError:
+        return GUESS_INVALID, None
+
+    if value < min_number or value > max_number:
+        return GUESS_OUT_OF_RANGE, value
+
+    return GUESS_OK, value
+
+
+def parse_answer(text, yes_answers, no_answers):
+    """Розбирає відповідь на запит повтору: True, False або None"""
+    choice = text.lower().strip()
+    if choice in yes_answers:
+        return True
+    if choice in no_answers:
+        return False
+    return None
+
+
+class GameConfig:
+    """Налаштування гри: діапазон чисел та кількість спроб.
+
+    Якщо max_attempts не задано, він обчислюється з розміру діапазону
+    (attempts_for_range). Межі можуть бути довільно великими цілими.
+    """
+
+    __slots__ = ('min_number', 'max_number', 'max_attempts', 'max_length')
+
+    def __init__(self, min_number, max_number, max_attempts=None, exit_commands=()):
+        if min_number > max_number:
+            raise ValueError(f"Некоректний діапазон: {min_number}-{max_number}")
+        if max_attempts is None:
+            max_attempts = attempts_for_range(min_number, max_number)
+        if max_attempts < 1:
+            raise ValueError("Кількість спроб має бути додатною")
+
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+        self.max_length = input_length_limit(min_number, max_number, exit_commands)
+
+    def parse_guess(self, text, exit_commands):
+        """Розбирає введення з межами цієї конфігурації"""
+        return parse_guess(text, self.min_number, self.max_number,
+                           exit_commands, self.max_length)
+
+    def new_session(self, target):
+        """Створює сесію GuessEngine з цими налаштуваннями"""
+        return GuessEngine(target, self.min_number, self.max_number, self.max_attempts)
+
+    def __repr__(self):
+        return (f"GameConfig({self.min_number}, {self.max_number}, "
+                f"max_attempts={self.max_attempts})")
+
+
+class GuessEngine:
+    """Стан однієї ігрової сесії без жодного вводу/виводу"""
+
+    __slots__ = ('target', 'min_number', 'max_number', 'max_attempts',
+                 'attempt', 'low', 'high', 'won')
+
+    def __init__(self, target, min_number, max_number, max_attempts):
+        if not min_number <= target <= max_number:
+            raise ValueError(f"Загадане число {target} поза діапазоном "
+                             f"{min_number}-{max_number}")
+        self.target = target
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+        self.attempt = 0
+        self.low = min_number
+        self.high = max_number
+        self.won = False
+
+    @property
+    def finished(self):
+        """Чи завершено гру (перемогою або вичерпанням спроб)"""
+        return self.won or self.attempt >= self.max_attempts
+
+    @property
+    def lost(self):
+        """Чи програно гру"""
+        return not self.won and self.attempt >= self.max_attempts
+
+    @property
+    def remaining(self):
+        """Кількість спроб, що залишилась"""
+        return self.max_attempts - self.attempt
+
+    def guess(self, number):
+        """Зараховує спробу та повертає знак підказки (див. hint)"""
+        if self.finished:
+            raise RuntimeError("Гру вже завершено")
+        if number < self.min_number or number > self.max_number:
+            raise ValueError(f"Число {number} поза діапазоном "
+                             f"{self.min_number}-{self.max_number}")
+
+        self.attempt += 1
+        outcome = (number > self.target) - (number < self.target)
+
+        if outcome == CORRECT:
+            self.won = True
+        elif outcome == TOO_SMALL:
+            if number >= self.low:
+                self.low = number + 1
+        elif number <= self.high:
+            self.high = number - 1
+
+        return outcome
+
+    def skip(self):
+        """Зараховує спробу без здогадки (гравець не відповів вчасно)"""
+        if self.finished:
+            raise RuntimeError("Гру вже завершено")
+        self.attempt += 1
+
+    def state(self):
+        """Повертає стан сесії кортежем (для збереження та відновлення)"""
+        return (self.target, self.min_number, self.max_number, self.max_attempts,
+                self.attempt, self.low, self.high, self.won)
+
+    @classmethod
+    def from_state(cls, state):
+        """Відновлює сесію з кортежу state()"""
+        target, min_number, max_number, max_attempts, attempt, low, high, won = state
+        session = cls(target, min_number, max_number, max_attempts)
+        session.attempt = attempt
+        session.low = low
+        session.high = high
+        session.won = bool(won)
+        return session
+
+    def __repr__(self):
+        return (f"GuessEngine(target={self.target}, attempt={self.attempt}/"
+                f"{self.max_attempts}, bounds={self.low}-{self.high}, "
+                f"won={self.won})")
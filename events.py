@@ -0,0 +1,314 @@
+"""Потік типізованих подій ігрового циклу з фоновим пакетним записом.
+
+EventStream передається в play_game(), ask_play_again() та main()
+параметром events. Гра повідомляє про початок сесії, кожну здогадку з
+напрямком підказки (engine.hint), спробу, пропущену через тайм-аут
+відповіді, перемогу, поразку, вихід та відповідь на запит повтору. Кожна подія - NamedTuple з полем time (time.time()).
+
+Випуск події на гарячому шляху - одне додавання в обмежену чергу
+(collections.deque). Фоновий потік забирає події пакетами по
+batch_size (або всі накопичені раз на flush_interval секунд) і передає
+пакет кожному приймачу (sink):
+  FileSink   - JSONL-файл;
+  SocketSink - локальний сокет (шлях Unix-сокета або (host, port)), JSONL;
+  QueueSink  - queue.Queue у тому ж процесі.
+
+Коли черга заповнена, поведінку визначає backpressure:
+  drop   - нова подія відкидається (лічильник dropped);
+  block  - гра чекає, доки фоновий потік звільнить місце;
+  sample - починаючи з половини черги приймається лише кожна
+           sample_every-та подія (лічильник sampled), повна черга - drop.
+Помилки приймачів не зупиняють запис і рахуються в sink_errors.
+"""
+
+import json
+import queue
+import socket
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+BACKPRESSURE_DROP = 'drop'
+BACKPRESSURE_BLOCK = 'block'
+BACKPRESSURE_SAMPLE = 'sample'
+BACKPRESSURE_MODES = (BACKPRESSURE_DROP, BACKPRESSURE_BLOCK, BACKPRESSURE_SAMPLE)
+
+DEFAULT_CAPACITY = 65536
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_SAMPLE_EVERY = 10
+
+
+# === ПОДІЇ ===
+
+class SessionStart(NamedTuple):
+    session: int
+    target: int
+    min_number: int
+    max_number: int
+    max_attempts: int
+    time: float
+    kind = 'session_start'
+
+
+class Guess(NamedTuple):
+    session: int
+    attempt: int
+    guess: int
+    direction: int
+    time: float
+    kind = 'guess'
+
+
+class Skip(NamedTuple):
+    session: int
+    attempt: int
+    time: float
+    kind = 'skip'
+
+
+class Win(NamedTuple):
+    session: int
+    attempt: int
+    target: int
+    time: float
+    kind = 'win'
+
+
+class Loss(NamedTuple):
+    session: int
+    attempt: int
+    target: int
+    time: float
+    kind = 'loss'
+
+
+class Exit(NamedTuple):
+    session: int
+    attempt: int
+    time: float
+    kind = 'exit'
+
+
+class Replay(NamedTuple):
+    answer: bool
+    time: float
+    kind = 'replay'
+
+
+def event_json(event):
+    """Кодує подію одним рядком JSON з полем type"""
+    return json.dumps({'type': event.kind, **event._asdict()}, separators=(',', ':'))
+
+
+def encode_batch(events):
+    """Кодує пакет подій у байти JSONL"""
+    return ''.join(event_json(event) + '\n' for event in events).encode()
+
+
+# === ПРИЙМАЧІ ===
+
+class FileSink:
+    """Дописує події у JSONL-файл"""
+
+    def __init__(self, path):
+        self._file = open(path, 'ab')
+
+    def write_batch(self, events):
+        self._file.write(encode_batch(events))
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class SocketSink:
+    """Надсилає події у JSONL локальному сокету; розірване з'єднання відновлюється"""
+
+    def __init__(self, address, timeout=5.0):
+        self.address = address
+        self.timeout = timeout
+        self._socket = None
+
+    def _connect(self):
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.address)
+            return sock
+        return socket.create_connection(self.address, self.timeout)
+
+    def write_batch(self, events):
+        if self._socket is None:
+            self._socket = self._connect()
+        try:
+            self._socket.sendall(encode_batch(events))
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+class QueueSink:
+    """Передає події в queue.Queue іншим частинам процесу"""
+
+    def __init__(self, target=None):
+        self.queue = target if target is not None else queue.Queue()
+
+    def write_batch(self, events):
+        for event in events:
+            self.queue.put(event)
+
+    def close(self):
+        pass
+
+
+# === ПОТІК ПОДІЙ ===
+
+class EventStream:
+    """Обмежена черга подій з фоновим пакетним записом у приймачі"""
+
+    def __init__(self, sinks, capacity=DEFAULT_CAPACITY, batch_size=DEFAULT_BATCH_SIZE,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL, backpressure=BACKPRESSURE_DROP,
+                 sample_every=DEFAULT_SAMPLE_EVERY):
+        if backpressure not in BACKPRESSURE_MODES:
+            raise ValueError(f"Невідомий режим backpressure: {backpressure}")
+        if capacity < 1 or batch_size < 1 or sample_every < 1:
+            raise ValueError("Місткість, розмір пакета та крок вибірки мають бути додатними")
+        self.sinks = list(sinks)
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure = backpressure
+        self.sample_every = sample_every
+        self.dropped = 0
+        self.sampled = 0
+        self.batches = 0
+        self.written = 0
+        self.sink_errors = 0
+
+        self._queue = deque()
+        self._sessions = 0
+        self._sample_counter = 0
+        # _lock захищає лічильники повільного шляху та сесій; _space - очікування
+        # місця; _drain_lock впорядковує виклики приймачів
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._drain_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name='event-writer', daemon=True)
+        self._writer.start()
+
+    def emit(self, event):
+        """Ставить подію в чергу; повертає False, якщо її відкинуто"""
+        queue_ = self._queue
+        if len(queue_) < self.capacity // 2 or (
+                self.backpressure != BACKPRESSURE_SAMPLE and len(queue_) < self.capacity):
+            queue_.append(event)
+            # Будимо потік запису один раз, коли набирається пакет
+            if len(queue_) == self.batch_size:
+                self._wake.set()
+            return True
+        return self._emit_under_pressure(event)
+
+    def _emit_under_pressure(self, event):
+        with self._lock:
+            self._wake.set()
+            if self.backpressure == BACKPRESSURE_BLOCK:
+                while len(self._queue) >= self.capacity and not self._closed:
+                    self._space.wait()
+            elif len(self._queue) >= self.capacity:
+                self.dropped += 1
+                return False
+            elif self.backpressure == BACKPRESSURE_SAMPLE:
+                self._sample_counter += 1
+                if self._sample_counter % self.sample_every:
+                    self.sampled += 1
+                    return False
+            self._queue.append(event)
+            return True
+
+    # === ПОДІЇ ГРИ ===
+
+    def session_start(self, session):
+        """Випускає SessionStart і повертає ідентифікатор сесії в потоці подій"""
+        with self._lock:
+            self._sessions += 1
+            session_id = self._sessions
+        self.emit(SessionStart(session_id, session.target, session.min_number,
+                               session.max_number, session.max_attempts, time.time()))
+        return session_id
+
+    def guess(self, session_id, session, guess, direction):
+        self.emit(Guess(session_id, session.attempt, guess, direction, time.time()))
+
+    def skip(self, session_id, session):
+        self.emit(Skip(session_id, session.attempt, time.time()))
+
+    def win(self, session_id, session):
+        self.emit(Win(session_id, session.attempt, session.target, time.time()))
+
+    def loss(self, session_id, session):
+        self.emit(Loss(session_id, session.attempt, session.target, time.time()))
+
+    def exit(self, session_id, session):
+        self.emit(Exit(session_id, session.attempt, time.time()))
+
+    def replay(self, answer):
+        self.emit(Replay(answer, time.time()))
+
+    # === ФОНОВИЙ ЗАПИС ===
+
+    def flush(self):
+        """Записує всі події, що вже в черзі (у потоці викликача)"""
+        with self._drain_lock:
+            queue_ = self._queue
+            while queue_:
+                batch = [queue_.popleft() for _ in range(min(len(queue_), self.batch_size))]
+                with self._space:
+                    self._space.notify_all()
+                for sink in self.sinks:
+                    try:
+                        sink.write_batch(batch)
+                    except Exception:  # noqa: BLE001 - приймач не має зупиняти гру
+                        self.sink_errors += 1
+                self.batches += 1
+                self.written += len(batch)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def counters(self):
+        """Лічильники потоку подій"""
+        with self._drain_lock:
+            written, batches, errors = self.written, self.batches, self.sink_errors
+        return {'written': written, 'queued': len(self._queue), 'dropped': self.dropped,
+                'sampled': self.sampled, 'batches': batches, 'sink_errors': errors}
+
+    def close(self):
+        """Записує залишок черги, зупиняє фоновий потік і закриває приймачі"""
+        if self._closed:
+            return
+        with self._space:
+            self._closed = True
+            self._space.notify_all()
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,23 @@
+"""Детерміновані замінники для тестів і бенчмарків."""
+
+import random
+
+
+class FixedRandom(random.Random):
+    """Генератор, що загадує задані числа по черзі.
+
+    Після останнього з targets повторює його; без targets загадує нижню
+    межу діапазону.
+    """
+
+    def __init__(self, *targets):
+        super().__init__()
+        self.targets = list(targets)
+        self.index = 0
+
+    def randint(self, a, b):
+        if not self.targets:
+            return a
+        target = self.targets[min(self.index, len(self.targets) - 1)]
+        self.index += 1
+        return target
@@ -0,0 +1,264 @@
+"""Фазинг валідації введення get_player_guess() у пам'яті.
+
+Генератор будує рядки з цифр різних систем письма (ASCII, арабських,
+деванагарі, повноширинних, надрядкових), варіантів пробілів, знаків,
+роздільників "_", величезних чисел, довгих рядків із нулями на початку
+(між якими трапляються знаки, пробіли та "_"), команд виходу в довільному
+регістрі та випадкових символів Unicode. Кожен рядок проходить справжній
+get_player_guess() з reader/writer у пам'яті (без mock): reader віддає
+випадок, а за ним - контрольне число. Оракул спирається лише на int()
+(без обмеження кількості цифр) та межі, а не на правила engine.
+Перевіряються інваріанти:
+  - прийнята здогадка лежить у межах конфігурації і дорівнює int(рядок);
+  - приймається рівно той рядок, який int() розбирає в межах, хоч би якої
+    довжини він був; довге число поза межами engine відкидає без int(),
+    тож для нього оракул не вимагає значення;
+  - команда виходу (text.lower() in EXIT_COMMANDS) завжди завершує гру;
+  - відкинутий рядок дає рівно одне повідомлення про помилку, після чого
+    цикл приймає контрольне число; третього читання не буває.
+
+Запуск: python fuzz.py --cases 1000000 --seed 0
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from engine import GameConfig
+from main import (
+    DEFAULT_CONFIG, EXIT_COMMANDS, GOODBYE_MESSAGE, INVALID_NUMBER_MESSAGE,
+    get_player_guess, out_of_range_message,
+)
+
+DIGIT_SETS = (
+    '0123456789',
+    '٠١٢٣٤٥٦٧٨٩',  # арабські
+    '०१२३४५६७८९',  # деванагарі
+    '０１２３４５６７８９',  # повноширинні
+    '⁰¹²³⁴⁵⁶⁷⁸⁹',  # надрядкові: isdigit(), але не для int()
+)
+WHITESPACE = (' ', '\t', '\n', '\r', '\x0b', '\x0c', '\x1c', ' ', ' ', '　')
+SIGNS = ('', '', '', '+', '-', '−', '++', '+-')
+ZEROS = ('0', '0', '0', '0', '٠', '०', '０')
+# Вставки між нулями на початку довгого рядка
+ZERO_BREAKS = ('_', '_', '__', '+', '-', ' ', '\t', '\x1c', '　', '.')
+DIGIT_TABLES = tuple(str.maketrans(DIGIT_SETS[0], digits) for digits in DIGIT_SETS)
+CONFIGS = (
+    DEFAULT_CONFIG,
+    GameConfig(-1000, 1000, exit_commands=EXIT_COMMANDS),
+    GameConfig(1, 10**30, exit_commands=EXIT_COMMANDS),
+)
+MAX_VIOLATIONS = 20
+# Коротші рядки int() перетворює без перевірки sys.get_int_max_str_digits()
+INT_DIGITS_THRESHOLD = sys.int_info.str_digits_check_threshold
+
+ACCEPTED = 'accepted'
+EXITED = 'exited'
+REJECTED = 'rejected'
+
+
+class InputCases:
+    """Генератор випадків введення з відтворюваним seed"""
+
+    __slots__ = ('rng', 'makers')
+
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.makers = (self.number, self.number, self.number, self.padded, self.exit_command,
+                       self.huge, self.noise, self.mixed, self.boundary, self.zero_padded)
+
+    def __call__(self, config):
+        return self.rng.choice(self.makers)(config)
+
+    def digits(self, text, digit_set=None):
+        """Записує ASCII-цифри text цифрами digit_set (випадкової системи)"""
+        return text.translate(digit_set or self.rng.choice(DIGIT_TABLES))
+
+    def number(self, config):
+        rng = self.rng
+        value = rng.randint(config.min_number - 10, config.max_number + 10)
+        sign = rng.choice(SIGNS)
+        if value < 0:
+            sign, value = '-' + sign.lstrip('+-'), -value
+        text = self.digits(str(value), DIGIT_TABLES[0] if rng.random() < 0.6 else None)
+        if rng.random() < 0.1 and len(text) > 1:
+            cut = rng.randrange(1, len(text))
+            text = text[:cut] + rng.choice(('_', '__', ',', '.')) + text[cut:]
+        if rng.random() < 0.1:
+            text = '0' * rng.randint(1, 20) + text
+        return sign + text
+
+    def padded(self, config):
+        rng = self.rng
+        pad = ''.join(rng.choice(WHITESPACE) for _ in range(rng.randint(0, 3)))
+        tail = ''.join(rng.choice(WHITESPACE) for _ in range(rng.randint(0, 3)))
+        return pad + self.number(config) + tail
+
+    def exit_command(self, config):
+        rng = self.rng
+        word = ''.join(char.upper() if rng.random() < 0.5 else char
+                       for char in rng.choice(EXIT_COMMANDS))
+        if rng.random() < 0.2:
+            word = rng.choice(WHITESPACE) + word if rng.random() < 0.5 else word[:-1]
+        return word
+
+    def huge(self, config):
+        rng = self.rng
+        text = str(rng.randint(1, 9)) + '0' * rng.randint(10, 5000)
+        return rng.choice(SIGNS) + self.digits(text)
+
+    def noise(self, config):
+        rng = self.rng
+        return ''.join(chr(rng.randint(1, 0x2FFFF)) for _ in range(rng.randint(0, 8)))
+
+    def mixed(self, config):
+        rng = self.rng
+        text = self.number(config)
+        position = rng.randint(0, len(text))
+        return text[:position] + rng.choice('abcxyzеіїє🎯.,') + text[position:]
+
+    def boundary(self, config):
+        rng = self.rng
+        value = rng.choice((config.min_number, config.max_number)) + rng.choice((-1, 0, 1))
+        return str(value)
+
+    def zero_padded(self, config):
+        """Рядок, довший за config.max_length, через нулі на початку"""
+        rng = self.rng
+        zeros = [rng.choice(ZEROS) for _ in range(rng.randint(config.max_length,
+                                                              config.max_length + 30))]
+        if rng.random() < 0.7:
+            zeros.insert(rng.randint(0, len(zeros)), rng.choice(ZERO_BREAKS))
+        value = rng.randint(config.min_number, config.max_number)
+        text = ''.join(zeros) + self.digits(str(abs(value)), DIGIT_TABLES[0])
+        sign = '-' if value < 0 else rng.choice(('', '', '+'))
+        if rng.random() < 0.2:
+            return rng.choice(WHITESPACE) + sign + text + rng.choice(WHITESPACE)
+        return sign + text
+
+
+def parse_int(text):
+    """int(text) без обмеження кількості цифр перетворення рядка"""
+    if len(text) <= INT_DIGITS_THRESHOLD:
+        return int(text)
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        return int(text)
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+
+def expected_outcome(text, config):
+    """Незалежний оракул: (результат, число або None)"""
+    if text.lower() in EXIT_COMMANDS:
+        return EXITED, None
+    try:
+        value = parse_int(text)
+    except ValueError:
+        return REJECTED, None
+    if config.min_number <= value <= config.max_number:
+        return ACCEPTED, value
+    return REJECTED, value
+
+
+class Driver:
+    """reader/writer у пам'яті для одного виклику get_player_guess()"""
+
+    __slots__ = ('inputs', 'reads', 'messages')
+
+    def __init__(self):
+        self.inputs = ()
+        self.reads = 0
+        self.messages = []
+
+    def reset(self, *inputs):
+        self.inputs = inputs
+        self.reads = 0
+        self.messages.clear()
+
+    def reader(self, prompt=''):
+        if self.reads >= len(self.inputs):
+            # Цикл не прийняв контрольне число: зупиняємо замість зависання
+            raise EOFError("Цикл введення не завершився")
+        text = self.inputs[self.reads]
+        self.reads += 1
+        return text
+
+    def writer(self, text=''):
+        self.messages.append(text)
+
+
+def check_case(driver, text, config):
+    """Проганяє випадок і повертає (результат, порушення або None)"""
+    outcome, value = expected_outcome(text, config)
+    control = config.min_number
+    driver.reset(text, str(control))
+    try:
+        result = get_player_guess(1, config.max_attempts, driver.reader, driver.writer, config)
+    except EOFError:
+        return outcome, "цикл не завершився"
+    except Exception as error:  # noqa: BLE001 - будь-який виняток є порушенням
+        return outcome, f"виняток {type(error).__name__}: {error}"
+
+    errors = [message for message in driver.messages
+              if message in (INVALID_NUMBER_MESSAGE, out_of_range_message(config))]
+    if outcome == EXITED:
+        if result is not None or GOODBYE_MESSAGE not in driver.messages:
+            return outcome, "команду виходу не виконано"
+    elif outcome == ACCEPTED:
+        if result != value or driver.reads != 1:
+            return outcome, f"очікувалось прийняти {value}, отримано {result!r}"
+    elif result is None or not config.min_number <= result <= config.max_number:
+        return outcome, f"прийнято значення поза межами: {result!r}"
+    elif driver.reads != 2 or result != control or len(errors) != 1:
+        return outcome, f"відкинутий рядок прийнято як {result!r}"
+    return outcome, None
+
+
+def fuzz(cases, seed=0, configs=CONFIGS):
+    """Проганяє cases випадків; повертає звіт-словник"""
+    generate = InputCases(seed)
+    driver = Driver()
+    counts = dict.fromkeys((ACCEPTED, EXITED, REJECTED), 0)
+    violations = []
+    violation_count = 0
+    start = time.perf_counter()
+    for index in range(cases):
+        config = configs[index % len(configs)]
+        text = generate(config)
+        outcome, violation = check_case(driver, text, config)
+        counts[outcome] += 1
+        if violation:
+            violation_count += 1
+            if len(violations) < MAX_VIOLATIONS:
+                violations.append({'input': text, 'config': repr(config),
+                                   'violation': violation})
+    duration = time.perf_counter() - start
+    return {
+        'cases': cases,
+        'seed': seed,
+        **counts,
+        'violation_count': violation_count,
+        'violations': violations,
+        'duration_s': round(duration, 3),
+        'cases_per_min': round(cases / duration * 60) if duration else 0,
+    }
+
+
+def main(argv=None):
+    """Точка входу командного рядка"""
+    parser = argparse.ArgumentParser(description="Фазинг валідації введення")
+    parser.add_argument('--cases', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = fuzz(args.cases, args.seed)
+    print(json.dumps(report, ensure_ascii=False))
+    return 1 if report['violation_count'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""Компактний двійковий журнал ходів гри.
+
+Файл складається із заголовка та записів фіксованої довжини:
+  session (u64) | guess (i64) | attempt (u16) | hint (i8) | outcome (u8)
+Порядок байтів little-endian, без вирівнювання (RECORD_SIZE = 20 байт).
+Числа, що не вміщаються в i64, у журнал записати не можна.
+
+GameRecorder дописує записи у файл з буферизацією, GameLogReader
+відображає файл у пам'ять (mmap) і віддає стовпці як NumPy-представлення
+без копіювання та без створення Python-об'єктів на кожен запис.
+"""
+
+import mmap
+import os
+import struct
+import threading
+
+import numpy as np
+
+# === РЕЗУЛЬТАТИ ХОДУ ===
+OUTCOME_MISS = 0
+OUTCOME_WIN = 1
+OUTCOME_LOSS = 2
+OUTCOME_EXIT = 3
+# Спроба без здогадки (тайм-аут відповіді): гра триває або програна нею
+OUTCOME_SKIP = 4
+OUTCOME_SKIP_LOSS = 5
+
+MAGIC = b'GUESSLOG'
+VERSION = 1
+HEADER = struct.Struct('<8sHH4x')
+HEADER_SIZE = HEADER.size
+RECORD = struct.Struct('<QqHbB')
+RECORD_SIZE = RECORD.size
+RECORD_DTYPE = np.dtype([
+    ('session', '<u8'),
+    ('guess', '<i8'),
+    ('attempt', '<u2'),
+    ('hint', 'i1'),
+    ('outcome', 'u1'),
+])
+COLUMNS = RECORD_DTYPE.names
+
+DEFAULT_BUFFER_RECORDS = 4096
+
+
+class GameLogError(ValueError):
+    """Файл не є журналом гри або має несумісну версію"""
+
+
+def _read_header(data):
+    if len(data) < HEADER_SIZE:
+        raise GameLogError("Файл журналу закороткий")
+    magic, version, record_size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise GameLogError("Файл не є журналом гри")
+    if version != VERSION or record_size != RECORD_SIZE:
+        raise GameLogError(f"Непідтримувана версія журналу: {version}")
+
+
+class GameRecorder:
+    """Дописує ходи ігор у двійковий журнал.
+
+    Екземпляр можна ділити між потоками: запис у буфер захищено замком.
+    Ідентифікатори сесій продовжують нумерацію наявного файлу.
+    """
+
+    def __init__(self, path, buffer_records=DEFAULT_BUFFER_RECORDS):
+        self.path = path
+        self._file = open(path, 'a+b')
+        self._lock = threading.Lock()
+        self._buffer = bytearray(RECORD_SIZE * buffer_records)
+        self._used = 0
+
+        size = self._file.seek(0, os.SEEK_END)
+        if size == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+            self._next_session = 1
+        else:
+            self._file.seek(0)
+            _read_header(self._file.read(HEADER_SIZE))
+            records = (size - HEADER_SIZE) // RECORD_SIZE
+            self._next_session = 1
+            if records:
+                # Записи сесій з різних потоків чергуються, тож останній запис
+                # не обов'язково належить найновішій сесії
+                with GameLogReader(path) as log:
+                    self._next_session = int(log.column('session').max()) + 1
+            # Обрізаємо неповний останній запис після аварійного завершення
+            self._file.truncate(HEADER_SIZE + records * RECORD_SIZE)
+            self._file.seek(0, os.SEEK_END)
+
+    def begin_session(self, session=None):
+        """Видає новий ідентифікатор сесії (стан session журналу не потрібен)"""
+        with self._lock:
+            session_id = self._next_session
+            self._next_session += 1
+        return session_id
+
+    def record(self, session_id, attempt, guess, hint, outcome):
+        """Додає один запис до буфера"""
+        with self._lock:
+            RECORD.pack_into(self._buffer, self._used, session_id, guess, attempt, hint, outcome)
+            self._used += RECORD_SIZE
+            if self._used == len(self._buffer):
+                self._flush_locked()
+
+    def record_guess(self, session_id, session, guess, hint):
+        """Записує зараховану спробу сесії GuessEngine"""
+        if session.won:
+            outcome = OUTCOME_WIN
+        elif session.lost:
+            outcome = OUTCOME_LOSS
+        else:
+            outcome = OUTCOME_MISS
+        self.record(session_id, session.attempt, guess, hint, outcome)
+
+    def record_skip(self, session_id, session):
+        """Записує спробу session.attempt, пропущену через тайм-аут відповіді"""
+        outcome = OUTCOME_SKIP_LOSS if session.lost else OUTCOME_SKIP
+        self.record(session_id, session.attempt, 0, 0, outcome)
+
+    def record_exit(self, session_id, session):
+        """Записує вихід гравця під час спроби session.attempt + 1"""
+        self.record(session_id, session.attempt + 1, 0, 0, OUTCOME_EXIT)
+
+    def _flush_locked(self):
+        if self._used:
+            self._file.write(memoryview(self._buffer)[:self._used])
+            self._used = 0
+        self._file.flush()
+
+    def flush(self):
+        """Записує буфер у файл"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Записує буфер та закриває файл"""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GameLogReader:
+    """Читає журнал через mmap без копіювання записів"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < HEADER_SIZE:
+                raise GameLogError("Файл журналу закороткий")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        _read_header(self._mmap)
+        self._count = (size - HEADER_SIZE) // RECORD_SIZE
+        self.records = np.frombuffer(self._mmap, dtype=RECORD_DTYPE,
+                                     count=self._count, offset=HEADER_SIZE)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        """Повертає один запис як кортеж (session, guess, attempt, hint, outcome)"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return RECORD.unpack_from(self._mmap, HEADER_SIZE + index * RECORD_SIZE)
+
+    def column(self, name):
+        """Повертає стовпець як NumPy-представлення над mmap (без копії)"""
+        return self.records[name]
+
+    def raw(self):
+        """Повертає memoryview над усіма записами"""
+        return memoryview(self._mmap)[HEADER_SIZE:HEADER_SIZE + self._count * RECORD_SIZE]
+
+    def close(self):
+        """Звільняє відображення файлу"""
+        # Представлення NumPy тримають буфер mmap, тож спершу відпускаємо їх
+        self.records = None
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
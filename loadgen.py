@@ -0,0 +1,310 @@
+"""Генератор навантаження: багато ботів грають через звичайні запрошення гри.
+
+Бот бачить лише текст, який отримав би гравець: рядки підказок,
+запрошення get_player_guess() та ask_play_again(), - і відповідає на них
+за стратегією бінарного або випадкового пошуку. Режими:
+  network    - asyncio-клієнти TCP-сервера (server.py, cluster.py);
+  in-process - main() з reader/writer бота у пулі потоків, без мережі.
+
+Затримка кожного ходу (від відповіді бота до наступного запрошення)
+записується в LatencyHistogram - логарифмічно-лінійну гістограму в стилі
+HDR з фіксованою відносною похибкою. Звіт - JSON з пропускною здатністю,
+перцентилями p50/p90/p99/p999 та кількістю помилок.
+
+Запуск:
+  python loadgen.py --host 127.0.0.1 --port 8765 --bots 200 --games 20
+  python loadgen.py --in-process --bots 8 --games 1000 --strategy random
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from main import (
+    DEFAULT_CONFIG, HINT_MESSAGES, INVALID_ANSWER_MESSAGE, INVALID_NUMBER_MESSAGE,
+    PLAY_AGAIN_PROMPT, WIN_TEMPLATE, guess_prompt, out_of_range_message,
+    run_threaded_sessions,
+)
+
+STRATEGIES = ('binary', 'random')
+DEFAULT_SIGNIFICANT_BITS = 7
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+TOO_SMALL_LINE, _, TOO_BIG_LINE = HINT_MESSAGES
+WIN_LINE = WIN_TEMPLATE.split("\n")[2]
+PLAY_AGAIN_LINE = PLAY_AGAIN_PROMPT.lstrip("\n")
+
+
+class LatencyHistogram:
+    """Гістограма цілих значень (нс) з відносною похибкою 2**-(significant_bits-1).
+
+    Значення до 2**significant_bits зберігаються точно, більші - у кошиках,
+    ширина яких подвоюється з кожним степенем двійки (як у HdrHistogram).
+    Запис - O(1), пам'ять - O(significant_bits * log2(max)).
+    """
+
+    __slots__ = ('significant_bits', 'counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self, significant_bits=DEFAULT_SIGNIFICANT_BITS):
+        self.significant_bits = significant_bits
+        self.counts = []
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value):
+        shift = value.bit_length() - self.significant_bits
+        if shift <= 0:
+            return value
+        half = 1 << (self.significant_bits - 1)
+        return shift * half + (value >> shift)
+
+    def _highest_value(self, index):
+        """Найбільше значення, що потрапляє в кошик index"""
+        half = 1 << (self.significant_bits - 1)
+        if index < 2 * half:
+            return index
+        shift = index // half - 1
+        return ((index - shift * half + 1) << shift) - 1
+
+    def record(self, value):
+        """Додає невід'ємне ціле значення"""
+        index = self._index(value)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Додає значення іншої гістограми з тією ж точністю"""
+        if other.significant_bits != self.significant_bits:
+            raise ValueError("Не можна об'єднати гістограми різної точності")
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, q):
+        """Значення перцентиля q (0-100), не менше за фактичне"""
+        if not self.count:
+            return 0
+        rank = max(1, -(-q * self.count // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._highest_value(index), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class Bot:
+    """Бот-гравець, що реагує на рядки виводу гри"""
+
+    __slots__ = ('strategy', 'rng', 'config', 'prompt', 'error_lines', 'games_left',
+                 'low', 'high', 'last_guess', 'games', 'guesses', 'wins', 'errors')
+
+    def __init__(self, games, strategy='binary', rng=None, config=None):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Невідома стратегія: {strategy}")
+        self.strategy = strategy
+        self.rng = rng or random.Random()
+        self.config = config or DEFAULT_CONFIG
+        self.prompt = guess_prompt(config)
+        self.error_lines = (INVALID_NUMBER_MESSAGE, INVALID_ANSWER_MESSAGE,
+                            out_of_range_message(config))
+        self.games_left = games
+        self.games = self.guesses = self.wins = self.errors = 0
+        self._reset()
+
+    def _reset(self):
+        self.low = self.config.min_number
+        self.high = self.config.max_number
+        self.last_guess = None
+
+    def observe(self, line):
+        """Враховує рядок виводу гри"""
+        if line == TOO_SMALL_LINE:
+            self.low = self.last_guess + 1
+        elif line == TOO_BIG_LINE:
+            self.high = self.last_guess - 1
+        elif line == WIN_LINE:
+            self.wins += 1
+        elif line in self.error_lines:
+            self.errors += 1
+
+    def answer(self, prompt):
+        """Повертає відповідь на запрошення; None - запрошення не розпізнано"""
+        if prompt == self.prompt:
+            if self.low > self.high:
+                # Підказки суперечать діапазону: гра поводиться не за правилами
+                self.errors += 1
+                self._reset()
+            if self.strategy == 'binary':
+                guess = (self.low + self.high) // 2
+            else:
+                guess = self.rng.randint(self.low, self.high)
+            self.last_guess = guess
+            self.guesses += 1
+            return str(guess)
+        if prompt == PLAY_AGAIN_LINE:
+            self.games += 1
+            self.games_left -= 1
+            self._reset()
+            return 'так' if self.games_left > 0 else 'ні'
+        self.errors += 1
+        return None
+
+
+# === РЕЖИМИ ===
+
+async def run_network_bot(host, port, bot, histogram, timeout=30.0):
+    """Грає ботом через TCP-сервер, записуючи затримки ходів"""
+    clock = time.perf_counter_ns
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at = None
+    try:
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            if not line:
+                break
+            text = line.decode().rstrip('\n')
+            if not text.endswith(': '):
+                bot.observe(text)
+                continue
+            if sent_at is not None:
+                histogram.record(clock() - sent_at)
+            answer = bot.answer(text)
+            if answer is None:
+                break
+            writer.write(answer.encode() + b'\n')
+            # Затримка вимірюється лише для ходів, не для відповіді на повтор гри
+            sent_at = clock() if text == bot.prompt else None
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def run_network(host, port, bots, histograms, timeout=30.0):
+    """Запускає всіх ботів одночасно; повертає кількість мережевих помилок"""
+    results = await asyncio.gather(
+        *(run_network_bot(host, port, bot, histogram, timeout)
+          for bot, histogram in zip(bots, histograms)),
+        return_exceptions=True)
+    return sum(isinstance(result, Exception) for result in results)
+
+
+def bot_io(bot, histogram):
+    """Створює пару (reader, writer) main() для гри ботом у процесі"""
+    clock = time.perf_counter_ns
+    sent_at = None
+
+    def writer(text=''):
+        for line in text.split("\n"):
+            bot.observe(line)
+
+    def reader(prompt=''):
+        nonlocal sent_at
+        *lines, prompt = prompt.split("\n")
+        for line in lines:
+            bot.observe(line)
+        if sent_at is not None:
+            histogram.record(clock() - sent_at)
+        answer = bot.answer(prompt)
+        if answer is None:
+            raise EOFError
+        sent_at = clock() if prompt == bot.prompt else None
+        return answer
+
+    return reader, writer
+
+
+def run_in_process(bots, histograms, rngs, config=None):
+    """Грає ботами через main() у пулі потоків; rngs - генератори загаданих чисел"""
+    sessions = [(*bot_io(bot, histogram), rng, config)
+                for bot, histogram, rng in zip(bots, histograms, rngs)]
+    run_threaded_sessions(sessions, max_workers=len(sessions) or None)
+
+
+def run_load(bots=10, games=10, strategy='binary', host=None, port=None, seed=None,
+             config=None, timeout=30.0):
+    """Проводить навантаження та повертає звіт-словник"""
+    base = random.Random(seed)
+    players = [Bot(games, strategy, random.Random(base.random()), config) for _ in range(bots)]
+    histograms = [LatencyHistogram() for _ in range(bots)]
+
+    start = time.perf_counter()
+    if host is None:
+        mode, network_errors = 'in-process', 0
+        rngs = [random.Random(base.random()) for _ in range(bots)]
+        run_in_process(players, histograms, rngs, config)
+    else:
+        mode = 'network'
+        network_errors = asyncio.run(run_network(host, port, players, histograms, timeout))
+    duration = time.perf_counter() - start
+
+    latency = LatencyHistogram()
+    for histogram in histograms:
+        latency.merge(histogram)
+    guesses = sum(bot.guesses for bot in players)
+    played = sum(bot.games for bot in players)
+    report = {
+        'mode': mode,
+        'strategy': strategy,
+        'bots': bots,
+        'games': played,
+        'wins': sum(bot.wins for bot in players),
+        'guesses': guesses,
+        'errors': sum(bot.errors for bot in players) + network_errors,
+        'duration_s': round(duration, 6),
+        'games_per_s': round(played / duration, 1) if duration else 0.0,
+        'guesses_per_s': round(guesses / duration, 1) if duration else 0.0,
+        'latency_us': {f"p{q:g}": latency.percentile(q) / 1000 for q in REPORT_PERCENTILES},
+    }
+    report['latency_us'].update(mean=round(latency.mean / 1000, 3), max=latency.max / 1000)
+    return report
+
+
+def main(argv=None):
+    """Точка входу командного рядка"""
+    parser = argparse.ArgumentParser(description="Генератор навантаження гри 'Вгадай число'")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--in-process', action='store_true', help="грати через main() без мережі")
+    target.add_argument('--port', type=int, help="порт TCP-сервера")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--bots', type=int, default=10, help="кількість одночасних ботів")
+    parser.add_argument('--games', type=int, default=10, help="ігор на одного бота")
+    parser.add_argument('--strategy', choices=STRATEGIES, default='binary')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help="тайм-аут очікування рядка сервера, с")
+    args = parser.parse_args(argv)
+
+    report = run_load(args.bots, args.games, args.strategy,
+                      None if args.in_process else args.host, args.port, args.seed,
+                      timeout=args.timeout)
+    print(json.dumps(report))
+    return 1 if report['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,16 @@
+import argparse
+import functools
 import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from engine import (
+    CORRECT, GUESS_EXIT, GUESS_INVALID, GUESS_OUT_OF_RANGE, GameConfig,
+    hint, parse_answer,
+)
+from metrics import PHASE_LOGIC, PHASE_RENDER
+from stats import SessionStats
 
 # === КОНСТАНТИ ===
 MIN_NUMBER = 1
@@ -7,120 +19,576 @@ MAX_ATTEMPTS = 7
 EXIT_COMMANDS = ['exit', 'quit', 'вихід']
 YES_ANSWERS = ['так', 'yes', 'y', 'т', '1']
 NO_ANSWERS = ['ні', 'no', 'n', 'н', '0']
+DEFAULT_CONFIG = GameConfig(MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS, EXIT_COMMANDS)
+# Межі чисел двійкових журналів (--log, --wal) та генераторів NumPy
+INT64_MIN = -2**63
+INT64_MAX = 2**63 - 1
+MAX_LOGGED_ATTEMPTS = 2**16 - 1
+
+# === ПОВІДОМЛЕННЯ ===
+START_MESSAGE = "🎮 Запуск гри 'Вгадай число'..."
+GOODBYE_MESSAGE = "👋 Дякуємо за гру! До побачення!"
+INVALID_NUMBER_MESSAGE = "❌ Помилка: Введіть ціле число!"
+PLAY_AGAIN_PROMPT = "\n🔄 Бажаєте зіграти ще раз? (так/ні): "
+INVALID_ANSWER_MESSAGE = "❌ Введіть 'так' або 'ні'"
+ATTEMPT_TIMEOUT_MESSAGE = "⏰ Час на відповідь вичерпано!"
+SESSION_TIMEOUT_MESSAGE = "⏰ Час сесії вичерпано!"
+
+
+class InputTimeout(TimeoutError):
+    """reader() не дочекався відповіді гравця (див. deadlines.DeadlineReader).
+
+    session_expired - вичерпано час усієї сесії, а не лише поточної відповіді;
+    session - незавершена сесія, яку play_game() перервала через тайм-аут.
+    """
+
+    def __init__(self, session_expired=False):
+        super().__init__(SESSION_TIMEOUT_MESSAGE if session_expired else ATTEMPT_TIMEOUT_MESSAGE)
+        self.session_expired = session_expired
+        self.session = None
+
+
+@functools.lru_cache(maxsize=64)
+def render_range_messages(min_number, max_number, max_attempts):
+    """Будує (привітання, запрошення, помилку діапазону) для налаштувань гри"""
+    welcome = "\n".join([
+        "=" * 50,
+        "🎯 Вітаємо у грі 'Вгадай число'! 🎯",
+        "=" * 50,
+        "Правила:",
+        f"• Комп'ютер загадав число від {min_number} до {max_number}",
+        f"• У вас є {max_attempts} спроб, щоб його вгадати",
+        "• Після кожної спроби ви отримаєте підказку",
+        "• Удачі! 🍀",
+        "=" * 50,
+    ])
+    prompt = f"Введіть ваше число ({min_number}-{max_number}): "
+    out_of_range = f"❌ Помилка: Число має бути від {min_number} до {max_number}!"
+    return welcome, prompt, out_of_range
+
+
+def _range_messages(config):
+    if config is None:
+        return _DEFAULT_RANGE_MESSAGES
+    return render_range_messages(config.min_number, config.max_number, config.max_attempts)
+
+
+# Статичні банери будуються один раз під час імпорту, змінні повідомлення
+# форматуються за готовими шаблонами.
+_DEFAULT_RANGE_MESSAGES = render_range_messages(MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS)
+WELCOME_MESSAGE, GUESS_PROMPT, OUT_OF_RANGE_MESSAGE = _DEFAULT_RANGE_MESSAGES
+NEW_GAME_MESSAGE = "\n".join([
+    "\n" + "🔄" * 30,
+    "Початок нової гри!",
+    "🔄" * 30,
+])
+
+ATTEMPT_TEMPLATE = "\n📝 Спроба %d/%d"
+REMAINING_TEMPLATE = "💡 Залишилось спроб: %d"
+RESUME_TEMPLATE = "♻️ Продовжуємо збережену гру: використано спроб %d/%d, число між %d та %d"
+ASSIST_TEMPLATE = "🧭 Порада: спробуйте %d (шанс перемоги %.0f%%, очікувано ще %.1f спроб)"
+# Індекс - знак підказки engine.hint() + 1
+HINT_MESSAGES = (
+    "📈 Занадто маленьке! Спробуйте більше число.",
+    "",
+    "📉 Занадто велике! Спробуйте менше число.",
+)
+WIN_TEMPLATE = "\n".join([
+    "\n" + "🎉" * 20,
+    "🏆 ВІТАЄМО! ВИ ВГАДАЛИ! 🏆",
+    "🎯 Загадане число: %d",
+    "⭐ Кількість спроб: %d",
+    "%s",
+    "🎉" * 20,
+])
+# Індекс - номер спроби, на якій вгадано число
+WIN_RATINGS = (
+    None,
+    "🌟 Неймовірна удача!",
+    "🌟 Відмінний результат!",
+    "🌟 Відмінний результат!",
+    "👍 Хороший результат!",
+    "👍 Хороший результат!",
+)
+WIN_RATING_DEFAULT = "👌 Непогано!"
+LOSS_TEMPLATE = "\n".join([
+    "\n" + "💔" * 20,
+    "😔 УВИ, СПРОБИ ЗАКІНЧИЛИСЬ!",
+    "🎯 Загадане число було: %d",
+    "🔄 Спробуйте ще раз!",
+    "💔" * 20,
+])
+
+
+def welcome_message(config=None):
+    """Повертає привітальне повідомлення та правила гри"""
+    return _range_messages(config)[0]
+
+
+def attempt_message(attempt_num, max_attempts):
+    """Повертає заголовок спроби"""
+    return ATTEMPT_TEMPLATE % (attempt_num, max_attempts)
+
+
+def guess_prompt(config=None):
+    """Повертає запрошення до введення числа"""
+    return _range_messages(config)[1]
+
+
+def out_of_range_message(config=None):
+    """Повертає повідомлення про число поза діапазоном"""
+    return _range_messages(config)[2]
+
+
+def hint_message(guess, target):
+    """Повертає текст підказки або порожній рядок, якщо число вгадано"""
+    return HINT_MESSAGES[hint(guess, target) + 1]
+
+
+def remaining_message(remaining):
+    """Повертає повідомлення про залишок спроб"""
+    return REMAINING_TEMPLATE % remaining
+
+
+def resume_message(session):
+    """Повертає повідомлення про продовження відновленої сесії"""
+    return RESUME_TEMPLATE % (session.attempt, session.max_attempts, session.low, session.high)
+
+
+def assist_message(strategy, session):
+    """Повертає пораду оптимальної стратегії (strategy.StrategyTable)"""
+    low, high, remaining = session.low, session.high, session.remaining
+    return ASSIST_TEMPLATE % (strategy.best_guess(low, high, remaining),
+                              strategy.win_probability(low, high, remaining) * 100,
+                              strategy.expected_attempts(low, high, remaining))
+
+
+def win_message(target, attempt):
+    """Повертає повідомлення про перемогу"""
+    rating = WIN_RATINGS[attempt] if attempt < len(WIN_RATINGS) else WIN_RATING_DEFAULT
+    return WIN_TEMPLATE % (target, attempt, rating)
+
+
+def loss_message(target):
+    """Повертає повідомлення про поразку"""
+    return LOSS_TEMPLATE % target
+
+
+def new_game_message():
+    """Повертає повідомлення про початок нової гри"""
+    return NEW_GAME_MESSAGE
+
+
+def new_session(rng=None, config=None):
+    """Створює ігрову сесію з випадковим загаданим числом.
+
+    rng - власний генератор сесії (random.Random); за замовчуванням
+    використовується спільний генератор модуля random.
+    config - налаштування гри (GameConfig), за замовчуванням DEFAULT_CONFIG.
+    """
+    config = config or DEFAULT_CONFIG
+    target = (rng or random).randint(config.min_number, config.max_number)
+    return config.new_session(target)
+
+
+# Кожна функція з вводом/виводом приймає reader та writer сесії:
+# reader(prompt) -> str поводиться як input(), writer(text) - як print().
+# Без них використовується буферизована консоль: весь вивід ходу
+# накопичується і записується в sys.stdout одним викликом перед
+# наступним input() або після завершення функції.
+
+_console = threading.local()
+
+
+def console_write(text=''):
+    """Додає рядок до виводу поточного ходу (аналог print)"""
+    try:
+        _console.pending.append(text)
+    except AttributeError:
+        _console.pending = [text]
+
+
+def flush_console():
+    """Записує накопичений вивід одним викликом sys.stdout.write"""
+    pending = getattr(_console, 'pending', None)
+    if pending:
+        pending.append('')
+        sys.stdout.write('\n'.join(pending))
+        pending.clear()
+
+
+def console_read(prompt=''):
+    """Записує накопичений вивід та читає рядок через input()"""
+    flush_console()
+    return input(prompt)
+
 
+def flushes_console(func):
+    """Записує вивід консолі після завершення зовнішнього виклику функції.
 
-def display_welcome():
+    Вкладені виклики (display_welcome() всередині play_game() тощо) не
+    скидають буфер, щоб їхній вивід потрапив у спільний запис ходу.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        depth = getattr(_console, 'depth', 0)
+        _console.depth = depth + 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _console.depth = depth
+            if not depth:
+                flush_console()
+
+    return wrapper
+
+
+def stream_io(in_stream, out_stream):
+    """Створює пару (reader, writer) поверх текстових потоків сесії"""
+
+    def reader(prompt=''):
+        out_stream.write(prompt)
+        line = in_stream.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\r\n')
+
+    def writer(text=''):
+        out_stream.write(text + '\n')
+
+    return reader, writer
+
+
+@flushes_console
+def display_welcome(writer=None, config=None):
     """Виводить привітальне повідомлення та правила гри"""
-    print("=" * 50)
-    print("🎯 Вітаємо у грі 'Вгадай число'! 🎯")
-    print("=" * 50)
-    print("Правила:")
-    print(f"\u2022 Комп'ютер загадав число від {MIN_NUMBER} до {MAX_NUMBER}")
-    print(f"\u2022 У вас є {MAX_ATTEMPTS} спроб, щоб його вгадати")
-    print("\u2022 Після кожної спроби ви отримаєте підказку")
-    print("• Удачі! 🍀")
-    print("=" * 50)
-
-
-def get_player_guess(attempt_num, max_attempts):
+    (writer or console_write)(welcome_message(config))
+
+
+@flushes_console
+def get_player_guess(attempt_num, max_attempts, reader=None, writer=None, config=None,
+                     metrics=None):
     """Отримує та валідує введення гравця"""
+    reader = reader or console_read
+    writer = writer or console_write
+    parse = (config or DEFAULT_CONFIG).parse_guess
+    if metrics:
+        reader = metrics.timed_reader(reader)
+        writer = metrics.timed(PHASE_RENDER, writer)
+        parse = metrics.instrument_parse(parse)
+    prompt = guess_prompt(config)
     while True:
-        try:
-            print(f"\n📝 Спроба {attempt_num}/{max_attempts}")
-            guess = input(f"Введіть ваше число ({MIN_NUMBER}-{MAX_NUMBER}): ")
-
-            if guess.lower() in EXIT_COMMANDS:
-                print("👋 Дякуємо за гру! До побачення!")
-                return None
+        writer(attempt_message(attempt_num, max_attempts))
+        guess = reader(prompt)
+        status, value = parse(guess, EXIT_COMMANDS)
 
-            guess = int(guess)
+        if status == GUESS_EXIT:
+            writer(GOODBYE_MESSAGE)
+            return None
 
-            if guess < MIN_NUMBER or guess > MAX_NUMBER:
-                print(f"❌ Помилка: Число має бути від {MIN_NUMBER} до {MAX_NUMBER}!")
-                continue
+        if status == GUESS_INVALID:
+            writer(INVALID_NUMBER_MESSAGE)
+            continue
 
-            return guess
+        if status == GUESS_OUT_OF_RANGE:
+            writer(out_of_range_message(config))
+            continue
 
-        except ValueError:
-            print("❌ Помилка: Введіть ціле число!")
+        return value
 
 
-def give_hint(guess, target):
+@flushes_console
+def give_hint(guess, target, writer=None):
     """Надає підказку гравцю на основі його здогадки"""
-    if guess < target:
-        print(f"📈 Занадто маленьке! Спробуйте більше число.")
-    elif guess > target:
-        print(f"📉 Занадто велике! Спробуйте менше число.")
+    message = hint_message(guess, target)
+    if message:
+        (writer or console_write)(message)
 
 
-def play_game():
-    """Основна функція гри"""
-    target_number = random.randint(MIN_NUMBER, MAX_NUMBER)
-    display_welcome()
+@flushes_console
+def play_game(reader=None, writer=None, rng=None, config=None, recorder=None, metrics=None,
+              assist=None, session=None, events=None):
+    """Основна функція гри. Повертає стан завершеної сесії (GuessEngine).
 
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        player_guess = get_player_guess(attempt, MAX_ATTEMPTS)
+    recorder - необов'язковий журнал ходів (gamelog.GameRecorder, wal.SessionWAL);
+    metrics - необов'язкові метрики (metrics.GameMetrics);
+    assist - таблиця оптимальної стратегії для порад (strategy.StrategyTable);
+    session - відновлена незавершена сесія замість нової;
+    events - необов'язковий потік подій (events.EventStream).
+    """
+    resumed = session is not None
+    if not resumed:
+        session = new_session(rng, config)
+    session_id = recorder.begin_session(session) if recorder else None
+    event_id = events.session_start(session) if events else None
+    out = writer or console_write
+    guess = session.guess
+    if metrics:
+        out = metrics.timed(PHASE_RENDER, out)
+        guess = metrics.timed(PHASE_LOGIC, guess)
+    display_welcome(out, config)
+    if resumed:
+        out(resume_message(session))
 
-        if player_guess is None:
-            return
+    while not session.finished:
+        if assist:
+            out(assist_message(assist, session))
+        try:
+            player_guess = get_player_guess(session.attempt + 1, session.max_attempts,
+                                            reader=reader, writer=writer, config=config,
+                                            metrics=metrics)
+        except InputTimeout as timeout:
+            if timeout.session_expired:
+                # Незавершена гра закінчується виходом в усіх журналах і метриках;
+                # main() враховує її в статистиці через timeout.session
+                if recorder:
+                    recorder.record_exit(session_id, session)
+                if events:
+                    events.exit(event_id, session)
+                if metrics:
+                    metrics.record_game(session)
+                timeout.session = session
+                raise
+            # Пропущена відповідь коштує спробу; остання пропущена - поразка
+            out(ATTEMPT_TIMEOUT_MESSAGE)
+            session.skip()
+            if recorder:
+                recorder.record_skip(session_id, session)
+            if events:
+                events.skip(event_id, session)
+            if session.remaining > 0:
+                out(remaining_message(session.remaining))
+            continue
 
-        if player_guess == target_number:
-            print("\n" + "🎉" * 20)
-            print(f"🏆 ВІТАЄМО! ВИ ВГАДАЛИ! 🏆")
-            print(f"🎯 Загадане число: {target_number}")
-            print(f"⭐ Кількість спроб: {attempt}")
+        if player_guess is None:
+            if recorder:
+                recorder.record_exit(session_id, session)
+            if events:
+                events.exit(event_id, session)
+            break
 
-            if attempt == 1:
-                print("🌟 Неймовірна удача!")
-            elif attempt <= 3:
-                print("🌟 Відмінний результат!")
-            elif attempt <= 5:
-                print("👍 Хороший результат!")
-            else:
-                print("👌 Непогано!")
+        direction = guess(player_guess)
+        if recorder:
+            recorder.record_guess(session_id, session, player_guess, direction)
+        if events:
+            events.guess(event_id, session, player_guess, direction)
 
-            print("🎉" * 20)
-            return
+        if direction == CORRECT:
+            if events:
+                events.win(event_id, session)
+            out(win_message(session.target, session.attempt))
+            break
 
-        give_hint(player_guess, target_number)
+        give_hint(player_guess, session.target, out)
 
-        remaining = MAX_ATTEMPTS - attempt
-        if remaining > 0:
-            print(f"💡 Залишилось спроб: {remaining}")
+        if session.remaining > 0:
+            out(remaining_message(session.remaining))
+    else:
+        if events:
+            events.loss(event_id, session)
+        out(loss_message(session.target))
 
-    print("\n" + "💔" * 20)
-    print("😔 УВИ, СПРОБИ ЗАКІНЧИЛИСЬ!")
-    print(f"🎯 Загадане число було: {target_number}")
-    print("🔄 Спробуйте ще раз!")
-    print("💔" * 20)
+    if metrics:
+        metrics.record_game(session)
+    return session
 
 
-def ask_play_again():
+@flushes_console
+def ask_play_again(reader=None, writer=None, metrics=None, events=None):
     """Запитує чи хоче гравець зіграти ще раз"""
+    reader = reader or console_read
+    writer = writer or console_write
+    if metrics:
+        reader = metrics.timed_reader(reader)
     while True:
-        choice = input("\n🔄 Бажаєте зіграти ще раз? (так/ні): ").lower().strip()
-        if choice in YES_ANSWERS:
-            return True
-        elif choice in NO_ANSWERS:
-            return False
-        else:
-            print("❌ Введіть 'так' або 'ні'")
+        answer = parse_answer(reader(PLAY_AGAIN_PROMPT), YES_ANSWERS, NO_ANSWERS)
+        if metrics:
+            metrics.record_replay(answer)
+        if answer is not None:
+            if events:
+                events.replay(answer)
+            return answer
+        writer(INVALID_ANSWER_MESSAGE)
 
 
-def main():
-    """Головна функція програми"""
-    print("🎮 Запуск гри 'Вгадай число'...")
+@flushes_console
+def main(reader=None, writer=None, rng=None, config=None, recorder=None, stats=None,
+         metrics=None, assist=None, resume=None, events=None):
+    """Головна функція програми. Повертає статистику сесії (SessionStats).
 
-    while True:
-        play_game()
-        if not ask_play_again():
-            print("\n👋 Дякуємо за гру! До побачення!")
-            break
+    resume - відновлена сесія (GuessEngine), з якої починається перша гра;
+    events - потік подій гри (events.EventStream).
+    Якщо reader кидає InputTimeout поза ходом гри (на запиті повтору) або
+    вичерпано час сесії, програма завершується так само, як після відмови.
+    """
+    out = writer or console_write
+    if stats is None:
+        stats = SessionStats((config or DEFAULT_CONFIG).max_attempts)
+    out(START_MESSAGE)
+
+    try:
+        while True:
+            stats.record_session(play_game(reader=reader, writer=writer, rng=rng,
+                                           config=config, recorder=recorder, metrics=metrics,
+                                           assist=assist, session=resume, events=events))
+            resume = None
+            if not ask_play_again(reader=reader, writer=writer, metrics=metrics, events=events):
+                break
+
+            out(new_game_message())
+    except InputTimeout as timeout:
+        if timeout.session is not None:
+            stats.record_session(timeout.session)
+        out(str(timeout))
+
+    out("\n" + stats.summary())
+    out(GOODBYE_MESSAGE)
+    return stats
+
+
+def run_threaded_sessions(sessions, max_workers=None):
+    """Обслуговує незалежні сесії в пулі потоків.
+
+    sessions - ітерабельний набір кортежів аргументів main():
+    (reader, writer, rng, config, recorder, stats, metrics, assist, resume, events),
+    з якого достатньо перших двох елементів; кожна сесія проходить повний
+    цикл main() без спільного глобального стану.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(main, *session) for session in sessions]
+        for future in futures:
+            future.result()
+
+
+def parse_args(argv=None):
+    """Розбирає аргументи командного рядка; args.config - GameConfig"""
+    parser = argparse.ArgumentParser(description="Гра 'Вгадай число'")
+    parser.add_argument('--min', type=int, default=MIN_NUMBER, help="нижня межа")
+    parser.add_argument('--max', type=int, default=MAX_NUMBER, help="верхня межа")
+    parser.add_argument('--attempts', type=int, default=None,
+                        help="кількість спроб (за замовчуванням - з розміру діапазону)")
+    parser.add_argument('--log', default=None, help="файл двійкового журналу ходів")
+    parser.add_argument('--wal', default=None,
+                        help="каталог журналу сесій для продовження гри після перезапуску")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed для відтворюваної послідовності загаданих чисел")
+    parser.add_argument('--assist', action='store_true',
+                        help="показувати поради оптимальної стратегії")
+    parser.add_argument('--metrics-file', default=None,
+                        help="файл для експорту метрик Prometheus після завершення")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="порт HTTP-ендпоінта /metrics на localhost")
+    parser.add_argument('--attempt-timeout', type=float, default=None,
+                        help="секунд на відповідь; пропущена відповідь коштує спробу")
+    parser.add_argument('--session-timeout', type=float, default=None,
+                        help="секунд на всю сесію гравця")
+    parser.add_argument('--events', default=None,
+                        help="JSONL-файл потоку подій гри")
+    parser.add_argument('--events-socket', default=None,
+                        help="шлях Unix-сокета для потоку подій гри")
+    parser.add_argument('--events-backpressure', choices=('drop', 'block', 'sample'),
+                        default='drop', help="поведінка при переповненні черги подій")
+    parser.add_argument('--batch', action='store_true',
+                        help="грати ігри з stdin без банерів, результати - JSONL у stdout")
+    args = parser.parse_args(argv)
+    if args.log and args.wal:
+        parser.error("--log та --wal не можна використовувати разом")
+    if any(timeout is not None and timeout <= 0
+           for timeout in (args.attempt_timeout, args.session_timeout)):
+        parser.error("Тайм-аут має бути додатним")
+    if args.batch and (args.log or args.wal or args.assist or args.metrics_file
+                       or args.metrics_port is not None or args.attempt_timeout
+                       or args.session_timeout or args.events or args.events_socket):
+        parser.error("--batch підтримує лише --min, --max, --attempts та --seed")
+    try:
+        args.config = GameConfig(args.min, args.max, args.attempts, EXIT_COMMANDS)
+    except ValueError as error:
+        parser.error(str(error))
+    if (args.log or args.wal) and not INT64_MIN <= args.min <= args.max <= INT64_MAX:
+        parser.error(f"--log та --wal зберігають числа як int64: "
+                     f"межі мають бути від {INT64_MIN} до {INT64_MAX}")
+    if (args.log or args.wal) and args.config.max_attempts > MAX_LOGGED_ATTEMPTS:
+        parser.error(f"--log та --wal підтримують не більше {MAX_LOGGED_ATTEMPTS} спроб")
+    return args
+
+
+def parse_config(argv=None):
+    """Будує GameConfig з аргументів командного рядка"""
+    return parse_args(argv).config
+
+
+def run(argv=None):
+    """Запускає консольну гру з параметрами командного рядка"""
+    args = parse_args(argv)
+    rng = None
+    if args.seed is not None:
+        from targets import TargetPool
+
+        rng = TargetPool(args.seed, args.config.min_number, args.config.max_number)
+
+    if args.batch:
+        from replay import run_batch
+
+        run_batch(rng=rng, config=args.config)
+        return
+
+    assist = None
+    if args.assist:
+        from strategy import StrategyTable
+
+        assist = StrategyTable.for_config(args.config)
+
+    game_metrics = None
+    if args.metrics_file or args.metrics_port is not None:
+        from metrics import GameMetrics
+
+        game_metrics = GameMetrics()
+        if args.metrics_port is not None:
+            game_metrics.serve_http(args.metrics_port)
+
+    events = None
+    if args.events or args.events_socket:
+        from events import EventStream, FileSink, SocketSink
+
+        sinks = [FileSink(args.events)] if args.events else []
+        if args.events_socket:
+            sinks.append(SocketSink(args.events_socket))
+        events = EventStream(sinks, backpressure=args.events_backpressure)
+
+    reader = None
+    if args.attempt_timeout is not None or args.session_timeout is not None:
+        from deadlines import DeadlineReader
+
+        reader = DeadlineReader(sys.stdin, attempt_timeout=args.attempt_timeout,
+                                session_timeout=args.session_timeout)
+
+    recorder = resume = None
+    if args.log:
+        from gamelog import GameRecorder
+
+        recorder = GameRecorder(args.log)
+    elif args.wal:
+        from wal import SessionWAL
+
+        # Ходи консольної гри рідкісні, тож кожен фіксується окремо
+        recorder = SessionWAL(args.wal, group_size=1)
+        # Сесія з іншими межами чи кількістю спроб не продовжується
+        resume = recorder.resumable(args.config)
 
-        print("\n" + "🔄" * 30)
-        print("Початок нової гри!")
-        print("🔄" * 30)
+    try:
+        main(reader=reader, rng=rng, config=args.config, recorder=recorder,
+             metrics=game_metrics, assist=assist, resume=resume, events=events)
+    finally:
+        if reader:
+            reader.close()
+        if events:
+            events.close()
+        if recorder:
+            recorder.close()
+        if args.metrics_file:
+            game_metrics.write_textfile(args.metrics_file)
 
 
 if __name__ == "__main__":
-    main()
+    run()
@@ -0,0 +1,210 @@
+"""Необов'язкова інструментація ігрового циклу з експортом у Prometheus.
+
+GameMetrics передається в play_game(), get_player_guess(),
+ask_play_again() та main() параметром metrics. Без нього код гри не
+виконує жодної додаткової роботи, крім перевірки на None. Увімкнені
+метрики обгортають reader, розбір введення, хід рушія та writer
+таймерами perf_counter_ns.
+
+Лічильники зберігаються в окремому накопичувачі для кожного потоку, тому
+оновлення не потребують замків; замок потрібен лише для реєстрації
+нового потоку та під час експорту, який підсумовує всі накопичувачі.
+"""
+
+import os
+import threading
+import time
+
+from engine import GUESS_EXIT, GUESS_INVALID, GUESS_OK, GUESS_OUT_OF_RANGE
+
+# === ФАЗИ ===
+PHASE_INPUT_WAIT = 'input_wait'
+PHASE_VALIDATION = 'validation'
+PHASE_LOGIC = 'logic'
+PHASE_RENDER = 'render'
+PHASES = (PHASE_INPUT_WAIT, PHASE_VALIDATION, PHASE_LOGIC, PHASE_RENDER)
+
+INPUT_STATUSES = (GUESS_OK, GUESS_INVALID, GUESS_OUT_OF_RANGE, GUESS_EXIT)
+REPLAY_ANSWERS = ('yes', 'no', 'invalid')
+
+PREFIX = 'guess_game'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class _Shard:
+    """Накопичувач одного потоку"""
+
+    __slots__ = ('phase_ns', 'phase_calls', 'inputs', 'wins_by_attempt',
+                 'losses', 'exits', 'replay')
+
+    def __init__(self):
+        self.phase_ns = dict.fromkeys(PHASES, 0)
+        self.phase_calls = dict.fromkeys(PHASES, 0)
+        self.inputs = dict.fromkeys(INPUT_STATUSES, 0)
+        self.wins_by_attempt = {}
+        self.losses = 0
+        self.exits = 0
+        self.replay = dict.fromkeys(REPLAY_ANSWERS, 0)
+
+
+class GameMetrics:
+    """Реєстр метрик гри з накопичувачами на кожен потік"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def shard(self):
+        """Повертає накопичувач поточного потоку"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    # === ОБГОРТКИ ГАРЯЧОГО ШЛЯХУ ===
+
+    def timed(self, phase, func):
+        """Обгортає func таймером фази phase"""
+        shard = self.shard()
+        phase_ns, phase_calls = shard.phase_ns, shard.phase_calls
+        clock = time.perf_counter_ns
+
+        def wrapper(*args):
+            start = clock()
+            try:
+                return func(*args)
+            finally:
+                phase_ns[phase] += clock() - start
+                phase_calls[phase] += 1
+
+        return wrapper
+
+    def timed_reader(self, reader):
+        """Обгортає reader: час очікування гравця"""
+        return self.timed(PHASE_INPUT_WAIT, reader)
+
+    def instrument_parse(self, parse):
+        """Обгортає розбір введення: час валідації та лічильники статусів"""
+        timed_parse = self.timed(PHASE_VALIDATION, parse)
+        inputs = self.shard().inputs
+
+        def wrapper(*args):
+            status, value = timed_parse(*args)
+            inputs[status] += 1
+            return status, value
+
+        return wrapper
+
+    def record_game(self, session):
+        """Враховує результат сесії GuessEngine"""
+        shard = self.shard()
+        if session.won:
+            attempt = session.attempt
+            shard.wins_by_attempt[attempt] = shard.wins_by_attempt.get(attempt, 0) + 1
+        elif session.lost:
+            shard.losses += 1
+        else:
+            shard.exits += 1
+
+    def record_replay(self, answer):
+        """Враховує відповідь на запит повтору (True, False або None)"""
+        key = 'invalid' if answer is None else ('yes' if answer else 'no')
+        self.shard().replay[key] += 1
+
+    # === ЕКСПОРТ ===
+
+    def snapshot(self):
+        """Підсумовує накопичувачі всіх потоків"""
+        total = _Shard()
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for phase in PHASES:
+                total.phase_ns[phase] += shard.phase_ns[phase]
+                total.phase_calls[phase] += shard.phase_calls[phase]
+            for status in INPUT_STATUSES:
+                total.inputs[status] += shard.inputs[status]
+            for attempt, count in list(shard.wins_by_attempt.items()):
+                total.wins_by_attempt[attempt] = total.wins_by_attempt.get(attempt, 0) + count
+            total.losses += shard.losses
+            total.exits += shard.exits
+            for answer in REPLAY_ANSWERS:
+                total.replay[answer] += shard.replay[answer]
+        return total
+
+    def render_prometheus(self):
+        """Повертає метрики у текстовому форматі Prometheus"""
+        total = self.snapshot()
+        lines = [
+            f"# HELP {PREFIX}_phase_seconds Час, витрачений у фазах ігрового циклу",
+            f"# TYPE {PREFIX}_phase_seconds summary",
+        ]
+        for phase in PHASES:
+            lines.append(f'{PREFIX}_phase_seconds_sum{{phase="{phase}"}} {total.phase_ns[phase] / 1e9:.9f}')
+            lines.append(f'{PREFIX}_phase_seconds_count{{phase="{phase}"}} {total.phase_calls[phase]}')
+
+        lines += [
+            f"# HELP {PREFIX}_inputs_total Розібрані введення за статусом",
+            f"# TYPE {PREFIX}_inputs_total counter",
+        ]
+        for status in INPUT_STATUSES:
+            lines.append(f'{PREFIX}_inputs_total{{status="{status}"}} {total.inputs[status]}')
+
+        won = sum(total.wins_by_attempt.values())
+        lines += [
+            f"# HELP {PREFIX}_games_total Завершені ігри за результатом",
+            f"# TYPE {PREFIX}_games_total counter",
+            f'{PREFIX}_games_total{{outcome="win"}} {won}',
+            f'{PREFIX}_games_total{{outcome="loss"}} {total.losses}',
+            f'{PREFIX}_games_total{{outcome="exit"}} {total.exits}',
+            f"# HELP {PREFIX}_wins_by_attempt_total Перемоги за номером спроби",
+            f"# TYPE {PREFIX}_wins_by_attempt_total counter",
+        ]
+        for attempt in sorted(total.wins_by_attempt):
+            lines.append(f'{PREFIX}_wins_by_attempt_total{{attempt="{attempt}"}} '
+                         f'{total.wins_by_attempt[attempt]}')
+
+        lines += [
+            f"# HELP {PREFIX}_replay_answers_total Відповіді на запит повтору гри",
+            f"# TYPE {PREFIX}_replay_answers_total counter",
+        ]
+        for answer in REPLAY_ANSWERS:
+            lines.append(f'{PREFIX}_replay_answers_total{{answer="{answer}"}} {total.replay[answer]}')
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Атомарно записує метрики у файл (для node_exporter textfile)"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(self.render_prometheus())
+        os.replace(temp_path, path)
+
+    def serve_http(self, port, host='127.0.0.1'):
+        """Запускає HTTP-ендпоінт /metrics у фоновому потоці"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
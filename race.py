@@ -0,0 +1,257 @@
+"""Режим гонки: багато гравців одночасно вгадують одне число.
+
+Гравці підключаються до TCP-сервера (рядковий протокол, як у server.py)
+і потрапляють у кімнату до room_size гравців. У кімнаті одне загадане
+число (random.randint через main.new_session) на раунд; кожен гравець має
+власні MAX_ATTEMPTS спроб і отримує особисту підказку give_hint(). Усі
+бачать спільну стрічку: хто що назвав і як звузився діапазон. Перша
+правильна здогадка виграє раунд; якщо спроби вичерпали всі, число
+розкривається. Далі одразу починається новий раунд.
+
+Розсилка пакетується на такт циклу подій: рядки стрічки накопичуються,
+а Room._flush (запланований через call_soon один раз на такт) кодує їх
+один раз і записує ті самі байти всім підписникам. Підписник, що не
+встигає читати (буфер надсилання понад MAX_SUBSCRIBER_BUFFER),
+відключається, щоб не тримати пам'ять кімнати.
+
+Запуск: python race.py --port 8766 --room-size 100
+"""
+
+import argparse
+import asyncio
+from contextlib import suppress
+
+from engine import CORRECT, GUESS_EXIT, GUESS_INVALID, GUESS_OUT_OF_RANGE, TOO_SMALL
+from main import (
+    DEFAULT_CONFIG, EXIT_COMMANDS, GOODBYE_MESSAGE, INVALID_NUMBER_MESSAGE, give_hint,
+    new_session, out_of_range_message, remaining_message,
+)
+from server import BACKLOG, DEFAULT_HOST, MAX_LINE_LENGTH, Connection
+
+DEFAULT_PORT = 8766
+DEFAULT_ROOM_SIZE = 100
+MAX_SUBSCRIBER_BUFFER = 1 << 20
+
+# === ПОВІДОМЛЕННЯ ===
+RACE_WELCOME_TEMPLATE = ("🏁 Гонка 'Вгадай число': кімната %d, ви - гравець %d. "
+                         "Перший, хто вгадає число, перемагає. У кожного %d спроб.")
+ROUND_TEMPLATE = "🔄 Раунд %d: число від %d до %d"
+FEED_TEMPLATE = "📣 Гравець %d: %d -> діапазон %d-%d"
+WINNER_TEMPLATE = "🏆 Гравець %d вгадав число %d зі спроби %d!"
+NOBODY_TEMPLATE = "💔 Ніхто не вгадав: було загадано %d."
+JOINED_TEMPLATE = "👋 Гравець %d приєднався (гравців: %d)"
+LEFT_TEMPLATE = "🚪 Гравець %d вийшов (гравців: %d)"
+OUT_OF_ATTEMPTS_MESSAGE = "⌛ Ваші спроби закінчились, чекайте наступного раунду."
+
+
+class Player:
+    """Учасник кімнати з власною сесією GuessEngine на поточний раунд"""
+
+    __slots__ = ('id', 'conn', 'session')
+
+    def __init__(self, player_id, conn, session):
+        self.id = player_id
+        self.conn = conn
+        self.session = session
+
+
+class Room:
+    """Кімната гонки: спільне число, спільний діапазон і пакетна розсилка"""
+
+    __slots__ = ('number', 'config', 'rng', 'players', 'round', 'target', 'low', 'high',
+                 'broadcasts', 'broadcast_bytes', 'kicked', '_next_player', '_pending',
+                 '_scheduled')
+
+    def __init__(self, number, rng=None, config=None):
+        self.number = number
+        self.config = config or DEFAULT_CONFIG
+        self.rng = rng
+        self.players = {}
+        self.round = 0
+        self.broadcasts = 0
+        self.broadcast_bytes = 0
+        self.kicked = 0
+        self._next_player = 1
+        self._pending = []
+        self._scheduled = False
+        self._new_round()
+
+    def _new_round(self):
+        self.round += 1
+        self.target = new_session(self.rng, self.config).target
+        self.low = self.config.min_number
+        self.high = self.config.max_number
+        for player in self.players.values():
+            player.session = self.config.new_session(self.target)
+
+    # === РОЗСИЛКА ===
+
+    def publish(self, line):
+        """Додає рядок у стрічку; розсилка - один раз наприкінці такту"""
+        self._pending.append(line)
+        if not self._scheduled:
+            self._scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self):
+        self._scheduled = False
+        if not self._pending:
+            return
+        data = ('\n'.join(self._pending) + '\n').encode()
+        self._pending.clear()
+        self.broadcasts += 1
+        self.broadcast_bytes += len(data)
+        for player in list(self.players.values()):
+            transport = player.conn.writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > MAX_SUBSCRIBER_BUFFER:
+                self.kicked += 1
+                transport.abort()
+                continue
+            player.conn.writer.write(data)
+
+    # === ГРАВЦІ ===
+
+    def join(self, conn):
+        """Додає гравця до кімнати та повертає Player"""
+        player = Player(self._next_player, conn, self.config.new_session(self.target))
+        self._next_player += 1
+        self.players[player.id] = player
+        conn.send(RACE_WELCOME_TEMPLATE % (self.number, player.id, self.config.max_attempts),
+                  ROUND_TEMPLATE % (self.round, self.low, self.high))
+        self.publish(JOINED_TEMPLATE % (player.id, len(self.players)))
+        return player
+
+    def leave(self, player):
+        """Прибирає гравця; раунд закінчується, якщо решта вже без спроб"""
+        if self.players.pop(player.id, None) is None:
+            return
+        self.publish(LEFT_TEMPLATE % (player.id, len(self.players)))
+        self._finish_if_exhausted()
+
+    def guess(self, player, number):
+        """Зараховує здогадку гравця (число вже перевірене на діапазон)"""
+        session = player.session
+        if session.finished:
+            player.conn.send(OUT_OF_ATTEMPTS_MESSAGE)
+            return
+
+        direction = session.guess(number)
+        give_hint(number, self.target, player.conn.send)
+        if direction == CORRECT:
+            self.publish(WINNER_TEMPLATE % (player.id, number, session.attempt))
+            self._start_next_round()
+            return
+
+        if direction == TOO_SMALL:
+            self.low = max(self.low, number + 1)
+        else:
+            self.high = min(self.high, number - 1)
+        self.publish(FEED_TEMPLATE % (player.id, number, self.low, self.high))
+        if session.remaining > 0:
+            player.conn.send(remaining_message(session.remaining))
+        else:
+            player.conn.send(OUT_OF_ATTEMPTS_MESSAGE)
+            self._finish_if_exhausted()
+
+    def _finish_if_exhausted(self):
+        if self.players and all(player.session.finished for player in self.players.values()):
+            self.publish(NOBODY_TEMPLATE % self.target)
+            self._start_next_round()
+
+    def _start_next_round(self):
+        self._new_round()
+        self.publish(ROUND_TEMPLATE % (self.round, self.low, self.high))
+
+
+class Lobby:
+    """Розподіляє гравців по кімнатах не більше ніж room_size гравців"""
+
+    def __init__(self, room_size=DEFAULT_ROOM_SIZE, rng=None, config=None):
+        if room_size < 1:
+            raise ValueError(f"Розмір кімнати має бути додатним: {room_size}")
+        self.room_size = room_size
+        self.rng = rng
+        self.config = config
+        self.rooms = []
+        self._next_room = 1
+
+    def room_for_player(self):
+        """Повертає кімнату з вільним місцем (за потреби створює нову)"""
+        for room in self.rooms:
+            if len(room.players) < self.room_size:
+                return room
+        room = Room(self._next_room, self.rng, self.config)
+        self._next_room += 1
+        self.rooms.append(room)
+        return room
+
+    def release(self, room):
+        """Прибирає порожню кімнату"""
+        if not room.players and room in self.rooms:
+            self.rooms.remove(room)
+
+
+async def handle_player(reader, writer, lobby):
+    """Обслуговує одного гравця до виходу або розриву з'єднання"""
+    conn = Connection(reader, writer)
+    room = lobby.room_for_player()
+    player = room.join(conn)
+    config = room.config
+    try:
+        while True:
+            status, value = config.parse_guess(await conn.read_line(), EXIT_COMMANDS)
+            if status == GUESS_EXIT:
+                conn.send(GOODBYE_MESSAGE)
+                await conn.flush()
+                break
+            if status == GUESS_INVALID:
+                conn.send(INVALID_NUMBER_MESSAGE)
+            elif status == GUESS_OUT_OF_RANGE:
+                conn.send(out_of_range_message(room.config))
+            else:
+                room.guess(player, value)
+    except (EOFError, ConnectionError):
+        pass
+    finally:
+        room.leave(player)
+        lobby.release(room)
+        writer.close()
+        with suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, lobby=None, **kwargs):
+    """Запускає сервер гонки та повертає asyncio.Server"""
+    lobby = lobby or Lobby()
+    kwargs.setdefault('limit', MAX_LINE_LENGTH)
+    kwargs.setdefault('backlog', BACKLOG)
+    return await asyncio.start_server(lambda reader, writer: handle_player(reader, writer, lobby),
+                                      host, port, **kwargs)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, room_size=DEFAULT_ROOM_SIZE):
+    """Обслуговує гравців до зупинки процесу"""
+    server = await start_server(host, port, Lobby(room_size))
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Точка входу командного рядка"""
+    parser = argparse.ArgumentParser(description="Гонка 'Вгадай число' для багатьох гравців")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--room-size', type=int, default=DEFAULT_ROOM_SIZE,
+                        help="найбільша кількість гравців в одній кімнаті")
+    args = parser.parse_args(argv)
+    if args.room_size < 1:
+        parser.error("--room-size має бути додатним")
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, args.room_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Пакетний режим: ігри з каналу stdin, результати у форматі JSONL.
+
+Введення тлумачиться так само, як у main(): рядки здогадок однієї гри
+(некоректні та поза діапазоном ігноруються, EXIT_COMMANDS завершують
+гру), після завершеної гри - відповіді на запит повтору
+(YES_ANSWERS/NO_ANSWERS, інші рядки ігноруються). Відповідь "ні" або
+кінець введення завершує обробку; гра, обірвана кінцем введення, не
+виводиться. Банери та запрошення не друкуються.
+
+Конвеєр генераторів: рядки потоку -> play_transcripts() (кортежі
+результатів) -> encode_results() (рядки JSON) -> write_results()
+(запис пакетами). Пам'ять стала: зберігається лише поточна гра та
+один пакет виводу.
+
+Запуск: python main.py --batch < transcripts.txt > results.jsonl
+"""
+
+import random
+import sys
+
+from engine import GUESS_EXIT, GUESS_OK
+from main import DEFAULT_CONFIG, EXIT_COMMANDS, NO_ANSWERS, YES_ANSWERS
+
+OUTCOME_WIN = 'win'
+OUTCOME_LOSS = 'loss'
+OUTCOME_EXIT = 'exit'
+# Компактний JSON без json.dumps: поля - лише цілі числа та сталі рядки
+RESULT_TEMPLATE = '{"target":%d,"guesses":[%s],"outcome":"%s","attempts":%d}\n'
+DEFAULT_BATCH_GAMES = 4096
+
+
+def play_transcripts(lines, rng=None, config=None):
+    """Грає ігри за рядками введення; видає (target, guesses, outcome) кожної гри"""
+    config = config or DEFAULT_CONFIG
+    parse = config.parse_guess
+    randint = (rng or random).randint
+    min_number, max_number = config.min_number, config.max_number
+    max_length = config.max_length
+
+    max_attempts = config.max_attempts
+    # Відповіді на запит повтору з тим самим нормуванням, що й у parse_answer
+    answers = {**dict.fromkeys(YES_ANSWERS, True), **dict.fromkeys(NO_ANSWERS, False)}
+
+    lines = iter(lines)
+    while True:
+        # Правила ходу ті самі, що й у engine.GuessEngine; межі low/high
+        # для результату не потрібні, тож стан гри - загадане число та здогадки
+        target = randint(min_number, max_number)
+        guesses = []
+        outcome = OUTCOME_LOSS
+        for line in lines:
+            try:
+                # Швидкий шлях для короткого числа; int() сам ігнорує "\r\n",
+                # а решту випадків розбирає parse_guess
+                if len(line) > max_length:
+                    raise ValueError
+                value = int(line)
+            except ValueError:
+                status, value = parse(line.rstrip('\r\n'), EXIT_COMMANDS)
+                if status == GUESS_EXIT:
+                    outcome = OUTCOME_EXIT
+                    break
+                if status != GUESS_OK:
+                    continue
+            else:
+                if value < min_number or value > max_number:
+                    continue
+            guesses.append(value)
+            if value == target:
+                outcome = OUTCOME_WIN
+                break
+            if len(guesses) >= max_attempts:
+                break
+        else:
+            return
+        yield target, guesses, outcome
+
+        for line in lines:
+            answer = answers.get(line.lower().strip())
+            if answer is not None:
+                break
+        else:
+            return
+        if not answer:
+            return
+
+
+def encode_results(results):
+    """Перетворює результати play_transcripts() на рядки JSONL"""
+    for target, guesses, outcome in results:
+        yield RESULT_TEMPLATE % (target, ','.join(map(str, guesses)), outcome, len(guesses))
+
+
+def write_results(encoded, out, batch_games=DEFAULT_BATCH_GAMES):
+    """Записує рядки пакетами по batch_games; повертає кількість ігор"""
+    batch = []
+    games = 0
+    for line in encoded:
+        batch.append(line)
+        if len(batch) >= batch_games:
+            out.write(''.join(batch))
+            games += len(batch)
+            batch.clear()
+    if batch:
+        out.write(''.join(batch))
+        games += len(batch)
+    return games
+
+
+def run_batch(source=None, out=None, rng=None, config=None):
+    """Обробляє всі ігри з source (stdin) у out (stdout); повертає кількість ігор"""
+    source = source or sys.stdin
+    out = out or sys.stdout
+    games = write_results(encode_results(play_transcripts(source, rng, config)), out)
+    out.flush()
+    return games
@@ -0,0 +1,319 @@
+"""Асинхронний TCP-сервер гри 'Вгадай число'.
+
+Протокол рядковий: сервер надсилає ті самі повідомлення та запрошення,
+що й консольна гра, кожне завершене символом нового рядка (UTF-8).
+Клієнт відповідає одним рядком на кожне запрошення. Кожне з'єднання -
+окрема сесія з тими самими правилами виходу (EXIT_COMMANDS) та повтору
+гри (YES_ANSWERS/NO_ANSWERS), що й у main.py.
+
+Дедлайни (--attempt-timeout, --session-timeout) діють як у
+deadlines.DeadlineReader: пропущена відповідь коштує спробу, вичерпаний
+час сесії закриває з'єднання. Усі очікування відповідей мультиплексує
+один цикл подій, тож мовчазний клієнт не тримає ні потоку, ні сокета
+довше за дедлайн.
+
+Запуск: python server.py --host 127.0.0.1 --port 8765
+"""
+
+import argparse
+import asyncio
+import functools
+import itertools
+import signal
+from contextlib import suppress
+
+from engine import CORRECT, GUESS_EXIT, GUESS_INVALID, GUESS_OUT_OF_RANGE, parse_answer
+from deadlines import next_timeout
+from main import (
+    ATTEMPT_TIMEOUT_MESSAGE, DEFAULT_CONFIG, EXIT_COMMANDS, GOODBYE_MESSAGE,
+    INVALID_ANSWER_MESSAGE, INVALID_NUMBER_MESSAGE, MAX_ATTEMPTS, NO_ANSWERS, InputTimeout,
+    PLAY_AGAIN_PROMPT, START_MESSAGE, YES_ANSWERS, attempt_message,
+    guess_prompt, hint_message, loss_message, new_game_message, new_session,
+    out_of_range_message, remaining_message, welcome_message, win_message,
+)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+# Довші рядки відкидаються як некоректне введення ще до розбору
+MAX_LINE_LENGTH = 1024
+BACKLOG = 4096
+# Скільки секунд активні сесії можуть дограватися після сигналу зупинки
+DEFAULT_DRAIN_TIMEOUT = 30.0
+
+
+class Connection:
+    """З'єднання з клієнтом, що збирає вивід ходу в один запис"""
+
+    __slots__ = ('reader', 'writer', 'pending', 'attempt_timeout', 'deadline', '_discarding')
+
+    def __init__(self, reader, writer, attempt_timeout=None, session_timeout=None):
+        self.reader = reader
+        self.writer = writer
+        self.pending = []
+        self.attempt_timeout = attempt_timeout
+        self.deadline = None
+        self._discarding = False
+        if session_timeout is not None:
+            self.deadline = asyncio.get_running_loop().time() + session_timeout
+
+    def send(self, *messages):
+        """Додає повідомлення до виводу поточного ходу"""
+        self.pending.extend(messages)
+
+    async def flush(self):
+        """Надсилає накопичений вивід клієнту одним записом"""
+        if self.pending:
+            self.pending.append('')
+            self.writer.write('\n'.join(self.pending).encode())
+            self.pending.clear()
+            await self.writer.drain()
+
+    async def read_line(self):
+        """Надсилає вивід ходу та читає рядок.
+
+        При розриві кидає EOFError, після дедлайну - InputTimeout.
+        """
+        await self.flush()
+        timeout, session_expired = next_timeout(
+            self.attempt_timeout, self.deadline, asyncio.get_running_loop().time())
+        try:
+            line = await asyncio.wait_for(self._readline(), timeout)
+        except asyncio.TimeoutError:
+            raise InputTimeout(session_expired) from None
+        if line is None:
+            return ''
+        if not line:
+            raise EOFError
+        return line.decode(errors='replace').rstrip('\r\n')
+
+    async def _readline(self):
+        """Рядок з роздільником, b'' при розриві або None для надто довгого рядка"""
+        reader = self.reader
+        if not self._discarding:
+            try:
+                return await reader.readuntil(b'\n')
+            except asyncio.IncompleteReadError as error:
+                return error.partial
+            except asyncio.LimitOverrunError:
+                self._discarding = True
+        # Рядок довший за ліміт StreamReader: відкидаємо його до символу
+        # нового рядка, навіть якщо той ще не надійшов, щоб хвіст не став
+        # наступною відповіддю (як DeadlineReader._discarding); стан
+        # переживає тайм-аут посеред відкидання
+        try:
+            while True:
+                try:
+                    await reader.readuntil(b'\n')
+                    self._discarding = False
+                    return None
+                except asyncio.LimitOverrunError as error:
+                    await reader.readexactly(error.consumed)
+        except asyncio.IncompleteReadError:
+            return b''
+
+
+async def get_player_guess(conn, attempt_num):
+    """Мережевий аналог main.get_player_guess"""
+    while True:
+        conn.send(attempt_message(attempt_num, MAX_ATTEMPTS), guess_prompt())
+        status, value = DEFAULT_CONFIG.parse_guess(await conn.read_line(), EXIT_COMMANDS)
+
+        if status == GUESS_EXIT:
+            conn.send(GOODBYE_MESSAGE)
+            return None
+
+        if status == GUESS_INVALID:
+            conn.send(INVALID_NUMBER_MESSAGE)
+            continue
+
+        if status == GUESS_OUT_OF_RANGE:
+            conn.send(out_of_range_message())
+            continue
+
+        return value
+
+
+async def play_game(conn, rng=None):
+    """Мережевий аналог main.play_game"""
+    session = new_session(rng)
+    conn.send(welcome_message())
+
+    while not session.finished:
+        try:
+            player_guess = await get_player_guess(conn, session.attempt + 1)
+        except InputTimeout as timeout:
+            if timeout.session_expired:
+                raise
+            conn.send(ATTEMPT_TIMEOUT_MESSAGE)
+            session.skip()
+            if session.remaining > 0:
+                conn.send(remaining_message(session.remaining))
+            continue
+
+        if player_guess is None:
+            return session
+
+        if session.guess(player_guess) == CORRECT:
+            conn.send(win_message(session.target, session.attempt))
+            return session
+
+        conn.send(hint_message(player_guess, session.target))
+        if session.remaining > 0:
+            conn.send(remaining_message(session.remaining))
+
+    conn.send(loss_message(session.target))
+    return session
+
+
+async def ask_play_again(conn):
+    """Мережевий аналог main.ask_play_again"""
+    while True:
+        conn.send(PLAY_AGAIN_PROMPT)
+        answer = parse_answer(await conn.read_line(), YES_ANSWERS, NO_ANSWERS)
+        if answer is not None:
+            return answer
+        conn.send(INVALID_ANSWER_MESSAGE)
+
+
+async def handle_client(reader, writer, rng=None, attempt_timeout=None, session_timeout=None):
+    """Обслуговує одне з'єднання: послідовність ігор до відмови гравця"""
+    conn = Connection(reader, writer, attempt_timeout, session_timeout)
+    try:
+        conn.send(START_MESSAGE)
+
+        try:
+            while True:
+                await play_game(conn, rng)
+                if not await ask_play_again(conn):
+                    break
+
+                conn.send(new_game_message())
+        except InputTimeout as timeout:
+            conn.send(str(timeout))
+        conn.send("\n" + GOODBYE_MESSAGE)
+        await conn.flush()
+    except (EOFError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+        with suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+def seeded_handler(seed, worker=None, **timeouts):
+    """Обробник, що дає кожному з'єднанню власний відтворюваний TargetPool"""
+    from targets import TargetPool
+
+    connection_ids = itertools.count()
+
+    async def handler(reader, writer):
+        index = next(connection_ids)
+        if worker is not None:
+            index = (worker, index)
+        rng = TargetPool.for_session(seed, index, pool_size=256)
+        await handle_client(reader, writer, rng, **timeouts)
+
+    return handler
+
+
+def tracked_handler(handler, active):
+    """Обробник, що тримає задачі активних з'єднань у множині active"""
+
+    async def tracked(reader, writer):
+        task = asyncio.current_task()
+        active.add(task)
+        try:
+            await handler(reader, writer)
+        finally:
+            active.discard(task)
+
+    return tracked
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, seed=None, worker=None,
+                       active=None, attempt_timeout=None, session_timeout=None, **kwargs):
+    """Запускає сервер та повертає asyncio.Server.
+
+    seed - якщо задано, n-те з'єднання отримує загадані числа з
+    TargetPool.for_session(seed, n) замість спільного модуля random
+    (у процесі-обробнику worker кластера - з ключем (worker, n));
+    active - множина, в якій зберігаються задачі активних з'єднань;
+    attempt_timeout, session_timeout - дедлайни відповіді та з'єднання, с.
+    """
+    kwargs.setdefault('limit', MAX_LINE_LENGTH)
+    kwargs.setdefault('backlog', BACKLOG)
+    timeouts = {'attempt_timeout': attempt_timeout, 'session_timeout': session_timeout}
+    if seed is None:
+        handler = functools.partial(handle_client, **timeouts)
+    else:
+        handler = seeded_handler(seed, worker, **timeouts)
+    if active is not None:
+        handler = tracked_handler(handler, active)
+    return await asyncio.start_server(handler, host, port, **kwargs)
+
+
+async def drain(server, active, timeout=DEFAULT_DRAIN_TIMEOUT):
+    """Припиняє приймати з'єднання та чекає завершення активних сесій.
+
+    Сесії, що не завершились за timeout секунд, скасовуються.
+    """
+    server.close()
+    if active:
+        _, pending = await asyncio.wait(set(active), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, seed=None,
+                drain_timeout=DEFAULT_DRAIN_TIMEOUT, **kwargs):
+    """Обслуговує клієнтів до SIGTERM/SIGINT, після чого дограє активні сесії"""
+    active = set()
+    server = await start_server(host, port, seed, active=active, **kwargs)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+
+    async with server:
+        await stop.wait()
+        await drain(server, active, drain_timeout)
+
+
+def main(argv=None):
+    """Точка входу командного рядка"""
+    parser = argparse.ArgumentParser(description="TCP-сервер гри 'Вгадай число'")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed для відтворюваних загаданих чисел кожного з'єднання")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="кількість процесів-обробників на одному порту (SO_REUSEPORT)")
+    parser.add_argument('--drain-timeout', type=float, default=DEFAULT_DRAIN_TIMEOUT,
+                        help="скільки секунд дограють активні сесії після зупинки")
+    parser.add_argument('--attempt-timeout', type=float, default=None,
+                        help="секунд на відповідь; пропущена відповідь коштує спробу")
+    parser.add_argument('--session-timeout', type=float, default=None,
+                        help="секунд на все з'єднання")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers має бути додатним")
+    if any(timeout is not None and timeout <= 0
+           for timeout in (args.attempt_timeout, args.session_timeout)):
+        parser.error("Тайм-аут має бути додатним")
+    timeouts = {'attempt_timeout': args.attempt_timeout,
+                'session_timeout': args.session_timeout}
+
+    if args.workers > 1:
+        from cluster import Supervisor
+
+        Supervisor(args.workers, args.host, args.port, args.seed, args.drain_timeout,
+                   **timeouts).run()
+        return
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, args.seed, args.drain_timeout, **timeouts))
+
+
+if __name__ == "__main__":
+    main()
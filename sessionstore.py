@@ -0,0 +1,117 @@
+"""Сховище ігрових сесій з обмеженням розміру, LRU та тайм-аутом простою.
+
+Для хостів, що тримають багато сесій play_game() за ідентифікатором:
+гравці, які пішли без команди виходу, не повинні накопичуватись.
+Записи лежать в OrderedDict у порядку останнього звернення, тож і
+найдавніше використаний запис (LRU), і записи з вичерпаним тайм-аутом
+простою завжди на початку: витіснення та очищення - O(1) на запис.
+Кожна сесія витісняється не більше одного разу, тому очищення під час
+put() амортизовано O(1).
+"""
+
+import sys
+import time
+from collections import OrderedDict
+
+# Приблизні накладні витрати на запис: вузол OrderedDict, ключ та список стану
+ENTRY_OVERHEAD = 200
+
+EVICT_CAPACITY = 'capacity'
+EVICT_MEMORY = 'memory'
+EVICT_IDLE = 'idle'
+
+
+def default_sizeof(session):
+    """Оцінка розміру запису в байтах"""
+    return sys.getsizeof(session) + ENTRY_OVERHEAD
+
+
+class SessionStore:
+    """Обмежене сховище сесій: capacity записів, max_bytes байтів, idle_ttl секунд.
+
+    on_evict(session_id, session, reason) викликається для кожної
+    витісненої сесії (reason - EVICT_CAPACITY, EVICT_MEMORY або EVICT_IDLE),
+    щоб хост міг закрити з'єднання гравця.
+    """
+
+    __slots__ = ('capacity', 'idle_ttl', 'max_bytes', 'sizeof', 'clock', 'on_evict',
+                 'bytes_used', 'evictions', '_entries')
+
+    def __init__(self, capacity=100_000, idle_ttl=None, max_bytes=None,
+                 sizeof=default_sizeof, clock=time.monotonic, on_evict=None):
+        if capacity < 1:
+            raise ValueError(f"Місткість має бути додатною: {capacity}")
+        self.capacity = capacity
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.clock = clock
+        self.on_evict = on_evict
+        self.bytes_used = 0
+        self.evictions = dict.fromkeys((EVICT_CAPACITY, EVICT_MEMORY, EVICT_IDLE), 0)
+        # session_id -> [session, last_access, size]
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, session_id):
+        return session_id in self._entries
+
+    def _evict_oldest(self, reason):
+        session_id, (session, _, size) = self._entries.popitem(last=False)
+        self.bytes_used -= size
+        self.evictions[reason] += 1
+        if self.on_evict:
+            self.on_evict(session_id, session, reason)
+
+    def expire(self, now=None):
+        """Витісняє сесії, що простоювали довше idle_ttl. Повертає їх кількість"""
+        if self.idle_ttl is None:
+            return 0
+        deadline = (self.clock() if now is None else now) - self.idle_ttl
+        entries = self._entries
+        expired = 0
+        while entries and next(iter(entries.values()))[1] <= deadline:
+            self._evict_oldest(EVICT_IDLE)
+            expired += 1
+        return expired
+
+    def put(self, session_id, session):
+        """Додає або замінює сесію; за потреби витісняє найдавніші"""
+        now = self.clock()
+        self.expire(now)
+        size = self.sizeof(session)
+        entries = self._entries
+        previous = entries.pop(session_id, None)
+        if previous is not None:
+            self.bytes_used -= previous[2]
+        entries[session_id] = [session, now, size]
+        self.bytes_used += size
+
+        while len(entries) > self.capacity:
+            self._evict_oldest(EVICT_CAPACITY)
+        if self.max_bytes is not None:
+            while self.bytes_used > self.max_bytes and len(entries) > 1:
+                self._evict_oldest(EVICT_MEMORY)
+
+    def get(self, session_id, default=None):
+        """Повертає сесію та оновлює час звернення; прострочена сесія витісняється"""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return default
+        now = self.clock()
+        if self.idle_ttl is not None and entry[1] <= now - self.idle_ttl:
+            self.expire(now)
+            return default
+        entry[1] = now
+        self._entries.move_to_end(session_id)
+        return entry[0]
+
+    def pop(self, session_id, default=None):
+        """Видаляє сесію (завершена гра) без обліку як витіснення"""
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return default
+        self.bytes_used -= entry[2]
+        return entry[0]
@@ -0,0 +1,188 @@
+"""Таблиця сесій у вигляді паралельних масивів (struct-of-arrays).
+
+Замість об'єкта GuessEngine на кожну гру стан мільйона одночасних ігор
+зберігається в кількох стовпцях array.array, проіндексованих номером
+слоту: загадане число, межі low/high, номер спроби та статус. Звільнені
+слоти повертаються у стек вільних слотів і перевикористовуються.
+Поодинокий хід - це читання та кілька записів у масиви за індексом;
+пакет ходів різних сесій (guess_many) виконується NumPy-операціями над
+представленнями тих самих масивів без копіювання.
+
+Числа займають 4 байти, якщо діапазон вміщується в int32, інакше 8:
+мільйон сесій 1-100 - 19 МБ (19 байт на слот) разом зі стеком вільних слотів.
+Правила ходу ті самі, що й у engine.GuessEngine.
+"""
+
+from array import array
+
+import numpy as np
+
+from engine import CORRECT, GuessEngine, TOO_SMALL
+from main import MAX_ATTEMPTS, MAX_NUMBER, MIN_NUMBER
+
+# === СТАТУСИ СЛОТІВ ===
+STATUS_FREE = 0
+STATUS_ACTIVE = 1
+STATUS_WON = 2
+STATUS_LOST = 3
+
+INT32_MIN, INT32_MAX = -2**31, 2**31 - 1
+
+
+class TableFullError(RuntimeError):
+    """У таблиці немає вільних слотів"""
+
+
+class SessionTable:
+    """Стан до capacity одночасних ігор з однаковими налаштуваннями"""
+
+    __slots__ = ('capacity', 'min_number', 'max_number', 'max_attempts',
+                 'target', 'low', 'high', 'attempt', 'status', '_free', '_free_top')
+
+    def __init__(self, capacity, min_number=MIN_NUMBER, max_number=MAX_NUMBER,
+                 max_attempts=MAX_ATTEMPTS):
+        if capacity < 1:
+            raise ValueError(f"Місткість має бути додатною: {capacity}")
+        if min_number > max_number:
+            raise ValueError(f"Некоректний діапазон: {min_number}-{max_number}")
+        if not 1 <= max_attempts <= 0xFFFF:
+            raise ValueError(f"Некоректна кількість спроб: {max_attempts}")
+        self.capacity = capacity
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+
+        typecode = 'i' if INT32_MIN <= min_number and max_number <= INT32_MAX else 'q'
+        zeros = bytes(array(typecode).itemsize * capacity)
+        self.target = array(typecode, zeros)
+        self.low = array(typecode, zeros)
+        self.high = array(typecode, zeros)
+        self.attempt = array('H', bytes(2 * capacity))
+        self.status = array('B', bytes(capacity))
+        # Стек вільних слотів: першими видаються менші номери
+        self._free = array('i' if capacity <= INT32_MAX else 'q', range(capacity - 1, -1, -1))
+        self._free_top = capacity
+
+    def __len__(self):
+        """Кількість зайнятих слотів"""
+        return self.capacity - self._free_top
+
+    # === СЛОТИ ===
+
+    def allocate(self, target):
+        """Займає вільний слот під нову гру та повертає його номер"""
+        if not self.min_number <= target <= self.max_number:
+            raise ValueError(f"Загадане число {target} поза діапазоном "
+                             f"{self.min_number}-{self.max_number}")
+        if not self._free_top:
+            raise TableFullError("Таблиця сесій заповнена")
+        self._free_top -= 1
+        slot = self._free[self._free_top]
+        self.target[slot] = target
+        self.low[slot] = self.min_number
+        self.high[slot] = self.max_number
+        self.attempt[slot] = 0
+        self.status[slot] = STATUS_ACTIVE
+        return slot
+
+    def allocate_many(self, targets):
+        """Займає слоти під масив загаданих чисел; повертає масив номерів"""
+        targets = np.asarray(targets)
+        count = len(targets)
+        if count > self._free_top:
+            raise TableFullError("Таблиця сесій заповнена")
+        if count and (targets.min() < self.min_number or targets.max() > self.max_number):
+            raise ValueError("Загадані числа поза діапазоном")
+        free = np.frombuffer(self._free, dtype=self._free.typecode)
+        slots = free[self._free_top - count:self._free_top][::-1].copy()
+        self._free_top -= count
+        target, low, high, attempt, status = self.columns()
+        target[slots] = targets
+        low[slots] = self.min_number
+        high[slots] = self.max_number
+        attempt[slots] = 0
+        status[slots] = STATUS_ACTIVE
+        return slots
+
+    def release(self, slot):
+        """Звільняє слот завершеної або покинутої гри"""
+        if self.status[slot] == STATUS_FREE:
+            raise ValueError(f"Слот {slot} уже вільний")
+        self.status[slot] = STATUS_FREE
+        self._free[self._free_top] = slot
+        self._free_top += 1
+
+    def columns(self):
+        """Повертає NumPy-представлення стовпців (target, low, high, attempt, status)"""
+        return tuple(np.frombuffer(column, dtype=column.typecode)
+                     for column in (self.target, self.low, self.high, self.attempt, self.status))
+
+    # === ХОДИ ===
+
+    def guess(self, slot, number):
+        """Зараховує спробу сесії slot та повертає знак підказки (як GuessEngine.guess)"""
+        if self.status[slot] != STATUS_ACTIVE:
+            raise RuntimeError("Гру вже завершено")
+        if number < self.min_number or number > self.max_number:
+            raise ValueError(f"Число {number} поза діапазоном "
+                             f"{self.min_number}-{self.max_number}")
+
+        attempt = self.attempt[slot] + 1
+        self.attempt[slot] = attempt
+        target = self.target[slot]
+        outcome = (number > target) - (number < target)
+
+        if outcome == CORRECT:
+            self.status[slot] = STATUS_WON
+            return outcome
+        if outcome == TOO_SMALL:
+            if number >= self.low[slot]:
+                self.low[slot] = number + 1
+        elif number <= self.high[slot]:
+            self.high[slot] = number - 1
+        if attempt >= self.max_attempts:
+            self.status[slot] = STATUS_LOST
+        return outcome
+
+    def guess_many(self, slots, numbers):
+        """Пакет ходів різних сесій (номери слотів не повторюються).
+
+        Повертає масив знаків підказки. Якщо хоча б одна сесія завершена
+        або число поза діапазоном, жоден хід не зараховується.
+        """
+        slots = np.asarray(slots)
+        numbers = np.asarray(numbers)
+        target, low, high, attempt, status = self.columns()
+        if (status[slots] != STATUS_ACTIVE).any():
+            raise RuntimeError("Гру вже завершено")
+        if (numbers < self.min_number).any() or (numbers > self.max_number).any():
+            raise ValueError("Числа поза діапазоном")
+
+        outcome = np.sign(numbers - target[slots]).astype(np.int8)
+        attempt[slots] += 1
+        too_small = outcome < 0
+        too_big = outcome > 0
+        low[slots] = np.where(too_small, np.maximum(low[slots], numbers + 1), low[slots])
+        high[slots] = np.where(too_big, np.minimum(high[slots], numbers - 1), high[slots])
+        new_status = np.where(outcome == CORRECT, STATUS_WON,
+                              np.where(attempt[slots] >= self.max_attempts,
+                                       STATUS_LOST, STATUS_ACTIVE))
+        status[slots] = new_status
+        return outcome
+
+    # === СТАН ===
+
+    def finished(self, slot):
+        return self.status[slot] in (STATUS_WON, STATUS_LOST)
+
+    def remaining(self, slot):
+        return self.max_attempts - self.attempt[slot]
+
+    def session(self, slot):
+        """Повертає копію стану слоту як GuessEngine (для виводу чи збереження)"""
+        if self.status[slot] == STATUS_FREE:
+            raise ValueError(f"Слот {slot} вільний")
+        return GuessEngine.from_state((
+            self.target[slot], self.min_number, self.max_number, self.max_attempts,
+            self.attempt[slot], self.low[slot], self.high[slot],
+            self.status[slot] == STATUS_WON))
@@ -0,0 +1,122 @@
+"""Монте-Карло симуляція гри на кількох ядрах.
+
+Загальна кількість ігор ділиться на фрагменти фіксованого розміру, які
+виконуються в ProcessPoolExecutor. Кожен фрагмент має власний потік
+випадкових чисел, похідний від головного зерна та номера фрагмента,
+тому результат не залежить від кількості процесів. Процеси повертають
+лише агрегати: кількість перемог та гістограму спроб.
+
+Запуск: python simulate.py --games 1000000000 --workers 8
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from batch import binary_search, draw_targets, make_random_strategy, simulate_batch
+from main import MAX_ATTEMPTS
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+STRATEGIES = ('binary', 'random')
+
+
+class SimulationResult(NamedTuple):
+    """Агреговані результати симуляції.
+
+    histogram[k] - кількість ігор, виграних на k-й спробі;
+    histogram[0] - кількість програних ігор.
+    """
+    games: int
+    wins: int
+    histogram: np.ndarray
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_attempts(self):
+        """Середня кількість спроб з урахуванням програних ігор"""
+        if not self.games:
+            return 0.0
+        attempts = np.arange(MAX_ATTEMPTS + 1)
+        attempts[0] = MAX_ATTEMPTS
+        return float(self.histogram @ attempts) / self.games
+
+
+def run_chunk(seed, index, size, strategy='binary'):
+    """Грає один фрагмент та повертає (wins, histogram)"""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    targets = draw_targets(size, rng)
+    if strategy == 'binary':
+        won, attempts = simulate_batch(targets, binary_search)
+    else:
+        won, attempts = simulate_batch(targets, make_random_strategy(rng))
+
+    wins = int(np.count_nonzero(won))
+    histogram = np.bincount(attempts[won], minlength=MAX_ATTEMPTS + 1).astype(np.int64)
+    histogram[0] = size - wins
+    return wins, histogram
+
+
+def _run_chunk_args(args):
+    return run_chunk(*args)
+
+
+def _aggregate(results):
+    """Підсумовує результати фрагментів"""
+    wins = 0
+    histogram = np.zeros(MAX_ATTEMPTS + 1, dtype=np.int64)
+    for chunk_wins, chunk_histogram in results:
+        wins += chunk_wins
+        histogram += chunk_histogram
+    return wins, histogram
+
+
+def simulate(games, seed=0, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+             strategy='binary'):
+    """Симулює games ігор та повертає SimulationResult"""
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Невідома стратегія: {strategy}")
+    if games < 0 or chunk_size < 1:
+        raise ValueError("Кількість ігор та розмір фрагмента мають бути додатними")
+
+    chunks = [(seed, index, min(chunk_size, games - start), strategy)
+              for index, start in enumerate(range(0, games, chunk_size))]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(chunks) <= 1:
+        wins, histogram = _aggregate(map(_run_chunk_args, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batch = max(1, len(chunks) // (workers * 4))
+            wins, histogram = _aggregate(
+                executor.map(_run_chunk_args, chunks, chunksize=batch))
+
+    return SimulationResult(games, wins, histogram)
+
+
+def main(argv=None):
+    """Точка входу командного рядка"""
+    parser = argparse.ArgumentParser(description="Монте-Карло симуляція гри 'Вгадай число'")
+    parser.add_argument('--games', type=int, default=10_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--strategy', choices=STRATEGIES, default='binary')
+    args = parser.parse_args(argv)
+
+    result = simulate(args.games, args.seed, args.workers, args.chunk_size, args.strategy)
+    print(f"Ігор: {result.games}")
+    print(f"Перемог: {result.wins} ({result.win_rate:.2%})")
+    print(f"Середня кількість спроб: {result.mean_attempts:.3f}")
+    for attempt, count in enumerate(result.histogram[1:], start=1):
+        print(f"  Спроба {attempt}: {count}")
+    print(f"  Програно: {result.histogram[0]}")
+
+
+if __name__ == "__main__":
+    main()
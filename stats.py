@@ -0,0 +1,125 @@
+"""Інкрементна статистика ігор.
+
+Кожне оновлення виконується за O(1), пам'ять - O(max_attempts) незалежно
+від кількості ігор. Середнє та дисперсія кількості спроб рахуються
+алгоритмом Велфорда; статистики з різних процесів або серверів
+об'єднуються формулою Чана (merge).
+"""
+
+
+class SessionStats:
+    """Статистика зіграних ігор.
+
+    histogram[k] - кількість ігор, виграних на k-й спробі;
+    histogram[0] - кількість програних ігор (як у simulate.SimulationResult).
+    Ігри, перервані командою виходу, рахуються окремо в games_exited і не
+    входять у статистику спроб.
+    """
+
+    __slots__ = ('max_attempts', 'games_won', 'games_lost', 'games_exited',
+                 'histogram', '_mean', '_m2')
+
+    def __init__(self, max_attempts):
+        self.max_attempts = max_attempts
+        self.games_won = 0
+        self.games_lost = 0
+        self.games_exited = 0
+        self.histogram = [0] * (max_attempts + 1)
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @classmethod
+    def from_histogram(cls, histogram, games_exited=0):
+        """Будує статистику з гістограми спроб (наприклад, від simulate)"""
+        stats = cls(len(histogram) - 1)
+        for attempt, count in enumerate(histogram):
+            if count:
+                stats._add_bucket(attempt, int(count))
+        stats.games_exited = games_exited
+        return stats
+
+    @property
+    def games_completed(self):
+        """Ігри, що завершились перемогою або поразкою"""
+        return self.games_won + self.games_lost
+
+    @property
+    def games_played(self):
+        return self.games_completed + self.games_exited
+
+    @property
+    def win_rate(self):
+        return self.games_won / self.games_played if self.games_played else 0.0
+
+    @property
+    def mean_attempts(self):
+        """Середня кількість спроб у завершених іграх"""
+        return self._mean
+
+    @property
+    def variance(self):
+        """Вибіркова дисперсія кількості спроб у завершених іграх"""
+        n = self.games_completed
+        return self._m2 / (n - 1) if n > 1 else 0.0
+
+    def _add_bucket(self, attempt, count):
+        """Додає count однакових ігор одного кошика (зважений крок Велфорда)"""
+        self.histogram[attempt] += count
+        if attempt:
+            self.games_won += count
+        else:
+            self.games_lost += count
+        attempts = attempt or self.max_attempts
+        n = self.games_completed
+        delta = attempts - self._mean
+        self._mean += delta * count / n
+        self._m2 += delta * (attempts - self._mean) * count
+
+    def record(self, won, attempts):
+        """Враховує завершену гру"""
+        if won:
+            if not 1 <= attempts <= self.max_attempts:
+                raise ValueError(f"Некоректна кількість спроб: {attempts}")
+            self._add_bucket(attempts, 1)
+        else:
+            self._add_bucket(0, 1)
+
+    def record_exit(self):
+        """Враховує гру, перервану командою виходу"""
+        self.games_exited += 1
+
+    def record_session(self, session):
+        """Враховує сесію GuessEngine, повернену play_game()"""
+        if session.won:
+            self.record(True, int(session.attempt))
+        elif session.lost:
+            self.record(False, int(session.attempt))
+        else:
+            self.record_exit()
+
+    def merge(self, other):
+        """Додає статистику іншого процесу або сервера"""
+        if other.max_attempts != self.max_attempts:
+            raise ValueError("Не можна об'єднати статистику з різною кількістю спроб")
+
+        n_a, n_b = self.games_completed, other.games_completed
+        if n_b:
+            n = n_a + n_b
+            delta = other._mean - self._mean
+            self._mean += delta * n_b / n
+            self._m2 += other._m2 + delta * delta * n_a * n_b / n
+        self.games_won += other.games_won
+        self.games_lost += other.games_lost
+        self.games_exited += other.games_exited
+        for attempt, count in enumerate(other.histogram):
+            self.histogram[attempt] += count
+        return self
+
+    def summary(self):
+        """Повертає короткий текстовий підсумок"""
+        return (f"📊 Зіграно ігор: {self.games_played}, перемог: {self.games_won} "
+                f"({self.win_rate:.0%}), середня кількість спроб: {self.mean_attempts:.2f}")
+
+    def __repr__(self):
+        return (f"SessionStats(played={self.games_played}, won={self.games_won}, "
+                f"mean={self.mean_attempts:.3f}, variance={self.variance:.3f})")
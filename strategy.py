@@ -0,0 +1,121 @@
+"""Оптимальна стратегія гри та точні ймовірності перемоги.
+
+Стан гри - розмір відомого діапазону s = high - low + 1 та кількість
+спроб r, що лишились; оцінки не залежать від зсуву меж. Повний перебір
+solve_exact() показує, що середина діапазону одночасно максимізує
+кількість чисел, які можна вгадати (min(s, 2**r - 1)), і мінімізує
+сумарну кількість спроб. Тому таблиці рішень не потрібен вимір r:
+достатньо одного стовпця path_length[s] - найменшої сумарної кількості
+спроб, за яку вгадуються всі s чисел без обмеження спроб. Решта величин
+виводиться з нього за O(1):
+
+  total_attempts(s, r) = path_length[s],                         s <= 2**r - 1
+                       = path_length[2**r - 1] + (s - 2**r + 1) * r,  інакше
+
+(числа поза повним деревом здогадок програються за всі r спроб).
+
+Оптимальне дерево здогадок - повне, тож path_length[s] дорівнює сумі
+довжин двійкового запису чисел 1..s і рахується замкненою формулою
+path_length(s) за O(1) для діапазону будь-якого розміру (--max аж до
+10**18 і більше); таблиця на диску не потрібна. Динаміка
+build_path_lengths() (path_length[s] = s + path_length[(s - 1) // 2] +
+path_length[s // 2], векторизовано на NumPy) лишається перехресною
+перевіркою формули.
+"""
+
+import numpy as np
+
+
+def solve_exact(size, attempts):
+    """Еталонна динаміка повним перебором здогадок, O(size**2 * attempts).
+
+    Повертає таблиці wins[r][s] та total[r][s]: найбільшу кількість
+    виграшних чисел і за неї найменшу сумарну кількість спроб.
+    """
+    wins = [[0] * (size + 1) for _ in range(attempts + 1)]
+    total = [[0] * (size + 1) for _ in range(attempts + 1)]
+    for r in range(1, attempts + 1):
+        for s in range(1, size + 1):
+            best = None
+            for left in range(s):
+                right = s - 1 - left
+                candidate = (1 + wins[r - 1][left] + wins[r - 1][right],
+                             -(s + total[r - 1][left] + total[r - 1][right]))
+                if best is None or candidate > best:
+                    best = candidate
+            wins[r][s], total[r][s] = best[0], -best[1]
+    return wins, total
+
+
+def path_length(size):
+    """Найменша сумарна кількість спроб для size чисел за O(1).
+
+    Сума (k.bit_length() for k in 1..size) = size + (size + 1) * h - 2**(h+1) + 2,
+    де h = floor(log2(size)).
+    """
+    if size < 1:
+        return 0
+    height = size.bit_length() - 1
+    return size + (size + 1) * height - (2 << height) + 2
+
+
+def build_path_lengths(size):
+    """Рахує path_length[0..size] динамікою за рівнями (перевірка формули)"""
+    table = np.zeros(size + 1, dtype=np.int64)
+    start = 1
+    while start <= size:
+        stop = min(2 * start, size + 1)
+        sizes = np.arange(start, stop, dtype=np.int64)
+        table[start:stop] = sizes + table[(sizes - 1) >> 1] + table[sizes >> 1]
+        start = stop
+    return table
+
+
+class StrategyTable:
+    """Оптимальна стратегія для діапазонів розміром до size (None - будь-яких).
+
+    Усі величини рахуються замкненою формулою path_length за O(1).
+    """
+
+    __slots__ = ('size',)
+
+    def __init__(self, size=None):
+        self.size = size
+
+    @classmethod
+    def for_config(cls, config):
+        """Стратегія для діапазону GameConfig"""
+        return cls(config.max_number - config.min_number + 1)
+
+    def _check(self, size):
+        if size < 1 or (self.size is not None and size > self.size):
+            limit = '' if self.size is None else f" (1..{self.size})"
+            raise ValueError(f"Розмір діапазону {size} поза таблицею{limit}")
+
+    def wins(self, size, attempts):
+        """Кількість чисел з size, які оптимальна стратегія вгадує за attempts"""
+        return min(size, (1 << attempts) - 1)
+
+    def total_attempts(self, size, attempts):
+        """Сумарна кількість спроб оптимальної стратегії по всіх size числах"""
+        self._check(size)
+        covered = (1 << attempts) - 1
+        if size <= covered:
+            return path_length(size)
+        return path_length(covered) + (size - covered) * attempts
+
+    def best_guess(self, low, high, attempts):
+        """Оптимальна наступна здогадка для відомих меж low..high"""
+        self._check(high - low + 1)
+        return (low + high) // 2
+
+    def win_probability(self, low, high, attempts):
+        """Точна ймовірність перемоги за оптимальної гри з цього стану"""
+        size = high - low + 1
+        self._check(size)
+        return self.wins(size, attempts) / size
+
+    def expected_attempts(self, low, high, attempts):
+        """Очікувана кількість подальших спроб (програш - усі attempts)"""
+        size = high - low + 1
+        return self.total_attempts(size, attempts) / size
@@ -0,0 +1,90 @@
+"""Пули загаданих чисел з детермінованими генераторами NumPy.
+
+TargetPool генерує числа пакетами (один векторизований виклик
+Generator.integers на pool_size чисел), тож окреме загадування - це лише
+взяття наступного елемента з буфера. Пул має метод randint(a, b),
+сумісний з random.randint, і передається в main.new_session(),
+play_game() та main() параметром rng.
+
+Межі поза int64 NumPy не генерує: тоді числа дає random.Random
+(цілі Python), засіяний з того самого генератора, тож послідовність
+так само відтворювана.
+
+Пул не потокобезпечний: кожна сесія або потік має власний пул.
+for_session(seed, index) дає незалежні відтворювані послідовності для
+сесій одного запуску (так само, як фрагменти simulate.run_chunk).
+"""
+
+import random
+
+import numpy as np
+
+from main import INT64_MAX, INT64_MIN, MAX_NUMBER, MIN_NUMBER
+
+DEFAULT_POOL_SIZE = 4096
+
+
+class TargetPool:
+    """Буферизоване джерело загаданих чисел у діапазоні min_number..max_number"""
+
+    __slots__ = ('min_number', 'max_number', 'pool_size', 'drawn',
+                 '_generator', '_wide', '_buffer', '_index')
+
+    def __init__(self, seed=None, min_number=MIN_NUMBER, max_number=MAX_NUMBER,
+                 pool_size=DEFAULT_POOL_SIZE):
+        if min_number > max_number:
+            raise ValueError(f"Некоректний діапазон: {min_number}..{max_number}")
+        if pool_size < 1:
+            raise ValueError(f"Розмір пулу має бути додатним: {pool_size}")
+        self.min_number = min_number
+        self.max_number = max_number
+        self.pool_size = pool_size
+        self.drawn = 0
+        self._generator = np.random.default_rng(seed)
+        self._wide = None
+        self._buffer = []
+        self._index = 0
+
+    @classmethod
+    def for_session(cls, seed, session_index, **kwargs):
+        """Пул сесії session_index (число або кортеж) з незалежним потоком від seed"""
+        spawn_key = session_index if isinstance(session_index, tuple) else (session_index,)
+        return cls(np.random.SeedSequence(seed, spawn_key=spawn_key), **kwargs)
+
+    def _generate(self, count):
+        min_number, max_number = self.min_number, self.max_number
+        if INT64_MIN <= min_number and max_number <= INT64_MAX:
+            return self._generator.integers(min_number, max_number, size=count,
+                                            endpoint=True, dtype=np.int64)
+        if self._wide is None:
+            self._wide = random.Random(int(self._generator.integers(INT64_MAX)))
+        randint = self._wide.randint
+        return np.array([randint(min_number, max_number) for _ in range(count)], dtype=object)
+
+    def draw(self):
+        """Повертає наступне загадане число"""
+        index = self._index
+        if index == len(self._buffer):
+            self._buffer = self._generate(self.pool_size).tolist()
+            index = 0
+        self._index = index + 1
+        self.drawn += 1
+        return self._buffer[index]
+
+    def draw_many(self, count):
+        """Повертає масив NumPy з count наступних чисел (для симуляцій)"""
+        rest = self._buffer[self._index:self._index + count]
+        self._index += len(rest)
+        fresh = self._generate(count - len(rest))
+        self.drawn += count
+        return np.concatenate((np.asarray(rest, dtype=fresh.dtype), fresh)) if rest else fresh
+
+    def randint(self, a, b):
+        """Сумісна з random.randint заміна; інший діапазон скидає буфер"""
+        if a != self.min_number or b != self.max_number:
+            if a > b:
+                raise ValueError(f"Некоректний діапазон: {a}..{b}")
+            self.min_number, self.max_number = a, b
+            self._buffer = []
+            self._index = 0
+        return self.draw()
@@ -0,0 +1,173 @@
+import io
+import json
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from analytics import analyze, analyze_chunk, main
+from engine import hint
+from fakes import FixedRandom
+from gamelog import GameLogReader, GameRecorder
+from main import MAX_ATTEMPTS, InputTimeout, main as play_main, stream_io
+
+
+def reference(path, period):
+    """Повільний підрахунок по записах для порівняння"""
+    wins, losses, exits, guesses, outside = {}, 0, 0, 0, 0
+    first, periods, bounds = {}, {}, {}
+    with GameLogReader(path) as log:
+        records = [log[index] for index in range(len(log))]
+    for session, guess, attempt, direction, outcome in records:
+        if outcome in (1, 2, 3, 5):
+            games, won = periods.get(session // period, (0, 0))
+            periods[session // period] = (games + 1, won + (outcome == 1))
+        if outcome == 3:
+            exits += 1
+            continue
+        if outcome in (4, 5):
+            losses += outcome == 5
+            continue
+        guesses += 1
+        if session not in bounds:
+            first[guess] = first.get(guess, 0) + 1
+        low, high = bounds.get(session, (-2**63, 2**63 - 1))
+        outside += not low <= guess <= high
+        if direction < 0:
+            low = max(low, guess + 1)
+        elif direction > 0:
+            high = min(high, guess - 1)
+        bounds[session] = (low, high)
+        if outcome == 1:
+            wins[attempt] = wins.get(attempt, 0) + 1
+        losses += outcome == 2
+    return wins, losses, exits, guesses, outside, first, periods
+
+
+def write_interleaved_log(path, sessions=300, seed=5):
+    """Журнал одночасних сесій, ходи яких перемежовуються"""
+    rng = random.Random(seed)
+    with GameRecorder(path) as recorder:
+        active = []
+        ids = iter(range(1, sessions + 1))
+        while True:
+            while len(active) < 20:
+                session_id = next(ids, None)
+                if session_id is None:
+                    break
+                active.append([session_id, rng.randint(1, 100), 0, 1, 100])
+            if not active:
+                break
+            state = rng.choice(active)
+            session_id, target, attempt, low, high = state
+            attempt += 1
+            if rng.random() < 0.03:
+                recorder.record(session_id, attempt, 0, 0, 3)
+                active.remove(state)
+                continue
+            if rng.random() < 0.1:
+                # Спроба, пропущена через тайм-аут
+                lost = attempt == MAX_ATTEMPTS
+                recorder.record(session_id, attempt, 0, 0, 5 if lost else 4)
+                state[2] = attempt
+                if lost:
+                    active.remove(state)
+                continue
+            # Здебільшого в межах підказок, іноді - поза ними
+            guess = rng.randint(low, high) if rng.random() < 0.8 else rng.randint(1, 100)
+            direction = hint(guess, target)
+            outcome = 1 if direction == 0 else (2 if attempt == MAX_ATTEMPTS else 0)
+            recorder.record(session_id, attempt, guess, direction, outcome)
+            if direction < 0:
+                low = max(low, guess + 1)
+            elif direction > 0:
+                high = min(high, guess - 1)
+            state[2:] = attempt, low, high
+            if outcome:
+                active.remove(state)
+
+
+class TestAnalytics:
+    """Тести аналітики журналів ходів"""
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 64, 10_000])
+    def test_matches_reference_for_any_chunk_size(self, tmp_path, chunk_size):
+        """Тест що результат не залежить від розбиття на фрагменти"""
+        path = tmp_path / "games.log"
+        write_interleaved_log(path)
+        wins, losses, exits, guesses, outside, first, periods = reference(path, 50)
+
+        total = analyze([path], workers=1, chunk_size=chunk_size, period=50)
+
+        assert {k: v for k, v in enumerate(total.wins_by_attempt.tolist()) if v} == wins
+        assert (total.losses, total.exits, total.guesses) == (losses, exits, guesses)
+        assert total.games == 300
+        assert total.out_of_bounds == outside > 0
+        assert total.first_guesses == first
+        assert {k: tuple(v) for k, v in total.periods.items()} == periods
+
+    def test_outcomes_of_played_games(self, tmp_path):
+        """Тест перемоги, поразки та виходу з play_game()"""
+        path = tmp_path / "games.log"
+        answers = ['50', '70', '60', 'так', '1', '2', '3', '4', '5', '6', '7', 'так',
+                   '80', 'exit', 'ні']
+        reader, writer = stream_io(io.StringIO("\n".join(answers) + "\n"), io.StringIO())
+        with GameRecorder(path) as recorder:
+            play_main(reader, writer, FixedRandom(60), recorder=recorder)
+
+        report = analyze([path], workers=1).report()
+
+        assert (report['games'], report['wins'], report['losses'], report['exits']) == (3, 1, 1, 1)
+        assert report['wins_by_attempt'] == {3: 1}
+        # 70 після "більше за 50" - у межах; 2..7 після "більше за 1" - теж
+        assert report['out_of_bounds'] == 0
+        assert [item['guess'] for item in report['first_guesses']] == [1, 50, 80]
+
+    def test_timed_out_attempts(self, tmp_path):
+        """Тест спроб, пропущених через тайм-аут, у зіграних іграх"""
+        path = tmp_path / "games.log"
+        answers = iter([None, '50', '60', 'так'] + [None] * MAX_ATTEMPTS + ['ні'])
+
+        def reader(prompt=''):
+            answer = next(answers)
+            if answer is None:
+                raise InputTimeout()
+            return answer
+
+        with GameRecorder(path) as recorder:
+            play_main(reader, [].append, FixedRandom(60), recorder=recorder)
+
+        report = analyze([path], workers=1, chunk_size=1).report()
+
+        assert (report['games'], report['wins'], report['losses']) == (2, 1, 1)
+        assert report['wins_by_attempt'] == {3: 1}
+        assert (report['guesses'], report['skips']) == (2, 1 + MAX_ATTEMPTS)
+        assert [item['guess'] for item in report['first_guesses']] == [50]
+
+    def test_multiple_files_in_process_pool(self, tmp_path, capsys):
+        """Тест злиття кількох файлів, оброблених пулом процесів"""
+        paths = []
+        for seed in range(2):
+            paths.append(tmp_path / f"games{seed}.log")
+            write_interleaved_log(paths[-1], sessions=100, seed=seed)
+        single = analyze(paths, workers=1, chunk_size=97).report()
+
+        main([str(path) for path in paths] + ['--workers', '2', '--chunk-size', '97'])
+        pooled = json.loads(capsys.readouterr().out)
+
+        assert pooled['games'] == single['games'] == 200
+        assert pooled['out_of_bounds'] == single['out_of_bounds']
+        assert pooled['wins'] == single['wins']
+
+    def test_chunk_reads_only_its_range(self, tmp_path):
+        """Тест що фрагмент бачить лише свої записи"""
+        path = tmp_path / "games.log"
+        write_interleaved_log(path, sessions=50)
+        with GameLogReader(path) as log:
+            count = len(log)
+        parts = [analyze_chunk(path, start, min(start + 40, count))
+                 for start in range(0, count, 40)]
+
+        assert sum(part.partial.guesses + part.partial.exits + part.partial.skips
+                   for part in parts) == count
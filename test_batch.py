@@ -0,0 +1,65 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch import binary_search, draw_targets, make_random_strategy, simulate_batch
+from engine import GuessEngine
+from main import MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS
+
+
+def linear_scan(low, high, attempt):
+    """Стратегія, що завжди називає нижню межу"""
+    return low.copy()
+
+
+def play_scalar(target, strategy):
+    """Грає одну гру на GuessEngine з векторною стратегією"""
+    session = GuessEngine(target, MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS)
+    while not session.finished:
+        guess = strategy(np.array([session.low]), np.array([session.high]),
+                         session.attempt + 1)[0]
+        session.guess(int(guess))
+    return session.won, session.attempt
+
+
+class TestSimulateBatch:
+    """Тести векторизованого симулятора"""
+
+    @pytest.mark.parametrize("strategy", [binary_search, linear_scan])
+    def test_matches_scalar_rules(self, strategy):
+        """Тест збігу з правилами GuessEngine для всіх чисел діапазону"""
+        targets = np.arange(MIN_NUMBER, MAX_NUMBER + 1)
+        won, attempts = simulate_batch(targets, strategy)
+
+        for target, game_won, game_attempts in zip(targets, won, attempts):
+            assert (bool(game_won), int(game_attempts)) == play_scalar(int(target), strategy)
+
+    def test_binary_search_always_wins(self):
+        """Тест що бінарний пошук вкладається в MAX_ATTEMPTS"""
+        targets = np.arange(MIN_NUMBER, MAX_NUMBER + 1)
+        won, attempts = simulate_batch(targets)
+
+        assert won.all()
+        assert attempts.max() == MAX_ATTEMPTS
+
+    def test_loss_uses_all_attempts(self):
+        """Тест поразки після MAX_ATTEMPTS спроб"""
+        won, attempts = simulate_batch(np.array([MAX_NUMBER]), linear_scan)
+
+        assert not won[0]
+        assert attempts[0] == MAX_ATTEMPTS
+
+    def test_random_strategy_stays_in_bounds(self):
+        """Тест випадкової стратегії на великому пакеті"""
+        rng = np.random.default_rng(42)
+        targets = draw_targets(10_000, rng)
+        won, attempts = simulate_batch(targets, make_random_strategy(rng))
+
+        assert targets.min() >= MIN_NUMBER and targets.max() <= MAX_NUMBER
+        assert (attempts[won] >= 1).all()
+        assert (attempts[~won] == MAX_ATTEMPTS).all()
+
+    def test_rejects_targets_out_of_range(self):
+        """Тест відмови для загаданих чисел поза діапазоном"""
+        with pytest.raises(ValueError):
+            simulate_batch(np.array([MAX_NUMBER + 1]))
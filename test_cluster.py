@@ -0,0 +1,80 @@
+import asyncio
+import os
+import signal
+import sys
+import threading
+
+import pytest
+
+from cluster import Supervisor
+from test_server import play_transcript, read_until_prompt
+
+pytestmark = pytest.mark.skipif(sys.platform != 'linux', reason="SO_REUSEPORT з розподілом Linux")
+
+
+@pytest.fixture
+def supervisor():
+    supervisor = Supervisor(2, '127.0.0.1', 0, seed=1, drain_timeout=5)
+    supervisor.start()
+    yield supervisor
+    supervisor.stop()
+
+
+def play(port, answers):
+    async def scenario():
+        # Обробник міг ще не почати слухати порт одразу після запуску
+        for _ in range(100):
+            try:
+                return await play_transcript(port, answers)
+            except ConnectionRefusedError:
+                await asyncio.sleep(0.05)
+        raise ConnectionRefusedError(port)
+
+    return asyncio.run(scenario())
+
+
+class TestSupervisor:
+    """Тести багатопроцесного сервера"""
+
+    def test_workers_share_port(self, supervisor):
+        """Тест ігор через кілька обробників на одному порту"""
+        outputs = [play(supervisor.port, ['exit', 'ні']) for _ in range(6)]
+        assert all(output.endswith("Дякуємо за гру! До побачення!") for output in outputs)
+        assert all(process.is_alive() for process in supervisor.workers)
+
+    def test_restarts_dead_worker(self, supervisor):
+        """Тест перезапуску аварійно завершеного обробника"""
+        victim = supervisor.workers[0]
+        os.kill(victim.pid, signal.SIGKILL)
+        supervisor.check(timeout=5)
+
+        assert supervisor.restarts == 1
+        assert supervisor.workers[0] is not victim and supervisor.workers[0].is_alive()
+        assert "До побачення" in play(supervisor.port, ['exit', 'ні'])
+
+    def test_graceful_drain(self, supervisor):
+        """Тест що активна сесія дограється після сигналу зупинки"""
+
+        async def scenario():
+            for _ in range(100):
+                try:
+                    reader, writer = await asyncio.open_connection('127.0.0.1', supervisor.port)
+                    break
+                except ConnectionRefusedError:
+                    await asyncio.sleep(0.05)
+            await read_until_prompt(reader)
+
+            stopper = threading.Thread(target=supervisor.stop)
+            stopper.start()
+            await asyncio.sleep(0.3)
+            writer.write(b'exit\n')
+            await read_until_prompt(reader)
+            writer.write(b'\xd0\xbd\xd1\x96\n')  # "ні"
+            output = await read_until_prompt(reader)
+            writer.close()
+            await asyncio.get_running_loop().run_in_executor(None, stopper.join)
+            return output
+
+        output = asyncio.run(scenario())
+        assert output[-1].endswith("Дякуємо за гру! До побачення!")
+        assert all(process.exitcode == 0 for process in supervisor.workers)
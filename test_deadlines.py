@@ -0,0 +1,148 @@
+import io
+import os
+import time
+
+import pytest
+
+from deadlines import DeadlineReader, next_timeout
+from events import EventStream, QueueSink
+from fakes import FixedRandom
+from gamelog import OUTCOME_EXIT, OUTCOME_SKIP, OUTCOME_SKIP_LOSS, GameLogReader, GameRecorder
+from main import (
+    ATTEMPT_TIMEOUT_MESSAGE, SESSION_TIMEOUT_MESSAGE, InputTimeout, main,
+)
+from metrics import GameMetrics
+
+
+def scripted_reader(answers):
+    """reader, що на None кидає InputTimeout, а на 'session' - вичерпання часу сесії"""
+    answers = iter(answers)
+
+    def reader(prompt=''):
+        answer = next(answers)
+        if answer is None or answer == 'session':
+            raise InputTimeout(session_expired=answer == 'session')
+        return answer
+
+    return reader
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    for fd in (read_fd, write_fd):
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+class TestNextTimeout:
+    """Тести вибору найближчого дедлайну"""
+
+    def test_choices(self):
+        """Тест дедлайну відповіді, сесії та їх відсутності"""
+        assert next_timeout(None, None, 10.0) == (None, False)
+        assert next_timeout(2.0, None, 10.0) == (2.0, False)
+        assert next_timeout(2.0, 11.0, 10.0) == (1.0, True)
+        assert next_timeout(2.0, 15.0, 10.0) == (2.0, False)
+        assert next_timeout(None, 15.0, 10.0) == (5.0, True)
+
+
+class TestDeadlineReader:
+    """Тести читання рядків з дедлайнами"""
+
+    def test_reads_lines_and_eof(self, pipe):
+        """Тест рядків, що прийшли частинами, останнього рядка без \\n та EOF"""
+        read_fd, write_fd = pipe
+        out = io.StringIO()
+        reader = DeadlineReader(read_fd, out, attempt_timeout=5)
+        os.write(write_fd, '50\r\nпри'.encode())
+        assert reader('Число: ') == '50'
+        os.write(write_fd, 'віт\nкінець'.encode())
+        os.close(write_fd)
+        assert reader() == 'привіт'
+        assert reader() == 'кінець'
+        with pytest.raises(EOFError):
+            reader()
+        reader.close()
+        assert out.getvalue() == 'Число: '
+
+    def test_long_line_discarded(self, pipe):
+        """Тест що надто довгий рядок не накопичується в пам'яті"""
+        read_fd, write_fd = pipe
+        reader = DeadlineReader(read_fd, io.StringIO(), attempt_timeout=5, max_line=16)
+        os.write(write_fd, b'1' * 5000 + b'\n7\n')
+        assert reader() == ''
+        assert reader() == '7'
+        reader.close()
+
+    def test_attempt_timeout(self, pipe):
+        """Тест тайм-ауту відповіді без блокування потоку"""
+        reader = DeadlineReader(pipe[0], io.StringIO(), attempt_timeout=0.05)
+        start = time.monotonic()
+        with pytest.raises(InputTimeout) as error:
+            reader()
+        assert not error.value.session_expired
+        assert time.monotonic() - start < 1
+
+    def test_session_timeout(self, pipe):
+        """Тест дедлайну сесії, ближчого за дедлайн відповіді"""
+        reader = DeadlineReader(pipe[0], io.StringIO(), attempt_timeout=5, session_timeout=0.05)
+        with pytest.raises(InputTimeout) as error:
+            reader()
+        assert error.value.session_expired
+        assert str(error.value) == SESSION_TIMEOUT_MESSAGE
+
+
+class TestGameTimeouts:
+    """Тести гри з DeadlineReader"""
+
+    def run_main(self, pipe, data, **timeouts):
+        read_fd, write_fd = pipe
+        os.write(write_fd, data.encode())
+        lines = []
+        with DeadlineReader(read_fd, io.StringIO(), **timeouts) as reader:
+            stats = main(reader, lines.append, FixedRandom(42))
+        return stats, "\n".join(lines)
+
+    def test_missed_answers_cost_attempts(self, pipe):
+        """Тест що пропущені відповіді коштують спроб і ведуть до поразки"""
+        stats, output = self.run_main(pipe, '50\n', attempt_timeout=0.02)
+
+        assert output.count(ATTEMPT_TIMEOUT_MESSAGE) == 7
+        assert "Загадане число було: 42" in output
+        assert stats.games_played == 1 and stats.games_lost == 1
+        assert output.endswith("До побачення!")
+
+    def test_session_timeout_ends_game(self, pipe):
+        """Тест що вичерпаний час сесії завершує main()"""
+        stats, output = self.run_main(pipe, '42\nтак\n', session_timeout=0.1)
+
+        assert "ВИ ВГАДАЛИ!" in output
+        assert SESSION_TIMEOUT_MESSAGE in output
+        # Перервана друга гра враховується як вихід
+        assert stats.games_played == 2 and stats.games_won == 1 and stats.games_exited == 1
+
+    def test_sinks_agree_on_timed_out_games(self, tmp_path):
+        """Тест що журнал ходів, події, метрики та статистика однаково завершують гру"""
+        path = tmp_path / "games.log"
+        sink = QueueSink()
+        metrics = GameMetrics()
+        answers = ['50'] + [None] * 6 + ['так', 'session']
+        with GameRecorder(path) as recorder, EventStream([sink]) as events:
+            stats = main(scripted_reader(answers), [].append, FixedRandom(42),
+                         recorder=recorder, metrics=metrics, events=events)
+
+        with GameLogReader(path) as log:
+            records = [log[index] for index in range(len(log))]
+        assert [(session, attempt, outcome) for session, _, attempt, _, outcome in records] == (
+            [(1, 1, 0)] + [(1, attempt, OUTCOME_SKIP) for attempt in range(2, 7)]
+            + [(1, 7, OUTCOME_SKIP_LOSS), (2, 1, OUTCOME_EXIT)])
+        kinds = [sink.queue.get().kind for _ in range(sink.queue.qsize())]
+        assert [kind for kind in kinds if kind in ('win', 'loss', 'exit')] == ['loss', 'exit']
+        assert kinds.count('skip') == 6
+        total = metrics.snapshot()
+        assert (total.losses, total.exits) == (1, 1)
+        assert (stats.games_lost, stats.games_exited) == (1, 1)
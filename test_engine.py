@@ -0,0 +1,186 @@
+import sys
+import unittest.mock as mock
+
+import pytest
+from engine import (
+    CORRECT, TOO_SMALL, TOO_BIG, GUESS_OK, GUESS_EXIT, GUESS_INVALID,
+    GUESS_OUT_OF_RANGE, GameConfig, GuessEngine, attempts_for_range,
+    INT_WHITESPACE, ZERO_DIGITS, digit_count, hint, parse_guess,
+)
+from main import MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS, EXIT_COMMANDS, DEFAULT_CONFIG as DEFAULT
+
+
+def new_session(target=50):
+    return GuessEngine(target, MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS)
+
+
+class TestHint:
+    """Тести функції hint"""
+
+    def test_hint_directions(self):
+        """Тест знаку підказки"""
+        assert hint(30, 50) == TOO_SMALL
+        assert hint(70, 50) == TOO_BIG
+        assert hint(50, 50) == CORRECT
+
+
+class TestParseGuess:
+    """Тести розбору введення"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ('50', (GUESS_OK, 50)),
+        ('EXIT', (GUESS_EXIT, None)),
+        ('вихід', (GUESS_EXIT, None)),
+        ('abc', (GUESS_INVALID, None)),
+        ('12.5', (GUESS_INVALID, None)),
+        ('0', (GUESS_OUT_OF_RANGE, 0)),
+        ('101', (GUESS_OUT_OF_RANGE, 101)),
+    ])
+    def test_parse(self, text, expected):
+        """Тест статусів розбору"""
+        assert parse_guess(text, MIN_NUMBER, MAX_NUMBER, EXIT_COMMANDS) == expected
+
+
+class TestGameConfig:
+    """Тести налаштувань діапазону"""
+
+    @pytest.mark.parametrize("number", [0, 7, 9, 10, 99, 100, 10 ** 18 - 1, 10 ** 18, -12345])
+    def test_digit_count(self, number):
+        """Тест підрахунку цифр без str()"""
+        assert digit_count(number) == len(str(abs(number)))
+
+    def test_attempts_derived_from_range(self):
+        """Тест кількості спроб, обчисленої з розміру діапазону"""
+        assert attempts_for_range(MIN_NUMBER, MAX_NUMBER) == MAX_ATTEMPTS
+        assert GameConfig(1, 10 ** 18).max_attempts == 60
+        assert GameConfig(1, 10 ** 18, 10).max_attempts == 10
+
+    def test_invalid_config(self):
+        """Тест некоректних налаштувань"""
+        with pytest.raises(ValueError):
+            GameConfig(10, 1)
+        with pytest.raises(ValueError):
+            GameConfig(1, 10, 0)
+
+    def test_huge_range_guess(self):
+        """Тест розбору чисел у діапазоні до 10^30"""
+        config = GameConfig(-10 ** 30, 10 ** 30, exit_commands=EXIT_COMMANDS)
+        assert config.parse_guess(str(10 ** 30), EXIT_COMMANDS) == (GUESS_OK, 10 ** 30)
+        assert config.parse_guess(str(-10 ** 30 - 1), EXIT_COMMANDS)[0] == GUESS_OUT_OF_RANGE
+
+    @pytest.mark.parametrize("text, status", [
+        ('9' * 10_000_000, GUESS_OUT_OF_RANGE),
+        ('-' + '9' * 10_000, GUESS_OUT_OF_RANGE),
+        ('a' * 10_000_000, GUESS_INVALID),
+    ])
+    def test_oversized_input_rejected_before_int(self, text, status):
+        """Тест відмови для надто довгого введення без виклику int()"""
+        with mock.patch('builtins.int', side_effect=AssertionError("int() не має викликатись")):
+            assert DEFAULT.parse_guess(text, EXIT_COMMANDS) == (status, None)
+
+    def test_padded_input_still_accepted(self):
+        """Тест що пробіли та нулі в межах запасу дозволені"""
+        assert DEFAULT.parse_guess('  0050  ', EXIT_COMMANDS) == (GUESS_OK, 50)
+
+    def test_int_whitespace(self):
+        """Тест що INT_WHITESPACE - рівно ті пробіли, які відкидає int()"""
+        for code in range(sys.maxunicode + 1):
+            char = chr(code)
+            if char.isspace():
+                try:
+                    int(char + '5' + char)
+                except ValueError:
+                    assert char not in INT_WHITESPACE
+                else:
+                    assert char in INT_WHITESPACE
+
+    def test_zero_digits(self):
+        """Тест що ZERO_DIGITS - рівно цифри зі значенням 0 у всьому Unicode"""
+        zeros = [chr(code) for code in range(sys.maxunicode + 1)
+                 if chr(code).isdecimal() and int(chr(code)) == 0]
+        assert ''.join(zeros) == ZERO_DIGITS
+
+    @pytest.mark.parametrize("text, expected", [
+        ('50' + ' ' * 20, (GUESS_OK, 50)),
+        ('\t' * 30 + '-7', (GUESS_OUT_OF_RANGE, -7)),
+        ('0' * 10_000 + '42', (GUESS_OK, 42)),
+        ('+' + '0_' * 20 + '5', (GUESS_OK, 5)),
+        ('٠' * 30 + '٥', (GUESS_OK, 5)),
+        ('0' * 30, (GUESS_OUT_OF_RANGE, 0)),
+        ('²' * 30, (GUESS_INVALID, None)),
+        ('_' + '0' * 30 + '5', (GUESS_INVALID, None)),
+        ('0' * 30 + '__5', (GUESS_INVALID, None)),
+        (' ' * 30 + '+', (GUESS_INVALID, None)),
+        ('\x1c' * 30 + '5', (GUESS_INVALID, None)),
+        ('\u3000\x85' * 15 + '5', (GUESS_OK, 5)),
+        ('0+5' + ' ' * 30, (GUESS_INVALID, None)),
+        ('00  25' + ' ' * 25, (GUESS_INVALID, None)),
+        ('0' * 25 + '-5', (GUESS_INVALID, None)),
+        ('0' * 25 + '5x', (GUESS_INVALID, None)),
+        ('٠' * 10_000_000 + '5', (GUESS_OK, 5)),
+    ])
+    def test_long_input_matches_int(self, text, expected):
+        """Тест що довге введення тлумачиться так само, як int()"""
+        assert DEFAULT.parse_guess(text, EXIT_COMMANDS) == expected
+
+
+class TestGuessEngine:
+    """Тести стану ігрової сесії"""
+
+    def test_win(self):
+        """Тест перемоги та лічильника спроб"""
+        session = new_session(57)
+        assert session.guess(50) == TOO_SMALL
+        assert session.guess(60) == TOO_BIG
+        assert session.guess(57) == CORRECT
+        assert session.won and session.finished and not session.lost
+        assert session.attempt == 3
+
+    def test_bounds_narrowing(self):
+        """Тест звуження відомих меж"""
+        session = new_session(57)
+        session.guess(50)
+        session.guess(60)
+        session.guess(10)  # Гірша здогадка не розширює межі
+        assert (session.low, session.high) == (51, 59)
+
+    def test_loss_after_max_attempts(self):
+        """Тест поразки після всіх спроб"""
+        session = new_session(100)
+        for number in range(1, MAX_ATTEMPTS + 1):
+            session.guess(number)
+        assert session.lost and session.finished
+        assert session.remaining == 0
+        with pytest.raises(RuntimeError):
+            session.guess(100)
+
+    def test_rejects_out_of_range(self):
+        """Тест відмови для чисел поза діапазоном"""
+        session = new_session()
+        with pytest.raises(ValueError):
+            session.guess(MAX_NUMBER + 1)
+        assert session.attempt == 0
+
+        with pytest.raises(ValueError):
+            GuessEngine(0, MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS)
+
+    def test_state_round_trip(self):
+        """Тест збереження та відновлення стану"""
+        session = new_session(57)
+        session.guess(50)
+        restored = GuessEngine.from_state(session.state())
+        assert restored.state() == session.state()
+        assert restored.guess(57) == CORRECT and restored.attempt == 2
+
+    def test_skip_counts_attempt(self):
+        """Тест пропущеної спроби без зміни меж"""
+        session = new_session(57)
+        for _ in range(MAX_ATTEMPTS):
+            session.skip()
+        assert session.lost and (session.low, session.high) == (MIN_NUMBER, MAX_NUMBER)
+        with pytest.raises(RuntimeError):
+            session.skip()
+
+    def test_slots(self):
+        """Тест що сесія не має __dict__"""
+        assert not hasattr(new_session(), '__dict__')
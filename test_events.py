@@ -0,0 +1,191 @@
+import io
+import json
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+
+from engine import TOO_BIG, TOO_SMALL
+from events import (
+    BACKPRESSURE_BLOCK, BACKPRESSURE_SAMPLE, EventStream, Exit, FileSink, Guess, Loss,
+    QueueSink, Replay, SessionStart, Skip, SocketSink, Win,
+)
+from fakes import FixedRandom
+from main import MAX_ATTEMPTS, InputTimeout, main, play_game, stream_io
+
+
+def play(events, answers):
+    reader, writer = stream_io(io.StringIO("".join(a + "\n" for a in answers)), io.StringIO())
+    main(reader, writer, FixedRandom(50), events=events)
+
+
+def drain(sink):
+    items = []
+    while not sink.queue.empty():
+        items.append(sink.queue.get_nowait())
+    return items
+
+
+class GatedSink:
+    """Приймач, що чекає дозволу на запис (імітує повільного споживача)"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.events = []
+
+    def write_batch(self, events):
+        self.gate.wait(5)
+        self.events.extend(events)
+
+    def close(self):
+        pass
+
+
+class TestEventStream:
+    """Тести потоку подій гри"""
+
+    def test_game_events_in_order(self):
+        """Тест подій перемоги, поразки, виходу та повтору"""
+        sink = QueueSink()
+        with EventStream([sink], flush_interval=0.01) as events:
+            play(events, ['40', '60', '50', 'так'] + ['1'] * MAX_ATTEMPTS + ['y', 'exit', 'ні'])
+
+        kinds = [(type(event), getattr(event, 'session', None)) for event in drain(sink)]
+        assert kinds == (
+            [(SessionStart, 1), (Guess, 1), (Guess, 1), (Guess, 1), (Win, 1), (Replay, None)]
+            + [(SessionStart, 2)] + [(Guess, 2)] * MAX_ATTEMPTS + [(Loss, 2), (Replay, None)]
+            + [(SessionStart, 3), (Exit, 3), (Replay, None)])
+
+    def test_guess_carries_hint_direction(self):
+        """Тест напрямку підказки в подіях здогадок"""
+        sink = QueueSink()
+        with EventStream([sink]) as events:
+            play(events, ['40', '60', '50', 'ні'])
+
+        guesses = [event for event in drain(sink) if isinstance(event, Guess)]
+        assert [(g.attempt, g.guess, g.direction) for g in guesses] == [
+            (1, 40, TOO_SMALL), (2, 60, TOO_BIG), (3, 50, 0)]
+
+    def test_timed_out_attempts_are_events(self):
+        """Тест що пропущені через тайм-аут спроби не лишають пропусків у нумерації"""
+        answers = iter(['40', None, '60', None])
+
+        def reader(prompt=''):
+            answer = next(answers, '50')
+            if answer is None:
+                raise InputTimeout()
+            return answer
+
+        sink = QueueSink()
+        with EventStream([sink]) as events:
+            play_game(reader, [].append, FixedRandom(50), events=events)
+
+        attempts = [(type(event), event.attempt) for event in drain(sink)
+                    if not isinstance(event, SessionStart)]
+        assert attempts == [(Guess, 1), (Skip, 2), (Guess, 3), (Skip, 4), (Guess, 5), (Win, 5)]
+
+    def test_file_sink_jsonl(self, tmp_path):
+        """Тест запису подій у JSONL-файл"""
+        path = tmp_path / "events.jsonl"
+        with EventStream([FileSink(path)]) as events:
+            play(events, ['50', 'ні'])
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record['type'] for record in records] == ['session_start', 'guess', 'win', 'replay']
+        assert records[2] == {**records[2], 'session': 1, 'attempt': 1, 'target': 50}
+
+    def test_socket_sink(self):
+        """Тест передачі подій у локальний Unix-сокет"""
+        with tempfile.TemporaryDirectory() as directory:
+            address = os.path.join(directory, 'events.sock')
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(address)
+            server.listen()
+            with EventStream([SocketSink(address)]) as events:
+                play(events, ['50', 'ні'])
+            conn, _ = server.accept()
+            data = b''
+            while chunk := conn.recv(65536):
+                data += chunk
+            conn.close()
+            server.close()
+
+        assert [json.loads(line)['type'] for line in data.splitlines()] == [
+            'session_start', 'guess', 'win', 'replay']
+
+    def test_flush_by_size_and_time(self):
+        """Тест запису пакета за розміром та за часом"""
+        sink = QueueSink()
+        events = EventStream([sink], batch_size=3, flush_interval=60)
+        for answer in (True, False, True):
+            events.replay(answer)
+        assert isinstance(sink.queue.get(timeout=5), Replay)
+        events.close()
+
+        sink = QueueSink()
+        events = EventStream([sink], batch_size=1000, flush_interval=0.01)
+        events.replay(True)
+        assert sink.queue.get(timeout=5).answer is True
+        events.close()
+
+    def test_drop_counters(self):
+        """Тест відкидання подій при переповненні черги"""
+        sink = GatedSink()
+        events = EventStream([sink], capacity=10, batch_size=1, flush_interval=0.01)
+        accepted = sum(events.emit(Replay(True, 0.0)) for _ in range(200))
+        sink.gate.set()
+        events.close()
+
+        counters = events.counters()
+        assert counters['dropped'] == 200 - accepted > 0
+        assert counters['written'] == accepted == len(sink.events)
+
+    def test_block_never_drops(self):
+        """Тест режиму block: гра чекає, але подій не втрачає"""
+        sink = GatedSink()
+        events = EventStream([sink], capacity=4, batch_size=2, flush_interval=0.01,
+                             backpressure=BACKPRESSURE_BLOCK)
+        threading.Timer(0.05, sink.gate.set).start()
+        start = time.monotonic()
+        for index in range(100):
+            events.emit(Replay(bool(index % 2), 0.0))
+        events.close()
+
+        assert time.monotonic() - start >= 0.04
+        assert events.dropped == 0 and len(sink.events) == 100
+
+    def test_sample_mode(self):
+        """Тест вибірки подій під навантаженням"""
+        sink = GatedSink()
+        events = EventStream([sink], capacity=100, batch_size=1000, flush_interval=60,
+                             backpressure=BACKPRESSURE_SAMPLE, sample_every=10)
+        for _ in range(1000):
+            events.emit(Replay(True, 0.0))
+        sink.gate.set()
+        events.close()
+
+        assert events.sampled > 0
+        assert len(sink.events) + events.sampled + events.dropped == 1000
+        # До половини черги приймається все, далі - кожна десята
+        assert 50 < len(sink.events) < 200
+
+    def test_sink_errors_do_not_stop_writer(self):
+        """Тест що помилка приймача не зупиняє запис в інші"""
+
+        class BrokenSink:
+            def write_batch(self, events):
+                raise OSError("недоступний")
+
+            def close(self):
+                pass
+
+        sink = QueueSink(queue.Queue())
+        with EventStream([BrokenSink(), sink]) as events:
+            play(events, ['50', 'ні'])
+
+        assert events.sink_errors >= 1
+        assert len(drain(sink)) == 4
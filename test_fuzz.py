@@ -0,0 +1,96 @@
+import os
+import re
+
+import pytest
+
+from engine import GUESS_INVALID, GUESS_OK, GameConfig
+from fuzz import (
+    ACCEPTED, CONFIGS, EXITED, REJECTED, Driver, InputCases, check_case, expected_outcome, fuzz,
+)
+from main import DEFAULT_CONFIG, EXIT_COMMANDS, MAX_NUMBER, MIN_NUMBER
+
+
+class AcceptAllConfig(GameConfig):
+    """Зламана валідація: приймає будь-що як 0"""
+
+    __slots__ = ()
+
+    def parse_guess(self, text, exit_commands):
+        return GUESS_OK, 0
+
+
+class RejectAllConfig(GameConfig):
+    """Зламана валідація: нічого не приймає"""
+
+    __slots__ = ()
+
+    def parse_guess(self, text, exit_commands):
+        return GUESS_INVALID, None
+
+
+class TestFuzz:
+    """Тести фазингу валідації введення"""
+
+    def test_no_violations(self):
+        """Тест що валідація проходить усі згенеровані випадки"""
+        report = fuzz(30_000, seed=1)
+
+        assert report['violation_count'] == 0, report['violations']
+        assert min(report[ACCEPTED], report[EXITED], report[REJECTED]) > 1_000
+
+    def test_oracle(self):
+        """Тест оракула на відомих випадках"""
+        assert expected_outcome('٥٠', DEFAULT_CONFIG) == (ACCEPTED, 50)
+        assert expected_outcome(' +07\t', DEFAULT_CONFIG) == (ACCEPTED, 7)
+        assert expected_outcome('²', DEFAULT_CONFIG) == (REJECTED, None)
+        assert expected_outcome('ВиХіД', DEFAULT_CONFIG) == (EXITED, None)
+        assert expected_outcome(' exit', DEFAULT_CONFIG) == (REJECTED, None)
+        assert expected_outcome(str(MAX_NUMBER + 1), DEFAULT_CONFIG) == (REJECTED, MAX_NUMBER + 1)
+        assert expected_outcome('5' * 100, DEFAULT_CONFIG) == (REJECTED, int('5' * 100))
+        assert expected_outcome('50' + ' ' * 20, DEFAULT_CONFIG) == (ACCEPTED, 50)
+        assert expected_outcome('0' * 5000 + '42', DEFAULT_CONFIG) == (ACCEPTED, 42)
+        assert expected_outcome('²' * 30, DEFAULT_CONFIG) == (REJECTED, None)
+
+    def test_detects_broken_validation(self):
+        """Тест що порушення інваріантів виявляються"""
+        driver = Driver()
+        loose = AcceptAllConfig(MIN_NUMBER, MAX_NUMBER, exit_commands=EXIT_COMMANDS)
+        strict = RejectAllConfig(MIN_NUMBER, MAX_NUMBER, exit_commands=EXIT_COMMANDS)
+
+        assert check_case(driver, 'abc', loose)[1]
+        assert check_case(driver, '50', strict)[1] == "цикл не завершився"
+        assert fuzz(300, configs=(loose,))['violation_count'] > 0
+
+    @pytest.mark.parametrize("text, outcome", [
+        ('0+5' + ' ' * 30, REJECTED),
+        ('00  25' + ' ' * 25, REJECTED),
+        ('0' * 25 + '-5', REJECTED),
+        ('٠०0' * 10 + '\t' + '0' * 10 + '42', REJECTED),
+        ('0_' * 15 + '_5', REJECTED),
+        ('+' + '０' * 30 + '73', ACCEPTED),
+    ])
+    def test_zero_padded_cases(self, text, outcome):
+        """Тест довгих рядків з нулями, за якими йдуть знак, пробіл або "_\""""
+        for config in CONFIGS:
+            assert check_case(Driver(), text, config) == (outcome, None)
+
+    def test_zero_padded_maker(self):
+        """Тест що генератор дає нулі довші за max_length зі вставками між ними"""
+        generate = InputCases(7)
+        cases = [generate.zero_padded(DEFAULT_CONFIG) for _ in range(500)]
+        assert all(len(text) > DEFAULT_CONFIG.max_length for text in cases)
+        assert sum(bool(re.search(r'\d[-+_\s]', text.strip())) for text in cases) > 100
+        assert sum(expected_outcome(text, DEFAULT_CONFIG)[0] == ACCEPTED for text in cases) > 50
+
+    def test_reproducible_cases(self):
+        """Тест відтворюваності випадків за seed"""
+        first, second = InputCases(5), InputCases(5)
+        assert [first(DEFAULT_CONFIG) for _ in range(200)] == \
+            [second(DEFAULT_CONFIG) for _ in range(200)]
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(not os.environ.get('GUESS_BENCH'),
+                        reason="вимірювання часу: лише з GUESS_BENCH=1")
+    def test_throughput(self):
+        """Тест що харнес вкладається в мільйон випадків за хвилину"""
+        assert fuzz(20_000, seed=2)['cases_per_min'] > 1_000_000
@@ -0,0 +1,86 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fakes import FixedRandom
+from gamelog import (
+    HEADER_SIZE, OUTCOME_EXIT, OUTCOME_LOSS, OUTCOME_MISS, OUTCOME_WIN,
+    RECORD_SIZE, GameLogError, GameLogReader, GameRecorder,
+)
+from main import main, play_game, stream_io
+
+
+def play(recorder, answers, target):
+    reader, writer = stream_io(io.StringIO("".join(a + "\n" for a in answers)), io.StringIO())
+    main(reader, writer, FixedRandom(target), recorder=recorder)
+
+
+class TestGameLog:
+    """Тести двійкового журналу ходів"""
+
+    def test_records_every_guess(self, tmp_path):
+        """Тест запису перемоги, поразки та виходу"""
+        path = tmp_path / "games.log"
+        with GameRecorder(path) as recorder:
+            play(recorder, ['30', 'abc', '50', 'так',
+                            '1', '2', '3', '4', '5', '6', '7', 'так',
+                            'exit', 'ні'], target=50)
+
+        with GameLogReader(path) as log:
+            assert len(log) == 2 + 7 + 1
+            assert log.column('session').tolist() == [1, 1] + [2] * 7 + [3]
+            assert log.column('guess')[:2].tolist() == [30, 50]
+            assert log.column('hint')[:2].tolist() == [-1, 0]
+            assert log.column('attempt')[2:9].tolist() == list(range(1, 8))
+            assert log.column('outcome').tolist() == (
+                [OUTCOME_MISS, OUTCOME_WIN] + [OUTCOME_MISS] * 6 + [OUTCOME_LOSS, OUTCOME_EXIT])
+            assert log[-1] == (3, 0, 1, 0, OUTCOME_EXIT)
+
+    def test_columns_are_zero_copy_views(self, tmp_path):
+        """Тест що стовпці - представлення над mmap, а не копії"""
+        path = tmp_path / "games.log"
+        with GameRecorder(path, buffer_records=3) as recorder:
+            for session_id in range(1, 101):
+                recorder.record(session_id, 1, session_id, 0, OUTCOME_WIN)
+
+        log = GameLogReader(path)
+        guesses = log.column('guess')
+        assert not guesses.flags.owndata
+        assert guesses.sum() == sum(range(1, 101))
+        assert len(log.raw()) == 100 * RECORD_SIZE
+        del guesses
+        log.close()
+
+    def test_append_continues_session_ids(self, tmp_path):
+        """Тест дописування у наявний журнал, у т.ч. з неповним записом"""
+        path = tmp_path / "games.log"
+        with GameRecorder(path) as recorder:
+            play_game(*stream_io(io.StringIO("50\n"), io.StringIO()),
+                      rng=FixedRandom(50), recorder=recorder)
+        with open(path, 'ab') as file:
+            file.write(b'\x01\x02\x03')  # обірваний запис
+
+        with GameRecorder(path) as recorder:
+            assert recorder.begin_session() == 2
+
+        assert path.stat().st_size == HEADER_SIZE + RECORD_SIZE
+
+    def test_interleaved_sessions_keep_ids_unique(self, tmp_path):
+        """Тест що нумерація продовжується від найбільшої сесії, а не від останнього запису"""
+        path = tmp_path / "games.log"
+        with GameRecorder(path) as recorder:
+            first, second = recorder.begin_session(), recorder.begin_session()
+            recorder.record(second, 1, 40, -1, OUTCOME_MISS)
+            recorder.record(first, 1, 50, 0, OUTCOME_WIN)
+
+        with GameRecorder(path) as recorder:
+            assert recorder.begin_session() == 3
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Тест відмови читати файл іншого формату"""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b'x' * 64)
+        with pytest.raises(GameLogError):
+            GameLogReader(path)
@@ -0,0 +1,79 @@
+import asyncio
+import random
+
+import pytest
+
+from loadgen import Bot, LatencyHistogram, run_load, run_network
+from server import start_server
+
+
+class TestLatencyHistogram:
+    """Тести гістограми затримок"""
+
+    def test_percentiles_within_relative_error(self):
+        """Тест похибки перцентилів проти точного сортування"""
+        rng = random.Random(1)
+        values = [int(rng.lognormvariate(10, 1.5)) for _ in range(20_000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for q in (50, 90, 99, 99.9):
+            exact = values[max(0, -(-int(q * 10) * len(values) // 1000) - 1)]
+            assert exact <= histogram.percentile(q) <= exact * (1 + 2 ** -6)
+        assert histogram.percentile(100) == histogram.max == values[-1]
+        assert len(histogram.counts) < 2000
+
+    def test_small_values_are_exact_and_merge(self):
+        """Тест точних малих значень та об'єднання"""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in range(100):
+            (first if value % 2 else second).record(value)
+        merged = first.merge(second)
+        assert merged.count == 100 and merged.min == 0
+        assert merged.percentile(50) == 49
+        with pytest.raises(ValueError):
+            merged.merge(LatencyHistogram(significant_bits=5))
+
+
+class TestLoadGenerator:
+    """Тести ботів та режимів навантаження"""
+
+    def test_in_process_binary_bots_always_win(self):
+        """Тест ботів бінарного пошуку через main()"""
+        report = run_load(bots=4, games=25, strategy='binary', seed=3)
+        assert report['mode'] == 'in-process'
+        assert report['games'] == report['wins'] == 100
+        assert report['errors'] == 0
+        assert 100 <= report['guesses'] <= 700
+        assert set(report['latency_us']) >= {'p50', 'p99', 'p99.9', 'max'}
+
+    def test_random_strategy(self):
+        """Тест випадкової стратегії"""
+        report = run_load(bots=2, games=50, strategy='random', seed=5)
+        assert report['games'] == 100 and report['errors'] == 0
+        assert 0 < report['wins'] <= 100
+
+    def test_network_mode(self):
+        """Тест ботів проти TCP-сервера"""
+        bots = [Bot(3, 'binary') for _ in range(20)]
+        histograms = [LatencyHistogram() for _ in bots]
+
+        async def scenario():
+            server = await start_server('127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                errors = await run_network('127.0.0.1', port, bots, histograms)
+                await asyncio.sleep(0.01)
+                return errors
+
+        assert asyncio.run(scenario()) == 0
+        assert all(bot.games == bot.wins == 3 and bot.errors == 0 for bot in bots)
+        assert sum(histogram.count for histogram in histograms) == sum(bot.guesses for bot in bots)
+
+    def test_unknown_prompt_is_an_error(self):
+        """Тест реакції на нерозпізнане запрошення"""
+        bot = Bot(1)
+        assert bot.answer("Щось інше: ") is None
+        assert bot.errors == 1
@@ -9,8 +9,15 @@ from main import (
     give_hint,
     play_game,
     ask_play_again,
-    main
+    main,
+    attempt_message,
+    hint_message,
+    win_message,
+    loss_message,
+    parse_config,
+    stream_io,
 )
+from engine import GameConfig
 
 
 class TestDisplayWelcome:
@@ -147,7 +154,8 @@ class TestPlayGame:
         assert "ВІТАЄМО! ВИ ВГАДАЛИ!" in captured.out
         assert "Неймовірна удача!" in captured.out
         mock_welcome.assert_called_once()
-        mock_guess.assert_called_once_with(1, 7)
+        mock_guess.assert_called_once()
+        assert mock_guess.call_args.args == (1, 7)
 
     @mock.patch('random.randint', return_value=50)
     @mock.patch('main.get_player_guess', side_effect=[30, 70, 50])
@@ -171,7 +179,8 @@ class TestPlayGame:
         play_game()
 
         mock_welcome.assert_called_once()
-        mock_guess.assert_called_once_with(1, 7)
+        mock_guess.assert_called_once()
+        assert mock_guess.call_args.args == (1, 7)
 
     @mock.patch('random.randint', return_value=50)
     @mock.patch('main.get_player_guess', side_effect=[1, 2, 3, 4, 5, 6, 7])
@@ -186,6 +195,70 @@ class TestPlayGame:
         assert mock_guess.call_count == 7
 
 
+class TestBufferedOutput:
+    """Тести буферизованого виводу консолі"""
+
+    def test_one_write_per_turn(self):
+        """Тест що вивід кожного ходу записується одним викликом"""
+        stream = io.StringIO()
+        with mock.patch('sys.stdout', stream), \
+                mock.patch.object(stream, 'write', wraps=stream.write) as mock_write, \
+                mock.patch('random.randint', return_value=50), \
+                mock.patch('builtins.input', side_effect=['30', '50']):
+            play_game()
+
+        # Банер + перша спроба, підказка + друга спроба, перемога
+        assert mock_write.call_count == 3
+        assert "Занадто маленьке!" in stream.getvalue()
+        assert "Залишилось спроб: 6" in stream.getvalue()
+
+    def test_message_templates(self):
+        """Тест готових шаблонів повідомлень"""
+        assert attempt_message(2, 7) == "\n📝 Спроба 2/7"
+        assert hint_message(30, 50) == "📈 Занадто маленьке! Спробуйте більше число."
+        assert hint_message(50, 50) == ""
+        assert "Непогано!" in win_message(50, 7)
+        assert "Загадане число було: 42" in loss_message(42)
+
+
+class TestConfigurableRange:
+    """Тести гри з налаштованим діапазоном"""
+
+    def test_huge_range_game(self):
+        """Тест гри в діапазоні 1..10^18 з обчисленою кількістю спроб"""
+        config = GameConfig(1, 10 ** 18)
+        target = 123_456_789_012_345_678
+        output = io.StringIO()
+        reader, writer = stream_io(io.StringIO(f"{10 ** 18 + 1}\n1\n{target}\n"), output)
+
+        with mock.patch('random.randint', return_value=target) as mock_rand:
+            session = play_game(reader, writer, config=config)
+
+        mock_rand.assert_called_with(1, 10 ** 18)
+        assert session.won and session.attempt == 2
+        assert "Комп'ютер загадав число від 1 до 1000000000000000000" in output.getvalue()
+        assert "Спроба 2/60" in output.getvalue()
+        assert "Число має бути від 1 до 1000000000000000000!" in output.getvalue()
+
+    def test_parse_config(self):
+        """Тест налаштувань з командного рядка"""
+        assert parse_config([]).max_attempts == 7
+        assert parse_config(['--max', '1000000']).max_attempts == 20
+        with pytest.raises(SystemExit):
+            parse_config(['--min', '10', '--max', '1'])
+
+    @pytest.mark.parametrize('option', ['--log', '--wal'])
+    def test_binary_logs_reject_ranges_beyond_int64(self, option, capsys):
+        """Тест що --log та --wal відхиляють межі, які не вміщаються в int64"""
+        assert parse_config([option, 'games', '--max', str(2**63 - 1)]).max_number == 2**63 - 1
+        for bounds in (['--max', str(2**63)], ['--min', str(-2**63 - 1)]):
+            with pytest.raises(SystemExit):
+                parse_config([option, 'games'] + bounds)
+        assert "int64" in capsys.readouterr().err
+        with pytest.raises(SystemExit):
+            parse_config([option, 'games', '--attempts', str(2**16)])
+
+
 class TestMainFunction:
     """Тести для головної функції main"""
 
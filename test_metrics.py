@@ -0,0 +1,80 @@
+import io
+import threading
+import urllib.request
+
+from engine import GUESS_EXIT, GUESS_INVALID, GUESS_OK, GUESS_OUT_OF_RANGE
+from fakes import FixedRandom
+from main import main, stream_io
+from metrics import PHASES, GameMetrics
+
+
+ANSWERS = ['abc', '150', '30', '50', 'може', 'так',
+           '1', '2', '3', '4', '5', '6', '7', 'так',
+           'exit', 'ні']
+
+
+def play(answers, target=50, metrics=None):
+    out = io.StringIO()
+    reader, writer = stream_io(io.StringIO("".join(a + "\n" for a in answers)), out)
+    main(reader, writer, FixedRandom(target), metrics=metrics)
+    return out.getvalue()
+
+
+class TestGameMetrics:
+    """Тести інструментації ігрового циклу"""
+
+    def test_counters(self):
+        """Тест лічильників введення, результатів та відповідей"""
+        metrics = GameMetrics()
+        play(ANSWERS, metrics=metrics)
+        total = metrics.snapshot()
+
+        assert total.inputs == {GUESS_OK: 9, GUESS_INVALID: 1,
+                                GUESS_OUT_OF_RANGE: 1, GUESS_EXIT: 1}
+        assert total.wins_by_attempt == {2: 1}
+        assert (total.losses, total.exits) == (1, 1)
+        assert total.replay == {'yes': 2, 'no': 1, 'invalid': 1}
+        assert total.phase_calls['logic'] == 9
+        assert total.phase_calls['input_wait'] == len(ANSWERS)
+        assert all(total.phase_ns[phase] >= 0 for phase in PHASES)
+
+    def test_output_is_unchanged(self):
+        """Тест що увімкнені метрики не змінюють вивід гри"""
+        assert play(ANSWERS, metrics=GameMetrics()) == play(ANSWERS)
+
+    def test_threads_are_aggregated(self):
+        """Тест підсумовування накопичувачів різних потоків"""
+        metrics = GameMetrics()
+        threads = [threading.Thread(target=play, args=(['50', 'ні'],), kwargs={'metrics': metrics})
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.snapshot().wins_by_attempt == {1: 8}
+
+    def test_prometheus_export(self, tmp_path):
+        """Тест текстового формату, файлу та HTTP-ендпоінта"""
+        metrics = GameMetrics()
+        play(ANSWERS, metrics=metrics)
+        text = metrics.render_prometheus()
+
+        assert '# TYPE guess_game_inputs_total counter' in text
+        assert 'guess_game_inputs_total{status="invalid"} 1' in text
+        assert 'guess_game_wins_by_attempt_total{attempt="2"} 1' in text
+        assert 'guess_game_games_total{outcome="loss"} 1' in text
+        assert 'guess_game_phase_seconds_count{phase="validation"} 12' in text
+
+        path = tmp_path / "game.prom"
+        metrics.write_textfile(path)
+        assert path.read_text(encoding='utf-8') == text
+
+        server = metrics.serve_http(0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as response:
+                assert response.read().decode() == text
+        finally:
+            server.shutdown()
+            server.server_close()
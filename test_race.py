@@ -0,0 +1,209 @@
+import asyncio
+import unittest.mock as mock
+
+from engine import GameConfig
+from race import MAX_SUBSCRIBER_BUFFER, Lobby, Room, start_server
+from server import Connection
+
+
+class FakeTransport:
+    """Транспорт із заданим розміром буфера надсилання"""
+
+    def __init__(self, buffered=0):
+        self.buffered = buffered
+        self.aborted = False
+
+    def is_closing(self):
+        return self.aborted
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+    def abort(self):
+        self.aborted = True
+
+
+class FakeWriter:
+    """Записувач, що запам'ятовує кожен виклик write()"""
+
+    def __init__(self, buffered=0):
+        self.transport = FakeTransport(buffered)
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+
+def run_in_loop(scenario):
+    """Виконує синхронний сценарій всередині циклу подій і дає розсилці відпрацювати"""
+
+    async def runner():
+        result = scenario()
+        await asyncio.sleep(0)
+        return result
+
+    return asyncio.run(runner())
+
+
+async def read_until(reader, text):
+    """Читає рядки сервера, доки не з'явиться text; повертає прочитане"""
+    lines = []
+    while True:
+        line = await asyncio.wait_for(reader.readline(), 5)
+        assert line, f"З'єднання закрито до появи {text!r}: {lines}"
+        lines.append(line.decode().rstrip('\n'))
+        if text in lines[-1]:
+            return lines
+
+
+def run_with_server(scenario, lobby=None):
+    """Запускає сервер гонки на вільному порту та виконує сценарій клієнтів"""
+
+    async def runner():
+        server = await start_server('127.0.0.1', 0, lobby)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await scenario(port)
+
+    return asyncio.run(runner())
+
+
+class TestBroadcast:
+    """Тести пакетної розсилки стрічки кімнати"""
+
+    def test_one_encode_per_tick_shared_by_subscribers(self):
+        """Тест: рядки одного такту кодуються один раз, і ті самі байти йдуть усім"""
+        with mock.patch('random.randint', return_value=57):
+            room = Room(1)
+            writers = [FakeWriter() for _ in range(3)]
+
+            def scenario():
+                players = [room.join(Connection(None, writer)) for writer in writers]
+                room.guess(players[0], 10)
+                room.guess(players[1], 90)
+                return players
+
+            run_in_loop(scenario)
+
+        assert room.broadcasts == 1
+        data = writers[0].writes[0]
+        assert all(writer.writes == [data] and writer.writes[0] is data for writer in writers)
+        lines = data.decode().splitlines()
+        assert lines[-2:] == ["📣 Гравець 1: 10 -> діапазон 11-100",
+                              "📣 Гравець 2: 90 -> діапазон 11-89"]
+
+    def test_slow_subscriber_is_dropped(self):
+        """Тест відключення підписника з переповненим буфером надсилання"""
+        with mock.patch('random.randint', return_value=57):
+            room = Room(1)
+            fast, slow = FakeWriter(), FakeWriter(MAX_SUBSCRIBER_BUFFER + 1)
+            run_in_loop(lambda: [room.join(Connection(None, writer)) for writer in (fast, slow)])
+
+        assert len(fast.writes) == 1
+        assert slow.writes == [] and slow.transport.aborted
+        assert room.kicked == 1
+
+
+class TestRoom:
+    """Тести правил гонки в кімнаті"""
+
+    def test_private_hint_and_remaining(self):
+        """Тест особистої підказки give_hint() та залишку спроб"""
+        with mock.patch('random.randint', return_value=57):
+            room = Room(1)
+            conn = Connection(None, FakeWriter())
+            run_in_loop(lambda: room.guess(room.join(conn), 80))
+
+        assert any("Занадто велике!" in message for message in conn.pending)
+        assert conn.pending[-1] == "💡 Залишилось спроб: 6"
+
+    def test_nobody_guessed_starts_new_round(self):
+        """Тест нового раунду, коли всі гравці вичерпали спроби"""
+        config = GameConfig(1, 100, max_attempts=1)
+        with mock.patch('random.randint', side_effect=[57, 20]):
+            room = Room(1, config=config)
+            writer = FakeWriter()
+
+            def scenario():
+                players = [room.join(Connection(None, writer)),
+                           room.join(Connection(None, FakeWriter()))]
+                room.guess(players[0], 50)
+                assert room.round == 1
+                room.guess(players[1], 60)
+
+            run_in_loop(scenario)
+
+        output = writer.writes[0].decode()
+        assert "Ніхто не вгадав: було загадано 57." in output
+        assert "🔄 Раунд 2: число від 1 до 100" in output
+        assert room.target == 20
+        assert all(player.session.attempt == 0 for player in room.players.values())
+
+    def test_lobby_fills_rooms(self):
+        """Тест розподілу гравців по кімнатах room_size"""
+        lobby = Lobby(room_size=2)
+
+        def scenario():
+            rooms = []
+            for _ in range(3):
+                room = lobby.room_for_player()
+                room.join(Connection(None, FakeWriter()))
+                rooms.append(room)
+            return rooms
+
+        rooms = run_in_loop(scenario)
+
+        assert rooms[0] is rooms[1] and rooms[2] is not rooms[0]
+        assert [room.number for room in lobby.rooms] == [1, 2]
+
+
+class TestRaceServer:
+    """Тести TCP-сервера гонки"""
+
+    def test_first_correct_guess_wins(self):
+        """Тест: перша правильна здогадка виграє раунд для всіх"""
+
+        async def scenario(port):
+            first = await asyncio.open_connection('127.0.0.1', port)
+            await read_until(first[0], "Раунд 1")
+            second = await asyncio.open_connection('127.0.0.1', port)
+            await read_until(second[0], "Раунд 1")
+
+            first[1].write(b'40\n')
+            first_output = await read_until(first[0], "діапазон 41-100")
+            second_output = await read_until(second[0], "діапазон 41-100")
+            second[1].write(b'57\n')
+            second_output += await read_until(second[0], "Раунд 2")
+            first_output += await read_until(first[0], "Раунд 2")
+            for _, writer in (first, second):
+                writer.close()
+            return "\n".join(first_output), "\n".join(second_output)
+
+        with mock.patch('random.randint', side_effect=[57, 30]):
+            first_output, second_output = run_with_server(scenario)
+
+        assert "Занадто маленьке!" in first_output
+        assert "Занадто маленьке!" not in second_output
+        assert "📣 Гравець 1: 40 -> діапазон 41-100" in second_output
+        for output in (first_output, second_output):
+            assert "🏆 Гравець 2 вгадав число 57 зі спроби 1!" in output
+
+    def test_invalid_input_and_exit(self):
+        """Тест некоректного введення та виходу з кімнати"""
+        lobby = Lobby()
+
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            await read_until(reader, "Раунд 1")
+            writer.write(b'abc\n0\nexit\n')
+            output = await read_until(reader, "До побачення")
+            assert await reader.read() == b''
+            writer.close()
+            return "\n".join(output)
+
+        with mock.patch('random.randint', return_value=57):
+            output = run_with_server(scenario, lobby)
+
+        assert "Введіть ціле число!" in output
+        assert "Число має бути від 1 до 100!" in output
+        assert lobby.rooms == []
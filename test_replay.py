@@ -0,0 +1,97 @@
+import io
+import json
+import random
+import tracemalloc
+
+from fakes import FixedRandom
+from main import DEFAULT_CONFIG, MAX_ATTEMPTS, main, stream_io
+from replay import (
+    OUTCOME_EXIT, OUTCOME_LOSS, OUTCOME_WIN, play_transcripts, run_batch, write_results,
+)
+
+
+def batch(text, rng=None, config=None):
+    out = io.StringIO()
+    games = run_batch(io.StringIO(text), out, rng or random.Random(0), config)
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert games == len(results)
+    return results
+
+
+class TestPlayTranscripts:
+    """Тести пакетного режиму"""
+
+    def test_win_loss_and_exit(self):
+        """Тест результатів гри та полів JSON"""
+        text = "50\n57\nтак\n" + "1\n" * MAX_ATTEMPTS + "yes\nEXIT\nні\n"
+        results = batch(text, FixedRandom(57, 100, 30))
+
+        assert results == [
+            {"target": 57, "guesses": [50, 57], "outcome": OUTCOME_WIN, "attempts": 2},
+            {"target": 100, "guesses": [1] * MAX_ATTEMPTS, "outcome": OUTCOME_LOSS,
+             "attempts": MAX_ATTEMPTS},
+            {"target": 30, "guesses": [], "outcome": OUTCOME_EXIT, "attempts": 0},
+        ]
+
+    def test_invalid_lines_ignored(self):
+        """Тест що некоректні рядки не коштують спроб, як у main()"""
+        text = "abc\n0\n101\n" + "9" * 500 + "\n 42 \r\nможе\nні\nтак\n"
+        results = batch(text, FixedRandom(42))
+
+        assert results == [{"target": 42, "guesses": [42], "outcome": OUTCOME_WIN,
+                            "attempts": 1}]
+
+    def test_unfinished_game_not_reported(self):
+        """Тест що гра, обірвана кінцем введення, не виводиться"""
+        assert batch("50\n57\nтак\n10", FixedRandom(57, 90)) == batch("50\n57\n", FixedRandom(57))
+        assert batch("") == []
+
+    def test_matches_interactive_main(self):
+        """Тест що результати збігаються зі статистикою main() на тому ж введенні"""
+        rng = random.Random(7)
+        lines = []
+        for _ in range(300):
+            lines += [rng.choice(['50', 'x', '0', str(rng.randint(1, 100)), 'quit'])
+                      for _ in range(rng.randint(1, 9))]
+            lines.append(rng.choice(['так', 'y', 'може']))
+        text = "\n".join(lines) + "\nні\nні\n"
+
+        reader, writer = stream_io(io.StringIO(text), io.StringIO())
+        stats = main(reader, writer, random.Random(1))
+        results = batch(text, random.Random(1))
+
+        outcomes = [result['outcome'] for result in results]
+        assert outcomes.count(OUTCOME_WIN) == stats.games_won
+        assert outcomes.count(OUTCOME_LOSS) == stats.games_lost
+        assert outcomes.count(OUTCOME_EXIT) == stats.games_exited
+
+    def test_constant_memory(self):
+        """Тест що пам'ять не залежить від кількості ігор"""
+
+        def transcripts(games):
+            for _ in range(games):
+                yield from ("50\n", "25\n", "1\n", "так\n")
+
+        class NullWriter:
+            def write(self, text):
+                pass
+
+        peaks = []
+        for games in (2_000, 20_000):
+            tracemalloc.start()
+            results = play_transcripts(transcripts(games), FixedRandom(), DEFAULT_CONFIG)
+            played = write_results((str(result) for result in results), NullWriter(),
+                                   batch_games=256)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            assert played == games
+
+        assert peaks[1] < peaks[0] * 2
+
+    def test_custom_config(self):
+        """Тест власного діапазону"""
+        config = DEFAULT_CONFIG.__class__(1, 10, 2)
+        results = batch("11\n5\n6\n", FixedRandom(7), config)
+
+        assert results[0]["outcome"] == OUTCOME_LOSS
+        assert results[0]["guesses"] == [5, 6]
@@ -0,0 +1,174 @@
+import asyncio
+import unittest.mock as mock
+
+import pytest
+
+from server import MAX_LINE_LENGTH, start_server
+
+
+async def read_until_prompt(reader):
+    """Читає рядки сервера до наступного запрошення (або до кінця з'єднання)"""
+    lines = []
+    while True:
+        line = await reader.readline()
+        if not line:
+            return lines
+        text = line.decode().rstrip('\n')
+        lines.append(text)
+        if text.endswith(': '):
+            return lines
+
+
+async def play_transcript(port, answers):
+    """Проходить сесію з набором відповідей та повертає весь вивід"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    output = await read_until_prompt(reader)
+    for answer in answers:
+        writer.write(answer.encode() + b'\n')
+        await writer.drain()
+        output += await read_until_prompt(reader)
+    writer.close()
+    return "\n".join(output)
+
+
+def run_with_server(scenario, **server_kwargs):
+    """Запускає сервер на вільному порту та виконує сценарій клієнта"""
+
+    async def runner():
+        server = await start_server('127.0.0.1', 0, **server_kwargs)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await scenario(port)
+
+    return asyncio.run(runner())
+
+
+class TestGameServer:
+    """Тести TCP-сервера гри"""
+
+    def test_winning_game_and_goodbye(self):
+        """Тест виграшної гри та відмови від повтору"""
+        with mock.patch('random.randint', return_value=57):
+            output = run_with_server(
+                lambda port: play_transcript(port, ['50', '60', '57', 'ні']))
+
+        assert "Вітаємо у грі 'Вгадай число'!" in output
+        assert "Занадто маленьке!" in output
+        assert "Занадто велике!" in output
+        assert "Спроба 3/7" in output
+        assert "ВІТАЄМО! ВИ ВГАДАЛИ!" in output
+        assert output.endswith("Дякуємо за гру! До побачення!")
+
+    def test_exit_and_replay(self):
+        """Тест команди виходу та повторної гри"""
+        with mock.patch('random.randint', side_effect=[30, 80]):
+            output = run_with_server(
+                lambda port: play_transcript(port, ['EXIT', 'може', 'так', '80', 'no']))
+
+        assert "👋 Дякуємо за гру! До побачення!" in output
+        assert "Введіть 'так' або 'ні'" in output
+        assert "Початок нової гри!" in output
+        assert "Загадане число: 80" in output
+
+    def test_invalid_and_oversized_input(self):
+        """Тест некоректного та надто довгого введення"""
+        with mock.patch('random.randint', return_value=50):
+            output = run_with_server(lambda port: play_transcript(
+                port, ['abc', '1' * (MAX_LINE_LENGTH * 4), '0', '50', 'ні']))
+
+        assert "Введіть ціле число!" in output
+        assert "Число має бути від 1 до 100!" in output
+        assert "Кількість спроб: 1" in output
+
+    def test_oversized_line_arriving_in_parts(self):
+        """Тест що хвіст надто довгого рядка, який надійшов пізніше, не стає відповіддю"""
+
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            output = await read_until_prompt(reader)
+            writer.write(b'x' * (MAX_LINE_LENGTH * 3))
+            await writer.drain()
+            await asyncio.sleep(0.05)
+            writer.write(b'50\n')
+            output += await read_until_prompt(reader)
+            writer.write(b'exit\n')
+            output += await read_until_prompt(reader)
+            writer.close()
+            return "\n".join(output)
+
+        with mock.patch('random.randint', return_value=50):
+            output = run_with_server(scenario)
+
+        assert output.count("Введіть ціле число!") == 1
+        assert "ВІТАЄМО" not in output
+        assert "До побачення!" in output
+
+    def test_loss(self):
+        """Тест поразки після всіх спроб"""
+        with mock.patch('random.randint', return_value=100):
+            output = run_with_server(lambda port: play_transcript(
+                port, [str(n) for n in range(1, 8)] + ['ні']))
+
+        assert "СПРОБИ ЗАКІНЧИЛИСЬ!" in output
+        assert "Загадане число було: 100" in output
+
+    def test_seeded_targets_are_reproducible(self):
+        """Тест відтворюваних загаданих чисел з'єднань при заданому seed"""
+        answers = [str(n) for n in range(1, 8)] + ['ні']
+        pytest.importorskip("numpy")
+        runs = [run_with_server(lambda port: play_transcript(port, answers), seed=9)
+                for _ in range(2)]
+
+        assert "Загадане число було" in runs[0] or "ВІТАЄМО" in runs[0]
+        assert runs[0] == runs[1]
+
+    def test_attempt_timeout_costs_attempt(self):
+        """Тест тайм-ауту відповіді: спробу зараховано, гра триває"""
+
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            output = await read_until_prompt(reader)
+            # Мовчимо до тайм-ауту, потім відповідаємо
+            output += await read_until_prompt(reader)
+            writer.write(b'50\nni\n')
+            output += await read_until_prompt(reader)
+            writer.close()
+            return "\n".join(output)
+
+        with mock.patch('random.randint', return_value=50):
+            output = run_with_server(scenario, attempt_timeout=0.05)
+
+        assert "Час на відповідь вичерпано!" in output
+        assert "Залишилось спроб: 6" in output
+        assert "Кількість спроб: 2" in output
+
+    def test_idle_clients_released_by_session_timeout(self):
+        """Тест дедлайну сесії: мовчазні клієнти відключаються без окремих потоків"""
+
+        async def idle_client(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            data = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return data.decode()
+
+        async def scenario(port):
+            return await asyncio.gather(*(idle_client(port) for _ in range(100)))
+
+        outputs = run_with_server(scenario, session_timeout=0.1)
+
+        assert all("Час сесії вичерпано!" in output for output in outputs)
+        assert all(output.endswith("До побачення!\n") for output in outputs)
+
+    @pytest.mark.slow
+    def test_many_concurrent_sessions(self):
+        """Тест сотень одночасних сесій на одному циклі подій"""
+
+        async def scenario(port):
+            transcripts = [play_transcript(port, ['50', 'ні']) for _ in range(300)]
+            return await asyncio.gather(*transcripts)
+
+        with mock.patch('random.randint', return_value=50):
+            outputs = run_with_server(scenario)
+
+        assert len(outputs) == 300
+        assert all("ВІТАЄМО! ВИ ВГАДАЛИ!" in output for output in outputs)
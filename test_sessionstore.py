@@ -0,0 +1,93 @@
+import tracemalloc
+
+import pytest
+
+from engine import GuessEngine
+from sessionstore import EVICT_CAPACITY, EVICT_IDLE, EVICT_MEMORY, SessionStore
+
+
+class FakeClock:
+    """Керований годинник для перевірки тайм-аутів"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def new_engine(target=50):
+    return GuessEngine(target, 1, 100, 7)
+
+
+class TestSessionStore:
+    """Тести сховища сесій"""
+
+    def test_lru_eviction(self):
+        """Тест витіснення найдавніше використаної сесії"""
+        evicted = []
+        store = SessionStore(capacity=2, on_evict=lambda *args: evicted.append(args[::2]))
+        store.put(1, new_engine())
+        store.put(2, new_engine())
+        store.get(1)
+        store.put(3, new_engine())
+
+        assert 2 not in store and 1 in store and 3 in store
+        assert evicted == [(2, EVICT_CAPACITY)]
+        assert store.evictions[EVICT_CAPACITY] == 1
+
+    def test_idle_ttl(self):
+        """Тест тайм-ауту простою з оновленням при зверненні"""
+        clock = FakeClock()
+        store = SessionStore(idle_ttl=10, clock=clock)
+        store.put('a', new_engine())
+        store.put('b', new_engine())
+        clock.now = 8
+        assert store.get('a') is not None
+        clock.now = 12
+
+        assert store.get('b') is None
+        assert store.get('a') is not None
+        clock.now = 30
+        assert store.expire() == 1
+        assert len(store) == 0 and store.bytes_used == 0
+        assert store.evictions[EVICT_IDLE] == 2
+
+    def test_memory_ceiling(self):
+        """Тест обмеження пам'яті та обліку байтів"""
+        store = SessionStore(max_bytes=1000, sizeof=lambda session: 300)
+        for session_id in range(5):
+            store.put(session_id, new_engine())
+        store.put(4, new_engine())
+
+        assert list(store._entries) == [2, 3, 4]
+        assert store.bytes_used == 900
+        assert store.evictions[EVICT_MEMORY] == 2
+        assert store.pop(3) is not None and store.bytes_used == 600
+        assert store.pop(3, 'нема') == 'нема'
+
+    def test_memory_is_flat_under_churn(self):
+        """Тест сталої пам'яті при потоці короткоживучих сесій"""
+        clock = FakeClock()
+        store = SessionStore(capacity=1000, idle_ttl=5, clock=clock)
+
+        def churn(start, count):
+            for session_id in range(start, start + count):
+                clock.now = session_id / 100
+                store.put(session_id, new_engine(session_id % 100 + 1))
+                if session_id % 3 == 0:
+                    store.pop(session_id)
+
+        churn(0, 20_000)
+        tracemalloc.start()
+        churn(20_000, 50_000)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(store) <= 1000
+        assert peak < 512 * 1024, f"Пік пам'яті {peak} байт"
+
+    def test_invalid_capacity(self):
+        """Тест некоректної місткості"""
+        with pytest.raises(ValueError):
+            SessionStore(capacity=0)
@@ -0,0 +1,106 @@
+import random
+import tracemalloc
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine import GuessEngine
+from main import MAX_ATTEMPTS
+from sessiontable import (
+    STATUS_ACTIVE, STATUS_FREE, STATUS_LOST, STATUS_WON, SessionTable, TableFullError,
+)
+
+
+def engine_state(table, slot):
+    return table.session(slot).state()
+
+
+class TestSessionTable:
+    """Тести таблиці сесій у паралельних масивах"""
+
+    def test_matches_guess_engine(self):
+        """Тест однакових підказок і стану з GuessEngine"""
+        rng = random.Random(4)
+        table = SessionTable(50)
+        engines = {}
+        for _ in range(50):
+            target = rng.randint(1, 100)
+            engines[table.allocate(target)] = GuessEngine(target, 1, 100, MAX_ATTEMPTS)
+
+        for _ in range(MAX_ATTEMPTS):
+            for slot, engine in engines.items():
+                if engine.finished:
+                    with pytest.raises(RuntimeError):
+                        table.guess(slot, 50)
+                    continue
+                number = rng.randint(1, 100)
+                assert table.guess(slot, number) == engine.guess(number)
+                assert engine_state(table, slot) == engine.state()
+                assert table.finished(slot) == engine.finished
+                assert table.remaining(slot) == engine.remaining
+
+    def test_guess_many_matches_single_guesses(self):
+        """Тест векторизованого пакету ходів"""
+        rng = np.random.default_rng(2)
+        targets = rng.integers(1, 101, size=1000)
+        batch, single = SessionTable(1000), SessionTable(1000)
+        slots = batch.allocate_many(targets)
+        for target in targets:
+            single.allocate(int(target))
+
+        for _ in range(3):
+            numbers = rng.integers(1, 101, size=len(slots))
+            active = np.frombuffer(batch.status, dtype=np.uint8)[slots] == STATUS_ACTIVE
+            outcome = batch.guess_many(slots[active], numbers[active])
+            expected = [single.guess(int(slot), int(number))
+                        for slot, number in zip(slots[active], numbers[active])]
+            assert outcome.tolist() == expected
+
+        for column_a, column_b in zip(batch.columns(), single.columns()):
+            assert np.array_equal(column_a, column_b)
+
+    def test_free_list_reuse(self):
+        """Тест перевикористання звільнених слотів"""
+        table = SessionTable(3)
+        slots = [table.allocate(10) for _ in range(3)]
+        assert slots == [0, 1, 2] and len(table) == 3
+        with pytest.raises(TableFullError):
+            table.allocate(10)
+
+        table.guess(1, 10)
+        assert table.status[1] == STATUS_WON
+        table.release(1)
+        assert table.status[1] == STATUS_FREE
+        with pytest.raises(ValueError):
+            table.release(1)
+        assert table.allocate(20) == 1
+        assert engine_state(table, 1)[4:] == (0, 1, 100, False)
+
+    def test_loss_and_validation(self):
+        """Тест поразки та некоректних ходів"""
+        table = SessionTable(1, max_attempts=2)
+        slot = table.allocate(100)
+        with pytest.raises(ValueError):
+            table.guess(slot, 101)
+        table.guess(slot, 1)
+        table.guess(slot, 2)
+        assert table.status[slot] == STATUS_LOST
+        with pytest.raises(ValueError):
+            table.allocate(0)
+
+    def test_million_sessions_memory(self):
+        """Тест пам'яті мільйона одночасних ігор (як test_multiple_games_memory_usage)"""
+        count = 1_000_000
+        targets = np.random.default_rng(0).integers(1, 101, size=count)
+
+        tracemalloc.start()
+        table = SessionTable(count)
+        slots = table.allocate_many(targets)
+        table.guess_many(slots, np.full(count, 50))
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(table) == count
+        assert current < 40 * 1024 * 1024, f"Використано {current / 1024 / 1024:.1f} МБ"
+        assert peak < 80 * 1024 * 1024, f"Пік {peak / 1024 / 1024:.1f} МБ"
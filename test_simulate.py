@@ -0,0 +1,47 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from main import MAX_ATTEMPTS
+from simulate import run_chunk, simulate
+
+
+class TestSimulate:
+    """Тести Монте-Карло симуляції"""
+
+    def test_aggregates_are_consistent(self):
+        """Тест узгодженості перемог, гістограми та кількості ігор"""
+        result = simulate(25_000, seed=7, workers=1, chunk_size=10_000, strategy='random')
+
+        assert len(result.histogram) == MAX_ATTEMPTS + 1
+        assert result.histogram.sum() == result.games == 25_000
+        assert result.wins == result.histogram[1:].sum()
+        assert 0 < result.win_rate < 1
+
+    def test_binary_strategy_never_loses(self):
+        """Тест що бінарний пошук виграє кожну гру"""
+        result = simulate(10_000, seed=1, workers=1)
+
+        assert result.wins == result.games
+        assert result.histogram[0] == 0
+
+    @pytest.mark.slow
+    def test_reproducible_regardless_of_workers(self):
+        """Тест відтворюваності для різної кількості процесів"""
+        single = simulate(40_000, seed=3, workers=1, chunk_size=5_000, strategy='random')
+        pooled = simulate(40_000, seed=3, workers=2, chunk_size=5_000, strategy='random')
+
+        assert single.wins == pooled.wins
+        assert np.array_equal(single.histogram, pooled.histogram)
+
+    def test_chunks_use_independent_streams(self):
+        """Тест що різні фрагменти мають різні потоки випадкових чисел"""
+        first = run_chunk(0, 0, 5_000, 'random')
+        second = run_chunk(0, 1, 5_000, 'random')
+
+        assert not np.array_equal(first[1], second[1])
+
+    def test_unknown_strategy(self):
+        """Тест невідомої стратегії"""
+        with pytest.raises(ValueError):
+            simulate(10, strategy='oracle')
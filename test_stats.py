@@ -0,0 +1,83 @@
+import random
+import statistics
+
+import pytest
+
+from engine import GuessEngine
+from main import MAX_ATTEMPTS
+from stats import SessionStats
+
+
+def random_results(count, seed):
+    rng = random.Random(seed)
+    return [(rng.random() < 0.7, rng.randint(1, MAX_ATTEMPTS)) for _ in range(count)]
+
+
+def expected_attempts(results):
+    return [attempts if won else MAX_ATTEMPTS for won, attempts in results]
+
+
+class TestSessionStats:
+    """Тести інкрементної статистики"""
+
+    def test_welford_matches_statistics_module(self):
+        """Тест середнього та дисперсії проти statistics"""
+        results = random_results(1000, seed=1)
+        stats = SessionStats(MAX_ATTEMPTS)
+        for won, attempts in results:
+            stats.record(won, attempts)
+
+        values = expected_attempts(results)
+        assert stats.mean_attempts == pytest.approx(statistics.mean(values))
+        assert stats.variance == pytest.approx(statistics.variance(values))
+        assert sum(stats.histogram) == stats.games_completed == 1000
+
+    def test_merge_equals_single_pass(self):
+        """Тест що об'єднання шардів дорівнює одному проходу"""
+        results = random_results(900, seed=2)
+        single = SessionStats(MAX_ATTEMPTS)
+        shards = [SessionStats(MAX_ATTEMPTS) for _ in range(3)]
+        for index, (won, attempts) in enumerate(results):
+            single.record(won, attempts)
+            shards[index % 3].record(won, attempts)
+
+        merged = SessionStats(MAX_ATTEMPTS)
+        for shard in shards:
+            merged.merge(shard)
+
+        assert merged.histogram == single.histogram
+        assert merged.games_won == single.games_won
+        assert merged.mean_attempts == pytest.approx(single.mean_attempts)
+        assert merged.variance == pytest.approx(single.variance)
+
+    def test_from_histogram(self):
+        """Тест побудови з гістограми simulate()"""
+        results = random_results(500, seed=3)
+        direct = SessionStats(MAX_ATTEMPTS)
+        for won, attempts in results:
+            direct.record(won, attempts)
+
+        rebuilt = SessionStats.from_histogram(direct.histogram)
+        assert rebuilt.mean_attempts == pytest.approx(direct.mean_attempts)
+        assert rebuilt.variance == pytest.approx(direct.variance)
+
+    def test_record_session(self):
+        """Тест обліку сесій GuessEngine, включно з виходом"""
+        stats = SessionStats(MAX_ATTEMPTS)
+        won = GuessEngine(50, 1, 100, MAX_ATTEMPTS)
+        won.guess(50)
+        exited = GuessEngine(50, 1, 100, MAX_ATTEMPTS)
+
+        stats.record_session(won)
+        stats.record_session(exited)
+
+        assert (stats.games_won, stats.games_exited, stats.games_played) == (1, 1, 2)
+        assert stats.win_rate == 0.5
+
+    def test_invalid_input(self):
+        """Тест некоректних даних"""
+        stats = SessionStats(MAX_ATTEMPTS)
+        with pytest.raises(ValueError):
+            stats.record(True, MAX_ATTEMPTS + 1)
+        with pytest.raises(ValueError):
+            stats.merge(SessionStats(MAX_ATTEMPTS + 1))
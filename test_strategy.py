@@ -0,0 +1,82 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch import binary_search, simulate_batch
+from engine import GameConfig
+from fakes import FixedRandom
+from main import play_game, stream_io
+from strategy import StrategyTable, build_path_lengths, path_length, solve_exact
+
+
+class TestStrategyTable:
+    """Тести таблиць оптимальної стратегії"""
+
+    def test_matches_exhaustive_search(self):
+        """Тест таблиці проти повного перебору здогадок"""
+        wins, total = solve_exact(70, 7)
+        table = StrategyTable(70)
+        for attempts in range(1, 8):
+            for size in range(1, 71):
+                assert table.wins(size, attempts) == wins[attempts][size]
+                assert table.total_attempts(size, attempts) == total[attempts][size]
+
+    def test_matches_vectorized_simulation(self):
+        """Тест точних значень проти симуляції бінарного пошуку"""
+        table = StrategyTable(1000)
+        for max_number, max_attempts in ((100, 7), (1000, 6)):
+            targets = np.arange(1, max_number + 1)
+            won, attempts = simulate_batch(targets, binary_search, 1, max_number, max_attempts)
+            assert table.win_probability(1, max_number, max_attempts) == won.mean()
+            assert table.expected_attempts(1, max_number, max_attempts) == pytest.approx(
+                attempts.mean())
+
+    def test_best_guess_plays_optimally(self):
+        """Тест що поради вгадують будь-яке число 1-100 за 7 спроб"""
+        table = StrategyTable(100)
+        for target in range(1, 101):
+            low, high = 1, 100
+            for attempt in range(1, 8):
+                guess = table.best_guess(low, high, 8 - attempt)
+                if guess == target:
+                    break
+                low, high = (guess + 1, high) if guess < target else (low, guess - 1)
+            assert guess == target
+
+    def test_for_config_checks_range(self):
+        """Тест стратегії для GameConfig без побудови таблиці"""
+        table = StrategyTable.for_config(GameConfig(1, 1_000_000))
+
+        assert table.size == 1_000_000
+        assert table.total_attempts(1_000_000, 20) == int(build_path_lengths(1_000_000)[-1])
+        with pytest.raises(ValueError):
+            table.best_guess(1, 2_000_000, 20)
+
+    def test_closed_form_matches_table(self):
+        """Тест замкненої формули path_length проти динаміки"""
+        table = build_path_lengths(5000)
+        assert [path_length(size) for size in range(5001)] == table.tolist()
+
+    def test_huge_range(self):
+        """Тест діапазону 10**18: формула за O(1)"""
+        config = GameConfig(1, 10**18)
+        table = StrategyTable.for_config(config)
+
+        assert table.best_guess(1, 10**18, config.max_attempts) == 5 * 10**17
+        assert table.win_probability(1, 10**18, config.max_attempts) == 1.0
+        assert table.expected_attempts(1, 10**18, 20) == pytest.approx(20 - 2**20 / 10**18 * 20,
+                                                                       rel=1e-9)
+
+    def test_assist_mode(self):
+        """Тест порад у play_game"""
+        out = io.StringIO()
+        reader, writer = stream_io(io.StringIO("50\n75\n"), out)
+        with pytest.raises(EOFError):
+            play_game(reader, writer, FixedRandom(73), assist=StrategyTable(100))
+
+        text = out.getvalue()
+        assert "🧭 Порада: спробуйте 50 (шанс перемоги 100%, очікувано ще 5.8 спроб)" in text
+        assert "🧭 Порада: спробуйте 75" in text
+        assert "🧭 Порада: спробуйте 62" in text
@@ -0,0 +1,72 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine import GameConfig
+from main import main, new_session, stream_io
+from targets import TargetPool
+
+
+class TestTargetPool:
+    """Тести пулів загаданих чисел"""
+
+    def test_seeded_sequence_is_reproducible(self):
+        """Тест відтворюваності та меж діапазону"""
+        pool_a, pool_b = TargetPool(42, pool_size=16), TargetPool(42, pool_size=16)
+        draws_a = [pool_a.draw() for _ in range(100)]
+        draws_b = [pool_b.draw() for _ in range(100)]
+
+        assert draws_a == draws_b
+        assert all(1 <= target <= 100 for target in draws_a)
+        assert all(type(target) is int for target in draws_a)
+        assert pool_a.drawn == 100
+
+    def test_sessions_are_independent(self):
+        """Тест що сесії одного seed отримують різні потоки"""
+        draws = [TargetPool.for_session(7, index).draw_many(50).tolist() for index in range(3)]
+        assert draws[0] != draws[1] != draws[2]
+        assert TargetPool.for_session(7, 1).draw_many(50).tolist() == draws[1]
+
+    def test_draw_many_uses_buffer_first(self):
+        """Тест що draw_many продовжує послідовність після draw"""
+        pool = TargetPool(3, pool_size=8)
+        head = [pool.draw() for _ in range(5)]
+        rest = pool.draw_many(3).tolist()
+        assert head + rest == TargetPool(3, pool_size=8).draw_many(8).tolist()
+        assert pool.draw_many(1000).shape == (1000,)
+
+    def test_randint_compatibility(self):
+        """Тест використання пулу як rng для new_session та main"""
+        config = GameConfig(1, 1000)
+        pool = TargetPool(5)
+        session = new_session(pool, config)
+        assert 1 <= session.target <= 1000
+        assert (pool.min_number, pool.max_number) == (1, 1000)
+
+        outputs = []
+        for _ in range(2):
+            out = io.StringIO()
+            reader, writer = stream_io(io.StringIO("50\n" * 7 + "ні\n"), out)
+            main(reader, writer, TargetPool(11))
+            outputs.append(out.getvalue())
+        assert outputs[0] == outputs[1]
+
+    def test_range_beyond_int64(self):
+        """Тест відтворюваних чисел для меж поза int64"""
+        config = GameConfig(-10**20, 10**20)
+        first, second = TargetPool(3, pool_size=8), TargetPool(3, pool_size=8)
+        targets = [new_session(first, config).target for _ in range(20)]
+
+        assert targets == [new_session(second, config).target for _ in range(20)]
+        assert all(-10**20 <= target <= 10**20 for target in targets)
+        assert any(abs(target) > 2**63 for target in targets)
+        assert all(-10**20 <= target <= 10**20 for target in first.draw_many(12).tolist())
+
+    def test_invalid_arguments(self):
+        """Тест некоректних параметрів"""
+        with pytest.raises(ValueError):
+            TargetPool(1, min_number=10, max_number=1)
+        with pytest.raises(ValueError):
+            TargetPool(1, pool_size=0)
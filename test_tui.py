@@ -0,0 +1,148 @@
+import io
+import re
+
+from fakes import FixedRandom
+from main import DEFAULT_CONFIG, play_game, stream_io, welcome_message
+from tui import ROW_PROMPT, ROW_STATUS, WIDTH, Screen, TerminalGame, layout
+
+ANSI = re.compile(r"\x1b\[(\?1049[hl]|2J|K|(\d+);(\d+)H|(\d*)([ABCD]))|\r")
+STEPS = {'A': (-1, 0), 'B': (1, 0), 'C': (0, 1), 'D': (0, -1)}
+
+
+class Terminal:
+    """Мінімальний емулятор терміналу для перевірки ANSI-оновлень"""
+
+    def __init__(self, rows=10, width=WIDTH):
+        self.grid = [[' '] * width for _ in range(rows)]
+        self.row = self.column = 0
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data.encode())
+        position = 0
+        for match in ANSI.finditer(data):
+            self._text(data[position:match.start()])
+            position = match.end()
+            if match.group() == '\r':
+                self.column = 0
+            elif match.group(2):
+                self.row, self.column = int(match.group(2)) - 1, int(match.group(3)) - 1
+            elif match.group(5):
+                rows, columns = STEPS[match.group(5)]
+                count = int(match.group(4) or 1)
+                self.row += rows * count
+                self.column += columns * count
+            elif match.group(1) == 'K':
+                self.grid[self.row][self.column:] = [' '] * (len(self.grid[0]) - self.column)
+            elif match.group(1) == '2J':
+                self.grid = [[' '] * len(self.grid[0]) for _ in self.grid]
+        self._text(data[position:])
+
+    def _text(self, text):
+        for char in text:
+            self.grid[self.row][self.column] = char
+            self.column += 1
+
+    def lines(self):
+        return ["".join(row).rstrip() for row in self.grid]
+
+
+def scripted(terminal, answers):
+    answers = iter(answers)
+
+    def reader(prompt=''):
+        text = next(answers)
+        terminal.write(text)  # луна введення
+        terminal.row, terminal.column = terminal.row + 1, 0
+        return text
+
+    return reader
+
+
+class TestScreen:
+    """Тести буфера кадру"""
+
+    def test_diff_reproduces_frame(self):
+        """Тест що після оновлень емульований екран збігається з кадром"""
+        screen, terminal = Screen(), Terminal()
+        frames = [
+            ["Рядок один", "Спроба 1/7", "abc"],
+            ["Рядок один", "Спроба 2/7", "abcdef довгий текст"],
+            ["Рядок два!", "Спроба 2/7", "ab"],
+        ]
+        for rows in frames:
+            terminal.write(screen.frame(rows))
+            assert terminal.lines()[:3] == rows
+        assert screen.frame(frames[-1]) == ""
+
+    def test_only_changed_cells_are_sent(self):
+        """Тест що зміна однієї цифри дає коротке відносне оновлення"""
+        screen = Screen()
+        screen.frame(["Спроба 1/7   залишилось: 7"])
+        assert screen.frame(["Спроба 2/7   залишилось: 6"]) == "\x1b[19D2\x1b[17C6"
+
+    def test_cursor_moves_are_cheapest(self):
+        """Тест вибору переміщення: повтор незмінного тексту, \\r та очищення ESC[K"""
+        screen, terminal = Screen(), Terminal()
+        terminal.write(screen.frame(["abc", "xyz"], (0, 3)))
+        update = screen.frame(["abcdef", "xyz"], (0, 6))
+        assert update == "def"
+        terminal.write(update)
+
+        terminal.write("typed")  # луна введення та Enter
+        terminal.row, terminal.column = 1, 0
+        screen.echoed("typed")
+        update = screen.frame(["abcdef", "Xyz"], (0, 6))
+        assert update == "\x1b[1;7H\x1b[K\r\x1b[BX\x1b[1;7H"
+        terminal.write(update)
+        assert terminal.lines()[:2] == ["abcdef", "Xyz"]
+        assert (terminal.row, terminal.column) == (0, 6)
+
+
+class TestTerminalGame:
+    """Тести повноекранної гри"""
+
+    def test_game_and_final_screen(self):
+        """Тест гри через емулятор: стан екрана та відповіді"""
+        terminal = Terminal()
+        answers = ['abc', '50', '80', '73', 'ні']
+        game = TerminalGame(scripted(terminal, answers), terminal.write, FixedRandom(73))
+        game.run()
+
+        lines = terminal.lines()
+        assert lines[:4] == [
+            "ВГАДАЙ ЧИСЛО 1-100  (+ більше, - менше)",
+            "Спроба  Межі      Історія",
+            "3/7      51..79   50+ 80-",
+            "Вгадано: 73 за 3 спроб(и)!",
+        ]
+        assert lines[ROW_PROMPT].startswith("Зіграти ще раз? (так/ні): ні")
+
+    def test_long_history_keeps_input_on_screen(self):
+        """Тест що найстаріші записи історії ховаються, щоб лишилось місце введенню"""
+        session = DEFAULT_CONFIG.new_session(73)
+        history = [f"{number}+" for number in range(10, 40)]
+        rows, (row, column) = layout(session, history, "", width=40)
+        assert row == ROW_STATUS and column == len(rows[ROW_STATUS]) <= 40 - 4
+        assert rows[ROW_STATUS].endswith("  ... 37+ 38+ 39+ ")
+
+    def test_bytes_per_turn_drop(self):
+        """Тест що хід у TUI передає на порядок менше байтів за прокручування"""
+        guesses = ['50', '75', '62', '69', '72', '74', '73']
+
+        terminal = Terminal()
+        writes = []
+        game = TerminalGame(scripted(terminal, guesses + ['ні']),
+                            lambda data: writes.append(len(data.encode())), FixedRandom(73))
+        game.run()
+        # Перший запис - повний кадр, далі - по одному на кожен хід
+        tui_turn = max(writes[1:len(guesses)])
+
+        out = io.StringIO()
+        reader, writer = stream_io(io.StringIO("\n".join(guesses) + "\n"), out)
+        play_game(reader, writer, FixedRandom(73))
+        welcome = len(welcome_message().encode()) + 1
+        console_turn = (len(out.getvalue().encode()) - welcome) / len(guesses)
+
+        assert tui_turn <= 21
+        assert tui_turn * 10 < console_turn
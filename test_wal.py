@@ -0,0 +1,197 @@
+import io
+import time
+import unittest.mock as mock
+
+import pytest
+
+from engine import GameConfig, GuessEngine
+from fakes import FixedRandom
+from main import DEFAULT_CONFIG, InputTimeout, play_game, run, stream_io
+from wal import RECORD_SIZE, SessionWAL
+
+
+def play_until_eof(wal, answers, target=73, session=None):
+    out = io.StringIO()
+    reader, writer = stream_io(io.StringIO("".join(a + "\n" for a in answers)), out)
+    try:
+        play_game(reader, writer, FixedRandom(target), recorder=wal, session=session)
+    except EOFError:
+        pass
+    return out.getvalue()
+
+
+def scripted_reader(answers):
+    """reader, що на None кидає InputTimeout, а після відповідей - EOFError"""
+    answers = iter(answers)
+
+    def reader(prompt=''):
+        for answer in answers:
+            if answer is None:
+                raise InputTimeout()
+            return answer
+        raise EOFError
+
+    return reader
+
+
+def live_states(wal):
+    return {session_id: session.state() for session_id, session in wal.live.items()}
+
+
+class TestSessionWAL:
+    """Тести журналу незавершених сесій"""
+
+    def test_resume_at_same_attempt(self, tmp_path):
+        """Тест продовження гри після перезапуску"""
+        wal = SessionWAL(tmp_path, group_size=1)
+        play_until_eof(wal, ['50', '75'])
+        # Аварійне завершення: close() не викликається
+        recovered = SessionWAL(tmp_path)
+        (session_id, session), = recovered.live.items()
+        assert (session.attempt, session.low, session.high) == (2, 51, 74)
+
+        output = play_until_eof(recovered, ['62', '69', '72', '74', '73'], session=session)
+        assert "використано спроб 2/7, число між 51 та 74" in output
+        assert "Спроба 3/7" in output and "Кількість спроб: 7" in output
+        recovered.close()
+        assert SessionWAL(tmp_path).live == {}
+
+    def test_resume_after_attempt_timeout(self, tmp_path):
+        """Тест що спроба, пропущена через тайм-аут, відновлюється з журналу"""
+        wal = SessionWAL(tmp_path, group_size=1)
+        try:
+            play_game(scripted_reader(['50', None, '60', '70']), [].append, FixedRandom(73),
+                      recorder=wal)
+        except EOFError:
+            pass
+        live = wal.live[1]
+        # Аварійне завершення: close() не викликається
+        recovered = SessionWAL(tmp_path)
+        (session,) = recovered.live.values()
+        assert (session.attempt, session.low, session.high) == (4, 71, 100)
+        assert session.state() == live.state()
+
+    def test_timed_out_last_attempt_ends_session(self, tmp_path):
+        """Тест що сесія, програна на тайм-ауті, не відновлюється"""
+        wal = SessionWAL(tmp_path, group_size=1)
+        session = play_game(scripted_reader(['50'] + [None] * 6), [].append, FixedRandom(73),
+                            recorder=wal)
+        assert session.lost and wal.live == {}
+        assert SessionWAL(tmp_path).live == {}
+
+    def test_resumable_matches_config(self, tmp_path):
+        """Тест що продовжується найновіша сесія з тими самими налаштуваннями"""
+        wal = SessionWAL(tmp_path, group_size=1)
+        play_until_eof(wal, ['50'])
+        play_until_eof(wal, ['40'])
+        recovered = SessionWAL(tmp_path)
+        assert sorted(recovered.live) == [1, 2]
+
+        assert recovered.resumable(GameConfig(1, 1000)) is None
+        assert recovered.live == {}
+        recovered.close()
+        assert SessionWAL(tmp_path).resumable(DEFAULT_CONFIG) is None
+
+        play_until_eof(wal, ['60'])
+        play_until_eof(wal, ['70'])
+        recovered = SessionWAL(tmp_path)
+        resume = recovered.resumable(DEFAULT_CONFIG)
+        assert (resume.attempt, resume.low) == (1, 71)
+        assert list(recovered.live.values()) == [resume]
+
+    def test_run_with_other_range_starts_new_game(self, tmp_path, capsys):
+        """Тест що --wal з іншим --max не продовжує стару гру"""
+        with mock.patch('random.randint', return_value=73), \
+                mock.patch('builtins.input', side_effect=['50', EOFError]):
+            with pytest.raises(EOFError):
+                run(['--wal', str(tmp_path), '--max', '100'])
+        with mock.patch('random.randint', return_value=500), \
+                mock.patch('builtins.input', side_effect=['500', 'ні']):
+            run(['--wal', str(tmp_path), '--max', '1000'])
+
+        output = capsys.readouterr().out
+        assert "Продовжуємо збережену гру" not in output
+        assert "Загадане число: 500" in output
+        assert SessionWAL(tmp_path).live == {}
+
+    def test_group_commit(self, tmp_path):
+        """Тест що групи записів фіксуються одним fsync"""
+        wal = SessionWAL(tmp_path, group_size=100)
+        sessions = [GuessEngine(100, 1, 100, 7) for _ in range(50)]
+        ids = [wal.begin_session(session) for session in sessions]
+        for guess in (50, 75):
+            for session_id, session in zip(ids, sessions):
+                session.guess(guess)
+                wal.record_guess(session_id, session, guess, -1)
+        wal.close()
+
+        assert wal.commits == 2
+        recovered = SessionWAL(tmp_path)
+        assert len(recovered.live) == 50
+        assert all(session.attempt == 2 and session.low == 76
+                   for session in recovered.live.values())
+        assert recovered.begin_session() == 51
+
+    def test_exit_and_finished_sessions_are_dropped(self, tmp_path):
+        """Тест що завершені та перервані сесії не відновлюються"""
+        wal = SessionWAL(tmp_path, group_size=1)
+        play_until_eof(wal, ['73'])
+        play_until_eof(wal, ['exit'])
+        play_until_eof(wal, ['10'])
+        recovered = SessionWAL(tmp_path)
+        assert list(recovered.live) == [3]
+
+    def test_snapshot_compacts_log(self, tmp_path):
+        """Тест знімка: стан зберігається, журнал починається заново"""
+        wal = SessionWAL(tmp_path, group_size=10, snapshot_records=25)
+        for _ in range(10):
+            play_until_eof(wal, ['50', '30'], target=20)
+        wal.close()
+
+        assert (tmp_path / "sessions.snapshot").exists()
+        assert (tmp_path / "sessions.wal").stat().st_size < 32 + 25 * RECORD_SIZE
+        assert live_states(SessionWAL(tmp_path)) == live_states(wal)
+
+    def test_snapshot_of_wide_range(self, tmp_path):
+        """Тест знімка сесії з великим діапазоном та кількістю спроб"""
+        wal = SessionWAL(tmp_path)
+        session = GuessEngine(10**12, 1, 10**15, 50)
+        wal.begin_session(session)
+        session.guess(10**14)
+        wal.snapshot()
+        wal.close()
+        assert live_states(SessionWAL(tmp_path)) == {1: session.state()}
+
+    def test_crash_between_snapshot_and_new_log(self, tmp_path):
+        """Тест що старий журнал не застосовується повторно після знімка"""
+        wal = SessionWAL(tmp_path, group_size=1)
+        play_until_eof(wal, ['50', '30'], target=20)
+        old_log = (tmp_path / "sessions.wal").read_bytes()
+        expected = live_states(wal)
+        wal.snapshot()
+        wal.close()
+
+        (tmp_path / "sessions.wal").write_bytes(old_log)
+        assert live_states(SessionWAL(tmp_path)) == expected
+
+    def test_torn_tail_is_discarded(self, tmp_path):
+        """Тест відкидання пошкодженого хвоста журналу"""
+        wal = SessionWAL(tmp_path, group_size=1)
+        play_until_eof(wal, ['50', '75'])
+        path = tmp_path / "sessions.wal"
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF  # пошкоджений CRC останнього ходу
+        path.write_bytes(bytes(data) + b'\x00' * 7)
+
+        (session,) = SessionWAL(tmp_path).live.values()
+        assert session.attempt == 1
+        assert (path.stat().st_size - 32) % RECORD_SIZE == 0
+
+    def test_background_sync(self, tmp_path):
+        """Тест фонової фіксації за інтервалом"""
+        wal = SessionWAL(tmp_path, sync_interval=0.01)
+        wal.begin_session(GuessEngine(5, 1, 10, 4))
+        time.sleep(0.1)
+        assert wal.commits == 1
+        assert len(SessionWAL(tmp_path).live) == 1
+        wal.close()
@@ -0,0 +1,264 @@
+"""Повноекранний термінальний режим гри з перемальовуванням лише змін.
+
+Екран має сталу розкладку (діапазон, підписи стовпців, рядок стану зі
+спробою, відомими межами та історією здогадок, повідомлення,
+запрошення). Screen пам'ятає попередній кадр і позицію курсора та для
+нового кадру надсилає лише змінені клітинки з найкоротшими
+переміщеннями ANSI (відносні ESC[nA/B/C/D, \r або абсолютне
+ESC[рядок;стовпецьH).
+
+Здогадка вводиться в рядку стану одразу після історії, тож луна
+терміналу сама стає записом історії, а після Enter курсор стоїть на
+початку наступного рядка. Межі мають сталу ширину, і типовий хід
+дописує лише цифру спроби, змінені цифри межі та знак підказки
+(50+ - загадане більше, 80- - менше): 16-18 байтів проти ~214 при
+прокручуванні виводу play_game().
+
+Розкладка використовує лише символи одинарної ширини, щоб номери
+стовпців збігались із позиціями в терміналі.
+
+Запуск: python tui.py [--min 1 --max 100 --attempts 7]
+"""
+
+import sys
+
+from engine import CORRECT, GUESS_EXIT, GUESS_INVALID, GUESS_OUT_OF_RANGE, TOO_SMALL, parse_answer
+from main import DEFAULT_CONFIG, EXIT_COMMANDS, NO_ANSWERS, YES_ANSWERS, new_session, parse_config
+
+WIDTH = 80
+ESC = "\x1b["
+ENTER_SCREEN = "\x1b[?1049h\x1b[2J"
+LEAVE_SCREEN = "\x1b[?1049l"
+CLEAR_LINE = f"{ESC}K"
+
+ROW_TITLE, ROW_LEGEND, ROW_STATUS, ROW_MESSAGE, ROW_PROMPT = range(5)
+
+ATTEMPT_LABEL = "Спроба"
+BOUNDS_LABEL = "Межі"
+HISTORY_LABEL = "Історія"
+HISTORY_ELLIPSIS = "... "
+PLAY_AGAIN_PROMPT = "Зіграти ще раз? (так/ні): "
+WIN_TEXT = "Вгадано: %d за %d спроб(и)!"
+LOSS_TEXT = "Спроби закінчились. Було загадано %d."
+INVALID_TEXT = "Введіть ціле число!"
+OUT_OF_RANGE_TEXT = "Число має бути від %d до %d!"
+INVALID_ANSWER_TEXT = "Введіть 'так' або 'ні'."
+
+
+def _size(text):
+    return len(text.encode())
+
+
+def _step(count, forward, backward):
+    """ESC[nX для зсуву на count клітинок (n пропускається, якщо 1)"""
+    if count == 0:
+        return ""
+    letter = forward if count > 0 else backward
+    count = abs(count)
+    return f"{ESC}{count if count > 1 else ''}{letter}"
+
+
+class Screen:
+    """Буфер кадру з обчисленням мінімального ANSI-оновлення.
+
+    Screen відстежує позицію курсора терміналу (row, column; None - невідома)
+    і для кожного переміщення обирає найкоротше: абсолютне ESC[r;cH,
+    відносне ESC[nA/B/C/D з \r або повторний вивід незмінних символів.
+    """
+
+    __slots__ = ('width', 'rows', 'row', 'column')
+
+    def __init__(self, width=WIDTH):
+        self.width = width
+        self.rows = None
+        self.row = self.column = None
+
+    def _fit(self, text):
+        return text[:self.width].ljust(self.width)
+
+    def _move(self, row, column):
+        best = f"{ESC}{row + 1};{column + 1}H"
+        if self.row is not None:
+            vertical = _step(row - self.row, 'B', 'A')
+            if column == self.column:
+                horizontal = ""
+            elif column == 0:
+                vertical, horizontal = "\r" + vertical, ""
+            else:
+                horizontal = _step(column - self.column, 'C', 'D')
+                if row == self.row and column > self.column:
+                    # Клітинки між курсором і ціллю вже збігаються з кадром
+                    text = self.rows[row][self.column:column]
+                    if _size(text) < _size(horizontal):
+                        horizontal = text
+            if _size(vertical + horizontal) < _size(best):
+                best = vertical + horizontal
+        self.row, self.column = row, column
+        return best
+
+    def _update_row(self, index, old, new):
+        parts = []
+        column = 0
+        while column < self.width:
+            if old[column] == new[column]:
+                column += 1
+                continue
+            start = column
+            while column < self.width and old[column] != new[column]:
+                column += 1
+            parts.append(self._move(index, start))
+            text = new[start:column]
+            blank = len(text) - len(text.rstrip())
+            if not new[column:].strip() and (blank >= _size(CLEAR_LINE) or old[column:].strip()):
+                # Далі в рядку лише пробіли: очищуємо ESC[K замість них
+                text = text.rstrip()
+                parts.append(text + CLEAR_LINE)
+                self.column += len(text)
+                break
+            parts.append(text)
+            self.column = column
+        return parts
+
+    def frame(self, rows, cursor=None):
+        """Повертає ANSI-рядок, що перетворює попередній кадр на rows.
+
+        cursor - позиція (row, column), де курсор має опинитися після оновлення.
+        """
+        rows = [self._fit(row) for row in rows]
+        previous = self.rows
+        self.rows = rows
+        if previous is None or len(previous) != len(rows):
+            parts = [ENTER_SCREEN if previous is None else f"{ESC}2J"]
+            parts.extend(f"{ESC}{index + 1};1H{row.rstrip()}" for index, row in enumerate(rows))
+            self.row, self.column = len(rows) - 1, len(rows[-1].rstrip())
+        else:
+            parts = []
+            for index, (old, new) in enumerate(zip(previous, rows)):
+                if old != new:
+                    parts.extend(self._update_row(index, old, new))
+        if cursor is not None and (self.row, self.column) != tuple(cursor):
+            parts.append(self._move(*cursor))
+        return "".join(parts)
+
+    def echoed(self, text):
+        """Враховує луну введення: текст у позиції курсора та перехід рядка"""
+        row, column = self.row, self.column
+        if row is None or column + len(text) >= self.width:
+            # Луна перенеслась на наступний рядок: позиція курсора невідома
+            self.row = self.column = None
+            return
+        if row < len(self.rows):
+            line = self.rows[row]
+            self.rows[row] = self._fit(line[:column] + text + line[column + len(text):])
+        self.row, self.column = row + 1, 0
+
+
+def layout(session, history, message, prompt=None, width=WIDTH):
+    """Будує рядки кадру та позицію курсора для стану сесії.
+
+    Без prompt введення відбувається в рядку стану одразу після історії:
+    луна здогадки стає записом історії, а після Enter курсор опиняється
+    на початку наступного рядка, тож хід дописує лише номер спроби,
+    змінені цифри межі та знак підказки.
+    """
+    # Під час гри показуємо поточну спробу, після завершення - використані
+    attempt = session.attempt if session.finished else session.attempt + 1
+    attempts = f"{attempt}/{session.max_attempts}"
+    attempts = attempts.ljust(max(len(ATTEMPT_LABEL), 2 * len(str(session.max_attempts)) + 1))
+    # Межі сталої ширини: звуження змінює лише цифри, а не зсуває рядок
+    digits = max(len(str(session.min_number)), len(str(session.max_number)))
+    bounds = f"{session.low:>{digits}}..{session.high:<{digits}}".ljust(len(BOUNDS_LABEL))
+    status = f"{attempts}  {bounds}  "
+
+    shown = "".join(f"{entry} " for entry in history)
+    room = width - len(status) - digits - 1
+    if len(shown) > room:
+        # Найстаріші записи не вміщаються разом із місцем для введення
+        cut = len(shown) - room + len(HISTORY_ELLIPSIS)
+        shown = HISTORY_ELLIPSIS + shown[shown.find(" ", cut - 1) + 1:] if cut <= len(shown) else ""
+    status += shown
+
+    rows = [
+        f"ВГАДАЙ ЧИСЛО {session.min_number}-{session.max_number}  (+ більше, - менше)",
+        f"{ATTEMPT_LABEL:<{len(attempts)}}  {BOUNDS_LABEL:<{len(bounds)}}  {HISTORY_LABEL}",
+        status,
+        message,
+        prompt or "",
+    ]
+    if prompt is None:
+        return rows, (ROW_STATUS, len(status))
+    return rows, (ROW_PROMPT, len(prompt))
+
+
+class TerminalGame:
+    """Гра в повноекранному режимі поверх reader()/write(text)"""
+
+    def __init__(self, reader=None, write=None, rng=None, config=None, width=WIDTH):
+        self.reader = reader or input
+        self.write = write or sys.stdout.write
+        self.rng = rng
+        self.config = config
+        self.screen = Screen(width)
+
+    def _ask(self, session, history, message, prompt=None):
+        """Малює кадр, ставить курсор у місце введення і читає рядок"""
+        rows, cursor = layout(session, history, message, prompt, self.screen.width)
+        self.write(self.screen.frame(rows, cursor))
+        if self.write is sys.stdout.write:
+            sys.stdout.flush()
+        text = self.reader('')
+        self.screen.echoed(text)
+        return text
+
+    def play_game(self):
+        """Одна гра; повертає True, якщо гравець хоче зіграти ще"""
+        config = self.config or DEFAULT_CONFIG
+        session = new_session(self.rng, self.config)
+        history = []
+        message = ""
+        while not session.finished:
+            text = self._ask(session, history, message)
+            status, number = config.parse_guess(text, EXIT_COMMANDS)
+            if status == GUESS_EXIT:
+                return False
+            if status == GUESS_INVALID:
+                message = INVALID_TEXT
+                continue
+            if status == GUESS_OUT_OF_RANGE:
+                message = OUT_OF_RANGE_TEXT % (config.min_number, config.max_number)
+                continue
+
+            direction = session.guess(number)
+            if direction == CORRECT:
+                message = WIN_TEXT % (session.target, session.attempt)
+                break
+            history.append(f"{number}{'+' if direction == TOO_SMALL else '-'}")
+            message = ""
+        else:
+            message = LOSS_TEXT % session.target
+
+        while True:
+            answer = parse_answer(self._ask(session, history, message, PLAY_AGAIN_PROMPT),
+                                  YES_ANSWERS, NO_ANSWERS)
+            if answer is not None:
+                return answer
+            message = INVALID_ANSWER_TEXT
+
+    def run(self):
+        """Грає, доки гравець не відмовиться, і відновлює звичайний екран"""
+        try:
+            while self.play_game():
+                pass
+        except (EOFError, KeyboardInterrupt):
+            pass
+        finally:
+            self.write(LEAVE_SCREEN)
+
+
+def main(argv=None):
+    """Точка входу командного рядка"""
+    TerminalGame(config=parse_config(argv)).run()
+
+
+if __name__ == "__main__":
+    main()
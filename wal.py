@@ -0,0 +1,326 @@
+"""Збереження незавершених сесій у журналі попереднього запису (WAL).
+
+SessionWAL реалізує той самий інтерфейс запису, що й gamelog.GameRecorder
+(begin_session, record_guess, record_skip, record_exit), тож передається
+в play_game() та main() параметром recorder. Кожна подія - запис
+фіксованої довжини з CRC32:
+  op (u8) | attempt (u16) | max_attempts (u16) | session (u64) | a, b, c (i64) | crc (u32)
+де для OP_START (a, b, c) = (target, min_number, max_number), а для
+OP_GUESS a - здогадка, attempt - номер зарахованої спроби, для OP_SKIP
+attempt - номер спроби, пропущеної через тайм-аут відповіді.
+
+Групова фіксація: записи накопичуються в пам'яті й потрапляють на диск
+одним write() та одним fsync() на групу - коли набирається group_size
+записів, кожні sync_interval секунд у фоновому потоці або при commit().
+Після snapshot_records записів стан усіх незавершених сесій стискається
+у знімок (snapshot), а журнал починається заново з новим поколінням.
+
+Відновлення: знімок + записи журналу того ж або новішого покоління.
+Повтор OP_GUESS та OP_SKIP ідемпотентний (застосовується лише до спроби
+attempt - 1), тож знімок, зроблений між ходом і його записом, не подвоює спробу.
+Пошкоджений хвіст журналу (обірваний запис або невірний CRC) відкидається.
+"""
+
+import os
+import struct
+import threading
+import zlib
+
+from engine import GuessEngine
+
+MAGIC = b'GUESSWAL'
+SNAPSHOT_MAGIC = b'GUESSSNP'
+VERSION = 1
+# magic | version | generation | next_session
+HEADER = struct.Struct('<8sHxxxxxxQQ')
+HEADER_SIZE = HEADER.size
+RECORD = struct.Struct('<BHHQqqq')
+CRC = struct.Struct('<I')
+RECORD_SIZE = RECORD.size + CRC.size
+# session | target | min | max | max_attempts | attempt | low | high | won (як GuessEngine.state)
+STATE = struct.Struct('<QqqqHHqqB')
+
+OP_START = 1
+OP_GUESS = 2
+OP_END = 3
+OP_SKIP = 4
+
+WAL_FILE = 'sessions.wal'
+SNAPSHOT_FILE = 'sessions.snapshot'
+DEFAULT_GROUP_SIZE = 256
+DEFAULT_SNAPSHOT_RECORDS = 100_000
+
+
+class WALError(ValueError):
+    """Файл не є журналом сесій або має несумісну версію"""
+
+
+def _read_header(data, magic):
+    if len(data) < HEADER_SIZE:
+        raise WALError("Файл закороткий")
+    file_magic, version, generation, next_session = HEADER.unpack_from(data)
+    if file_magic != magic or version != VERSION:
+        raise WALError("Файл не є журналом сесій або має іншу версію")
+    return generation, next_session
+
+
+def _fsync_directory(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_atomically(path, data):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    _fsync_directory(os.path.dirname(path) or '.')
+
+
+def _pack(op, session_id, attempt=0, max_attempts=0, a=0, b=0, c=0):
+    record = RECORD.pack(op, attempt, max_attempts, session_id, a, b, c)
+    return record + CRC.pack(zlib.crc32(record))
+
+
+class SessionWAL:
+    """Журнал незавершених сесій з груповою фіксацією та знімками.
+
+    live - словник session_id -> GuessEngine сесій, що не завершились;
+    після відкриття наявного каталогу він містить відновлені сесії, одну з
+    яких resumable() обирає для продовження через play_game(session=...).
+    """
+
+    def __init__(self, directory, group_size=DEFAULT_GROUP_SIZE, sync_interval=None,
+                 snapshot_records=DEFAULT_SNAPSHOT_RECORDS):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.wal_path = os.path.join(directory, WAL_FILE)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.group_size = group_size
+        self.snapshot_records = snapshot_records
+        self.commits = 0
+        self.live = {}
+        self._ids = {}
+        self._pending = []
+        self._since_snapshot = 0
+        # _lock захищає буфер і live; _io_lock впорядковує запис на диск
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._closed = threading.Event()
+
+        self._generation, self._next_session = self._recover()
+        self._file = open(self.wal_path, 'ab')
+
+        self._syncer = None
+        if sync_interval:
+            self._syncer = threading.Thread(target=self._sync_loop, args=(sync_interval,),
+                                            daemon=True)
+            self._syncer.start()
+
+    # === ВІДНОВЛЕННЯ ===
+
+    def _recover(self):
+        generation, next_session = 0, 1
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as file:
+                data = file.read()
+            generation, next_session = _read_header(data, SNAPSHOT_MAGIC)
+            for fields in STATE.iter_unpack(memoryview(data)[HEADER_SIZE:]):
+                session = GuessEngine.from_state(fields[1:])
+                if not session.finished:
+                    self._track(fields[0], session)
+
+        if not os.path.exists(self.wal_path):
+            self._start_wal(generation, next_session)
+            return generation, next_session
+
+        with open(self.wal_path, 'rb') as file:
+            data = file.read()
+        wal_generation, wal_next = _read_header(data, MAGIC)
+        if wal_generation < generation:
+            # Знімок уже містить цей журнал: аварія між знімком і новим журналом
+            self._start_wal(generation, next_session)
+            return generation, next_session
+
+        next_session = max(next_session, wal_next)
+        offset = HEADER_SIZE
+        while offset + RECORD_SIZE <= len(data):
+            record = data[offset:offset + RECORD.size]
+            (crc,) = CRC.unpack_from(data, offset + RECORD.size)
+            if zlib.crc32(record) != crc:
+                break
+            next_session = max(next_session, self._replay(*RECORD.unpack(record)) + 1)
+            offset += RECORD_SIZE
+        if offset != len(data):
+            with open(self.wal_path, 'r+b') as file:
+                file.truncate(offset)
+        return wal_generation, next_session
+
+    def _replay(self, op, attempt, max_attempts, session_id, a, b, c):
+        if op == OP_START:
+            # Сесія могла потрапити і у знімок, і в журнал нового покоління
+            if session_id not in self.live:
+                self._track(session_id, GuessEngine(a, b, c, max_attempts))
+        elif op in (OP_GUESS, OP_SKIP):
+            session = self.live.get(session_id)
+            if session is not None and session.attempt == attempt - 1:
+                if op == OP_GUESS:
+                    session.guess(a)
+                else:
+                    session.skip()
+                if session.finished:
+                    self._untrack(session_id)
+        elif op == OP_END:
+            self._untrack(session_id)
+        return session_id
+
+    def _start_wal(self, generation, next_session):
+        _write_atomically(self.wal_path, HEADER.pack(MAGIC, VERSION, generation, next_session))
+
+    def _track(self, session_id, session):
+        self.live[session_id] = session
+        self._ids[session] = session_id
+
+    def _untrack(self, session_id):
+        session = self.live.pop(session_id, None)
+        if session is not None:
+            del self._ids[session]
+
+    # === ІНТЕРФЕЙС RECORDER ===
+
+    def _append(self, record):
+        self._pending.append(record)
+        self._since_snapshot += 1
+        return len(self._pending) >= self.group_size
+
+    def begin_session(self, session=None):
+        """Реєструє сесію; для відновленої сесії повертає її наявний ідентифікатор"""
+        with self._lock:
+            session_id = self._ids.get(session)
+            if session_id is not None:
+                return session_id
+            session_id = self._next_session
+            self._next_session += 1
+            if session is None:
+                return session_id
+            self._track(session_id, session)
+            full = self._append(_pack(OP_START, session_id, 0, session.max_attempts,
+                                      session.target, session.min_number, session.max_number))
+        if full:
+            self.commit()
+        return session_id
+
+    def record_guess(self, session_id, session, guess, hint):
+        """Записує зараховану спробу; завершена сесія перестає бути live"""
+        with self._lock:
+            full = self._append(_pack(OP_GUESS, session_id, session.attempt, a=guess))
+            if session.finished:
+                self._untrack(session_id)
+        if full:
+            self.commit()
+
+    def record_skip(self, session_id, session):
+        """Записує спробу, пропущену через тайм-аут; остання спроба завершує сесію"""
+        with self._lock:
+            full = self._append(_pack(OP_SKIP, session_id, session.attempt))
+            if session.finished:
+                self._untrack(session_id)
+        if full:
+            self.commit()
+
+    def record_exit(self, session_id, session):
+        """Записує вихід гравця: сесія не відновлюватиметься"""
+        with self._lock:
+            full = self._append(_pack(OP_END, session_id))
+            self._untrack(session_id)
+        if full:
+            self.commit()
+
+    def resumable(self, config):
+        """Повертає сесію для продовження з налаштуваннями config або None.
+
+        Продовжується найновіша незавершена сесія з тими самими межами та
+        кількістю спроб, що й config (GameConfig). Решта незавершених сесій
+        записуються як вихід: інакше вони переходили б із знімка в знімок.
+        """
+        wanted = (config.min_number, config.max_number, config.max_attempts)
+        resume = None
+        for session_id in sorted(self.live, reverse=True):
+            session = self.live[session_id]
+            if resume is None and (session.min_number, session.max_number,
+                                   session.max_attempts) == wanted:
+                resume = session
+            else:
+                self.record_exit(session_id, session)
+        return resume
+
+    # === ФІКСАЦІЯ ТА ЗНІМКИ ===
+
+    def commit(self):
+        """Записує накопичену групу одним write() та одним fsync()"""
+        with self._io_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                snapshot_due = self._since_snapshot >= self.snapshot_records
+            if pending:
+                self._file.write(b''.join(pending))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self.commits += 1
+            if snapshot_due:
+                self._snapshot_locked()
+
+    def snapshot(self):
+        """Стискає стан незавершених сесій у знімок та починає новий журнал"""
+        self.commit()
+        with self._io_lock:
+            self._snapshot_locked()
+
+    def _snapshot_locked(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            states = [STATE.pack(session_id, *session.state())
+                      for session_id, session in self.live.items()]
+            next_session = self._next_session
+            self._since_snapshot = len(pending)
+        generation = self._generation + 1
+        _write_atomically(self.snapshot_path, HEADER.pack(SNAPSHOT_MAGIC, VERSION, generation,
+                                                          next_session) + b''.join(states))
+        self._file.close()
+        self._start_wal(generation, next_session)
+        self._generation = generation
+        self._file = open(self.wal_path, 'ab')
+        if pending:
+            self._file.write(b''.join(pending))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _sync_loop(self, interval):
+        while not self._closed.wait(interval):
+            self.commit()
+
+    def close(self):
+        """Фіксує залишок журналу та закриває файл"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._syncer:
+            self._syncer.join()
+        self.commit()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()